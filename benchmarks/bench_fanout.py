@@ -0,0 +1,71 @@
+"""Latency of concurrent fan-out against a local stand-in server.
+
+Compares connection pool and keep-alive settings of DWDClient by issuing
+many concurrent distinct requests and reporting latency percentiles.
+
+Run with ``uv run python benchmarks/bench_fanout.py``.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+
+from standin import encode, make_stations, serve
+
+from dwd_mcp.client import DWDClient
+
+CONFIGS: dict[str, dict[str, Any]] = {
+    "1 connection": {"max_connections": 1, "max_keepalive_connections": 1},
+    "10 connections": {"max_connections": 10, "max_keepalive_connections": 10},
+    "100 connections": {"max_connections": 100, "max_keepalive_connections": 20},
+    "100 connections, no keep-alive": {
+        "max_connections": 100,
+        "max_keepalive_connections": 0,
+    },
+}
+
+
+async def run(base_url: str, settings: dict[str, Any], fanout: int) -> list[float]:
+    """Issue ``fanout`` concurrent requests, return per-request latencies."""
+    latencies = []
+
+    async with DWDClient(base_url, cache_max_entries=0, **settings) as client:
+
+        async def one(i: int) -> None:
+            start = time.perf_counter()
+            await client._make_request("/stationOverviewExtended", {"stationIds": i})
+            latencies.append(time.perf_counter() - start)
+
+        # Warm up the pool before measuring
+        await asyncio.gather(*(one(-i) for i in range(1, 11)))
+        latencies.clear()
+        await asyncio.gather(*(one(i) for i in range(fanout)))
+
+    return latencies
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fanout", type=int, default=200)
+    parser.add_argument("--delay", type=float, default=0.02)
+    args = parser.parse_args()
+
+    body = encode(make_stations(20))
+    routes = {"/stationOverviewExtended": body}
+    async with serve(routes, delay=args.delay) as (base_url, standin):
+        print(f"fan-out {args.fanout}, upstream delay {args.delay * 1000:.0f} ms")
+        for name, settings in CONFIGS.items():
+            before = standin.connections
+            latencies = sorted(await run(base_url, settings, args.fanout))
+            p99 = latencies[int(len(latencies) * 0.99) - 1]
+            print(
+                f"{name:32} p50 {statistics.median(latencies) * 1000:7.1f} ms  "
+                f"p99 {p99 * 1000:7.1f} ms  "
+                f"connections {standin.connections - before}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+"""Throughput and memory of one HTTP server process serving many clients.
+
+Starts ``dwd-mcp`` with the streamable HTTP transport against a local
+stand-in upstream, connects a number of concurrent MCP sessions and keeps
+them open while every session calls ``get_current_warnings`` repeatedly.
+Reports tool calls per second, upstream requests and the server's resident
+memory per connected session. With ``--workers`` the server runs in
+multi-worker mode and the memory of all its processes is counted.
+
+Linux only, as the server's memory is read from ``/proc``.
+
+Run with ``uv run python benchmarks/bench_http_server.py``.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from contextlib import AsyncExitStack
+
+from mcp import ClientSession
+from mcp.client.streamable_http import streamable_http_client
+from standin import encode, make_warnings, serve
+
+
+def free_port() -> int:
+    """Return a local TCP port that is currently unused."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]  # type: ignore[no-any-return]
+
+
+def rss_kib(pid: int) -> int:
+    """Return the resident set size of a process and its children in KiB."""
+    total = 0
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                total += int(line.split()[1])
+    with open(f"/proc/{pid}/task/{pid}/children") as children:
+        for child in children.read().split():
+            total += rss_kib(int(child))
+    return total
+
+
+async def wait_for_port(port: int, timeout: float = 20.0) -> None:
+    """Wait until a local TCP port accepts connections."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+        else:
+            writer.close()
+            return
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--calls", type=int, default=20, help="Tool calls per client")
+    parser.add_argument("--warnings", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    body = encode({"warnings": make_warnings(args.warnings)})
+    async with serve({"/warnings_nowcast.json": body}) as (base_url, standin):
+        port = free_port()
+        env = {
+            **os.environ,
+            "DWD_MCP_BASE_URL": base_url,
+            "DWD_MCP_TRANSPORT": "http",
+            "DWD_MCP_HTTP_PORT": str(port),
+            "DWD_MCP_HTTP_WORKERS": str(args.workers),
+        }
+        server = subprocess.Popen(
+            [sys.executable, "-c", "from dwd_mcp import main; main()"],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            await wait_for_port(port)
+            url = f"http://127.0.0.1:{port}/mcp/"
+            idle = rss_kib(server.pid)
+
+            async with AsyncExitStack() as stack:
+                sessions = []
+                for _ in range(args.clients):
+                    read, write, _ = await stack.enter_async_context(
+                        streamable_http_client(url)
+                    )
+                    session = await stack.enter_async_context(
+                        ClientSession(read, write)
+                    )
+                    await session.initialize()
+                    sessions.append(session)
+                connected = rss_kib(server.pid)
+
+                async def calls(session: ClientSession) -> None:
+                    for _ in range(args.calls):
+                        await session.call_tool("get_current_warnings", {"severity": 4})
+
+                start = time.perf_counter()
+                await asyncio.gather(*(calls(s) for s in sessions))
+                elapsed = time.perf_counter() - start
+                loaded = rss_kib(server.pid)
+        finally:
+            server.terminate()
+            server.wait()
+
+    total = args.clients * args.calls
+    print(
+        f"{args.clients} sessions, {args.calls} calls each, "
+        f"{args.warnings} warnings, {args.workers} workers"
+    )
+    print(f"  tool calls/s          {total / elapsed:10.1f}")
+    print(f"  upstream requests     {standin.requests:10d}")
+    print(f"  idle server RSS       {idle / 1024:10.1f} MiB")
+    print(f"  RSS per session       {(connected - idle) / args.clients:10.1f} KiB")
+    print(f"  RSS after load        {loaded / 1024:10.1f} MiB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+"""Decoding throughput of the available JSON decoders.
+
+Decodes realistic nowcast warning and crowd report payloads with every
+installed decoder, relative to the previous ``response.json()`` approach of
+decoding the bytes to text before parsing.
+
+Run with ``uv run python benchmarks/bench_json_decoders.py``.
+"""
+
+import argparse
+import json
+import timeit
+
+from standin import encode, make_crowd_reports, make_warnings
+
+from dwd_mcp.decoders import get_json_decoder
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = {
+        "warnings": encode({"warnings": make_warnings(args.items)}),
+        "crowd reports": encode(make_crowd_reports(args.items)),
+    }
+    decoders = {"json via str": lambda raw: json.loads(raw.decode("utf-8"))}
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            decoders[name] = get_json_decoder(name)
+        except ImportError:
+            print(f"{name} not installed, skipping")
+
+    for payload_name, raw in payloads.items():
+        print(f"\n{payload_name}: {args.items} items, {len(raw) / 1e6:.1f} MB")
+        baseline = None
+        for name, decode in decoders.items():
+            seconds = min(
+                timeit.repeat(
+                    lambda decode=decode, raw=raw: decode(raw),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            baseline = baseline or seconds
+            print(
+                f"  {name:14} {seconds * 1000:7.2f} ms  "
+                f"{len(raw) / seconds / 1e6:7.1f} MB/s  "
+                f"{baseline / seconds:4.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
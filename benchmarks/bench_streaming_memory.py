@@ -0,0 +1,61 @@
+"""Peak memory of list parsing versus streaming parsing.
+
+Fetches a large station overview from a local stand-in server once through
+``get_weather_stations`` (whole document decoded, then validated) and once
+through ``iter_weather_stations`` (items decoded and validated one by one)
+and reports the peak traced allocation of each.
+
+Run with ``uv run python benchmarks/bench_streaming_memory.py``.
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+
+from standin import encode, make_stations, serve
+
+from dwd_mcp.client import DWDClient
+
+
+async def measure(func: Callable[[], Awaitable[int]]) -> tuple[int, float, int]:
+    """Run ``func`` and return its item count, duration and peak memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = await func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stations", type=int, default=50_000)
+    args = parser.parse_args()
+
+    body = encode({"stations": make_stations(args.stations)})
+    async with serve({"/stationOverviewExtended": body}) as (base_url, _):
+        async with DWDClient(base_url, cache_max_entries=0) as client:
+
+            async def as_list() -> int:
+                return len(await client.get_weather_stations())
+
+            async def streamed() -> int:
+                count = 0
+                async for _station in client.iter_weather_stations():
+                    count += 1
+                return count
+
+            print(f"document size {len(body) / 1e6:.1f} MB")
+            for name, func in (("list", as_list), ("streaming", streamed)):
+                count, elapsed, peak = await measure(func)
+                print(
+                    f"{name:10} {count} stations in {elapsed:6.2f} s, "
+                    f"peak {peak / 1e6:7.1f} MB"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
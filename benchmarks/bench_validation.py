@@ -0,0 +1,75 @@
+"""Throughput of bulk versus per-item model validation.
+
+Validates realistic warning, crowd report and station records with the
+previous per-item ``model_validate`` loop and with the client's bulk
+``TypeAdapter`` path.
+
+Run with ``uv run python benchmarks/bench_validation.py``.
+"""
+
+import argparse
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from standin import make_crowd_reports, make_stations, make_warnings
+
+from dwd_mcp.client import DWDClient
+from dwd_mcp.models import CrowdReport, StationData, StationInfo, WarningInfo
+
+
+def per_item(parse: Callable[[Any], Any]) -> Callable[[list[Any]], list[Any]]:
+    """Build the per-item validation loop used before bulk validation."""
+    return lambda items: [parse(item) for item in items]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = {
+        "warnings": (
+            make_warnings(args.items),
+            per_item(WarningInfo.model_validate),
+            DWDClient._parse_warnings,
+        ),
+        "crowd reports": (
+            make_crowd_reports(args.items),
+            per_item(CrowdReport.model_validate),
+            DWDClient._parse_crowd_reports,
+        ),
+        "stations": (
+            make_stations(args.items),
+            per_item(
+                lambda item: StationData(station=StationInfo.model_validate(item))
+            ),
+            DWDClient._parse_stations,
+        ),
+    }
+
+    print(f"{args.items} items per payload")
+    for name, (items, loop, bulk) in cases.items():
+        loop_s = min(
+            timeit.repeat(
+                lambda loop=loop, items=items: loop(items),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        bulk_s = min(
+            timeit.repeat(
+                lambda bulk=bulk, items=items: bulk(items),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(
+            f"{name:14} per-item {args.items / loop_s:9.0f}/s  "
+            f"bulk {args.items / bulk_s:9.0f}/s  {loop_s / bulk_s:4.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Minimal local stand-in for the DWD API used by the benchmarks.
+
+The server speaks just enough HTTP/1.1 (with keep-alive) to answer GET
+requests with canned JSON bodies, so benchmarks measure the client rather
+than the network or the real upstream.
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+Body = bytes | Callable[[str], bytes]
+
+
+class StandInServer:
+    """Serves canned JSON documents keyed by request path."""
+
+    def __init__(self, routes: dict[str, Body], delay: float = 0.0):
+        """Initialize the stand-in server.
+
+        Args:
+            routes: Response body, or a function of the raw request target
+                returning one, per path
+            delay: Artificial upstream latency in seconds per request
+        """
+        self.routes = routes
+        self.delay = delay
+        self.requests = 0
+        self.connections = 0
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve requests on one connection until the client closes it."""
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                target = head.split(b" ", 2)[1].decode()
+                path = target.split("?", 1)[0]
+                self.requests += 1
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+
+                body = self.routes.get(path)
+                if body is None:
+                    status, payload = "404 Not Found", b"{}"
+                else:
+                    status = "200 OK"
+                    payload = body(target) if callable(body) else body
+
+                writer.write(
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    "Connection: keep-alive\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@asynccontextmanager
+async def serve(routes: dict[str, Body], delay: float = 0.0) -> AsyncIterator[Any]:
+    """Run a stand-in server on a free local port.
+
+    Yields:
+        Tuple of the base URL and the StandInServer instance
+    """
+    standin = StandInServer(routes, delay)
+    server = await asyncio.start_server(standin.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        yield f"http://127.0.0.1:{port}", standin
+
+
+def make_warnings(count: int) -> list[dict[str, Any]]:
+    """Generate realistic nowcast warning records."""
+    return [
+        {
+            "warningId": f"WARN{i:06d}",
+            "level": i % 4 + 1,
+            "type": ("THUNDER", "RAIN", "WIND", "FROST")[i % 4],
+            "headline": f"Amtliche Warnung vor Gewitter ({i})",
+            "description": "Es treten Gewitter mit Starkregen und Sturmböen auf. " * 3,
+            "startTime": "2024-01-15T14:00:00Z",
+            "endTime": "2024-01-15T20:00:00Z",
+            "regions": [f"Kreis {i % 400}", ("Bayern", "Hessen", "Berlin")[i % 3]],
+        }
+        for i in range(count)
+    ]
+
+
+def make_crowd_reports(count: int) -> list[dict[str, Any]]:
+    """Generate realistic crowd report records."""
+    return [
+        {
+            "reportId": f"CR{i:06d}",
+            "lat": 47.3 + (i * 7919 % 7700) / 1000,
+            "lon": 5.9 + (i * 104729 % 9100) / 1000,
+            "weatherCondition": ("sunny", "rain", "snow", "fog")[i % 4],
+            "temperature": round(-5 + i % 35 + 0.5, 1),
+            "timestamp": "2024-01-15T12:30:00Z",
+            "userComment": "Leichter Regen seit einer Stunde" if i % 3 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def make_stations(count: int) -> list[dict[str, Any]]:
+    """Generate realistic station overview records."""
+    return [
+        {
+            "stationId": f"{10000 + i}",
+            "stationName": f"Station {i}",
+            "lat": 47.3 + (i * 7919 % 7700) / 1000,
+            "lon": 5.9 + (i * 104729 % 9100) / 1000,
+            "elevation": float(i % 1500),
+            "state": ("Bayern", "Hessen", "Berlin", "Sachsen")[i % 4],
+        }
+        for i in range(count)
+    ]
+
+
+def encode(document: Any) -> bytes:
+    """Encode a document the way the upstream does."""
+    return json.dumps(document, ensure_ascii=False).encode()
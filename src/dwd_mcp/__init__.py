@@ -2,11 +2,17 @@
 
 import asyncio
 
+from .config import ServerConfig
 from .server import main as server_main
+from .workers import serve_workers
 
 __version__ = "0.1.0"
 
 
 def main() -> None:
     """Entry point for the MCP server."""
-    asyncio.run(server_main())
+    config = ServerConfig.from_env()
+    if config.transport == "http" and config.http_workers > 1:
+        serve_workers(config)
+    else:
+        asyncio.run(server_main())
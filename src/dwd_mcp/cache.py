@@ -0,0 +1,237 @@
+"""In-memory response cache for the DWD API client."""
+
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+# Upstream feeds change at very different rates: nowcast warnings and crowd
+# reports are refreshed every few minutes, station metadata rarely.
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    "/warnings_nowcast.json": 60.0,
+    "/crowd_meldungen_overview_v2.json": 120.0,
+    "/stationOverviewExtended": 600.0,
+}
+
+
+@dataclass
+class CacheEntry:
+    """A cached upstream response.
+
+    Besides the decoded JSON body, an entry carries the validators needed for
+    conditional revalidation and the models parsed from the body, so a 304
+    response can reuse them without validating the payload again.
+    """
+
+    data: Any
+    stored_at: float
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    parsed: Any = None
+    # Wall-clock time the upstream last confirmed the data, for display
+    fetched_at: float = field(default_factory=time.time)
+    # Digest of the raw body, to recognize identical full responses
+    body_hash: bytes | None = None
+
+    def is_fresh(self, now: float) -> bool:
+        """Return True if the entry has not yet expired."""
+        return now < self.expires_at
+
+    def staleness(self, now: float) -> float:
+        """Return the seconds since the entry expired, zero while fresh."""
+        return max(0.0, now - self.expires_at)
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    revalidations: int = 0
+    stale_hits: int = 0
+    unchanged_bodies: int = 0
+
+
+class ResponseCache:
+    """TTL cache with LRU eviction, keyed on endpoint and query parameters."""
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = 60.0,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+        stale_while_revalidate: float = 0.0,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttls: Per-endpoint time-to-live in seconds. Endpoints not listed use
+                ``default_ttl``. A TTL of zero or less disables caching.
+            default_ttl: TTL for endpoints without an explicit entry
+            max_entries: Maximum number of cached responses before the least
+                recently used one is evicted
+            clock: Monotonic time source, injectable for tests
+            stale_while_revalidate: Seconds after expiry during which an
+                entry may still be served while it is refreshed
+        """
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.stale_while_revalidate = stale_while_revalidate
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict[str, Any] | None = None) -> CacheKey:
+        """Build a cache key that is independent of parameter order."""
+        items = (params or {}).items()
+        normalized = tuple(sorted((str(k), str(v)) for k, v in items if v is not None))
+        return (endpoint, normalized)
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Return the configured TTL for an endpoint."""
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, key: CacheKey) -> CacheEntry | None:
+        """Return a fresh entry for the key, counting a hit or a miss."""
+        entry = self._entries.get(key)
+        if entry is None or not entry.is_fresh(self.clock()):
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry
+
+    def get_stale(self, key: CacheKey) -> CacheEntry | None:
+        """Return an expired entry that is within the stale-while-revalidate window.
+
+        Callers serving such an entry are expected to refresh it. Entries
+        that are fresh or expired for longer than the window are not
+        returned.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        now = self.clock()
+        if entry.is_fresh(now) or entry.staleness(now) >= self.stale_while_revalidate:
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.stale_hits += 1
+        return entry
+
+    def peek(self, key: CacheKey) -> CacheEntry | None:
+        """Return the entry for the key even if it has expired.
+
+        Expired entries are kept until evicted so they can be revalidated.
+        Peeking does not affect the hit/miss counters or the LRU order.
+        """
+        return self._entries.get(key)
+
+    def put(
+        self,
+        key: CacheKey,
+        data: Any,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        age: float = 0.0,
+        body_hash: bytes | None = None,
+    ) -> CacheEntry | None:
+        """Store a response, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key from ``make_key``
+            data: Decoded response body
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+            age: Seconds since the response was fetched, for responses
+                restored from elsewhere
+            body_hash: Digest of the raw response body
+
+        Returns:
+            The stored entry, or None if caching is disabled for the endpoint
+        """
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0 or self.max_entries <= 0:
+            return None
+
+        now = self.clock() - age
+        entry = CacheEntry(
+            data=data,
+            stored_at=now,
+            expires_at=now + ttl,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=time.time() - age,
+            body_hash=body_hash,
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self.stats.evictions += 1
+            logger.debug(f"Evicted cache entry {evicted}")
+
+        return entry
+
+    def revalidated(self, key: CacheKey) -> CacheEntry | None:
+        """Mark an entry as confirmed unchanged by the upstream.
+
+        The entry keeps its data and parsed models and gets a new TTL.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        now = self.clock()
+        entry.stored_at = now
+        entry.expires_at = now + self.ttl_for(key[0])
+        entry.fetched_at = time.time()
+        self._entries.move_to_end(key)
+        self.stats.revalidations += 1
+        return entry
+
+    def unchanged(
+        self, key: CacheKey, etag: str | None = None, last_modified: str | None = None
+    ) -> CacheEntry | None:
+        """Mark an entry as downloaded again with an identical body.
+
+        Like ``revalidated``, the entry keeps its data and parsed models and
+        gets a new TTL, and it takes the validators of the new response.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        now = self.clock()
+        entry.stored_at = now
+        entry.expires_at = now + self.ttl_for(key[0])
+        entry.fetched_at = time.time()
+        entry.etag = etag
+        entry.last_modified = last_modified
+        self._entries.move_to_end(key)
+        self.stats.unchanged_bodies += 1
+        return entry
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
@@ -1,15 +1,102 @@
 """DWD API client for fetching weather data."""
 
+import asyncio
+import hashlib
+import json
 import logging
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from datetime import UTC, datetime
 from typing import Any
 
 import httpx
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
+from .cache import CacheKey, ResponseCache
+from .decoders import JSONDecoder, get_json_decoder
+from .feeds import (
+    CrowdReportSnapshot,
+    FeedSnapshot,
+    StationSnapshot,
+    WarningSnapshot,
+    next_generation,
+)
+from .indexes import (
+    BoundingBox,
+    CrowdReportGridIndex,
+    StationSpatialIndex,
+    intersect_bbox,
+    normalize_region,
+    warning_matches,
+)
 from .models import CrowdReport, StationData, StationInfo, WarningInfo
+from .persistence import DiskCache
+from .regions import StationStateIndex, UnknownRegionError, resolve_state
+from .resilience import NO_RETRY, CircuitBreaker, RetryPolicy, parse_retry_after
+from .shared import SharedSnapshot
+from .singleflight import SingleFlight
+from .streaming import iter_json_items
 
 logger = logging.getLogger(__name__)
 
+STATIONS_ENDPOINT = "/stationOverviewExtended"
+WARNINGS_ENDPOINT = "/warnings_nowcast.json"
+CROWD_REPORTS_ENDPOINT = "/crowd_meldungen_overview_v2.json"
+
+
+def body_hash(body: bytes) -> bytes:
+    """Return the digest identifying a raw response body."""
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+# Prebuilt adapters validate whole response lists in a single call
+_STATION_DATA_LIST = TypeAdapter(list[StationData])
+_STATION_INFO_LIST = TypeAdapter(list[StationInfo])
+_WARNING_LIST = TypeAdapter(list[WarningInfo])
+_CROWD_REPORT_LIST = TypeAdapter(list[CrowdReport])
+
+
+def _validate_each[T](
+    parse: Callable[[Any], T], items: Iterable[Any], kind: str
+) -> list[T]:
+    """Validate records one by one, skipping and logging invalid ones."""
+    results = []
+    for item in items:
+        try:
+            results.append(parse(item))
+        except ValidationError as e:
+            logger.warning(f"Failed to parse {kind} data: {e}")
+            continue
+    return results
+
+
+def _validate_list[T](
+    adapter: TypeAdapter[list[T]],
+    parse: Callable[[Any], T],
+    items: Any,
+    kind: str,
+) -> list[T]:
+    """Validate a list of records in bulk.
+
+    The whole list is validated with the adapter first. Only if that fails
+    are the records validated one by one to isolate the invalid ones.
+
+    Args:
+        adapter: Adapter validating the complete list
+        parse: Function validating a single record
+        items: Raw records
+        kind: Record description used in log messages
+
+    Returns:
+        Valid models in input order
+    """
+    if isinstance(items, list):
+        try:
+            return adapter.validate_python(items)
+        except ValidationError:
+            pass
+    return _validate_each(parse, items, kind)
+
 
 class DWDAPIError(Exception):
     """Base exception for DWD API errors."""
@@ -17,17 +104,145 @@ class DWDAPIError(Exception):
     pass
 
 
+class CircuitOpenError(DWDAPIError):
+    """Raised when an endpoint is failing and requests are not attempted."""
+
+    pass
+
+
+class PartialFetchError(DWDAPIError):
+    """Raised when only some chunks of a batched request could be fetched.
+
+    Attributes:
+        results: Models from the chunks that were fetched successfully
+        failed_ids: IDs from the chunks that could not be fetched
+    """
+
+    def __init__(self, message: str, results: list[Any], failed_ids: list[str]):
+        super().__init__(message)
+        self.results = results
+        self.failed_ids = failed_ids
+
+
 class DWDClient:
     """Client for interacting with the DWD API."""
 
-    def __init__(self, base_url: str = "https://dwd.api.bund.dev"):
+    def __init__(
+        self,
+        base_url: str = "https://dwd.api.bund.dev",
+        cache_ttls: dict[str, float] | None = None,
+        cache_max_entries: int = 256,
+        cache: ResponseCache | None = None,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        connect_timeout: float | None = 30.0,
+        read_timeout: float | None = 30.0,
+        pool_timeout: float | None = 30.0,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker_failure_threshold: int = 5,
+        breaker_reset_timeout: float = 30.0,
+        station_chunk_size: int = 50,
+        max_concurrent_chunks: int = 4,
+        station_cache_max_entries: int = 4096,
+        json_decoder: str | JSONDecoder = "auto",
+        stale_while_revalidate: float = 0.0,
+        disk_cache: DiskCache | None = None,
+        shared_snapshot: SharedSnapshot | None = None,
+    ):
         """Initialize the DWD client.
 
         Args:
             base_url: Base URL for the DWD API
+            cache_ttls: Per-endpoint response cache TTLs in seconds, overriding
+                the defaults. A TTL of zero disables caching for an endpoint.
+            cache_max_entries: Maximum number of cached responses
+            cache: Preconfigured response cache, takes precedence over
+                ``cache_ttls`` and ``cache_max_entries``
+            max_connections: Maximum number of open connections, None for no
+                limit
+            max_keepalive_connections: Maximum number of idle connections kept
+                open for reuse, None for no limit
+            keepalive_expiry: Seconds an idle connection is kept open
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait for response data
+            pool_timeout: Seconds to wait for a free connection from the pool
+            http2: Enable HTTP/2, requires the ``http2`` extra
+            transport: Custom HTTP transport, mainly for testing
+            retry_policy: Backoff policy for transient upstream failures
+            breaker_failure_threshold: Consecutive failed fetches after which
+                an endpoint's circuit opens
+            breaker_reset_timeout: Seconds an open circuit waits before
+                letting a trial request through
+            station_chunk_size: Maximum number of station IDs per request
+            max_concurrent_chunks: Maximum number of station chunks fetched
+                concurrently
+            station_cache_max_entries: Maximum number of individually cached
+                stations
+            json_decoder: Name of the JSON library used to decode response
+                bodies (see ``get_json_decoder``) or a decoding function
+            stale_while_revalidate: Seconds after expiry during which a
+                cached response is still served while one background request
+                refreshes it. Older responses are fetched before returning.
+            disk_cache: Store that keeps raw responses of requests without
+                query parameters across restarts
+            shared_snapshot: Feeds published by a leader process. Published
+                feeds are served from the snapshot instead of being fetched.
         """
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                read_timeout,
+                connect=connect_timeout,
+                read=read_timeout,
+                write=read_timeout,
+                pool=pool_timeout,
+            ),
+            http2=http2,
+            transport=transport,
+        )
+        if cache is None:
+            cache = ResponseCache(
+                ttls=cache_ttls,
+                max_entries=cache_max_entries,
+                stale_while_revalidate=stale_while_revalidate,
+            )
+        self.cache = cache
+        # Stations are additionally cached one by one, so overlapping station
+        # sets only fetch the stations that are not fresh yet
+        self.station_cache = ResponseCache(
+            ttls={STATIONS_ENDPOINT: cache.ttl_for(STATIONS_ENDPOINT)},
+            max_entries=station_cache_max_entries,
+            clock=cache.clock,
+        )
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker_failure_threshold = breaker_failure_threshold
+        self.breaker_reset_timeout = breaker_reset_timeout
+        self._breakers: dict[str, CircuitBreaker] = {}
+        if isinstance(json_decoder, str):
+            json_decoder = get_json_decoder(json_decoder)
+        self.json_decoder = json_decoder
+        self.station_chunk_size = station_chunk_size
+        self.max_concurrent_chunks = max_concurrent_chunks
+        self._inflight = SingleFlight()
+        # Endpoints kept current by a background poller; their cached
+        # responses are served even after they expire
+        self.polled_endpoints: set[str] = set()
+        self._background: set[asyncio.Future[Any]] = set()
+        self.disk_cache = disk_cache
+        self._disk_writes: set[asyncio.Future[None]] = set()
+        self.shared_snapshot = shared_snapshot
+        # Version and fetch time of the published feeds last adopted
+        self._shared_versions: dict[str, tuple[int, float]] = {}
+        # Current snapshot per feed, replaced whenever its response changes
+        self._snapshots: dict[str, FeedSnapshot[Any]] = {}
 
     async def __aenter__(self) -> "DWDClient":
         """Async context manager entry."""
@@ -35,17 +250,39 @@ class DWDClient:
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
-        await self.client.aclose()
+        await self.close()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Cancel background refreshes and close the HTTP client."""
+        for task in list(self._background):
+            task.cancel()
+        await asyncio.gather(*self._background, return_exceptions=True)
         await self.client.aclose()
+        if self.disk_cache is not None:
+            await asyncio.gather(*self._disk_writes)
+            self.disk_cache.close()
+        if self.shared_snapshot is not None:
+            self.shared_snapshot.close()
 
     async def _make_request(
         self, endpoint: str, params: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """Make an HTTP request to the DWD API.
 
+        Responses are served from the response cache while they are fresh.
+        Within the cache's stale-while-revalidate window after expiry they
+        are still served while one background request refreshes them; older
+        responses are fetched before returning. Expired entries that carry
+        an ETag or Last-Modified validator are revalidated with a conditional
+        request; a 304 response keeps the cached data and the models already
+        parsed from it, and so does a full response whose body hashes like
+        the cached one. Concurrent requests for the same endpoint and
+        parameters share one upstream fetch.
+
+        Transient failures are retried according to the retry policy. While
+        an endpoint's circuit is open, stale cached data is served if
+        available and the request fails fast otherwise.
+
         Args:
             endpoint: API endpoint path
             params: Query parameters
@@ -57,11 +294,271 @@ class DWDClient:
             DWDAPIError: If the request fails
         """
         url = f"{self.base_url}{endpoint}"
+        key = self.cache.make_key(endpoint, params)
+        if self.shared_snapshot is not None and not params:
+            self._adopt_shared(self.shared_snapshot, key)
+        # Only requests without parameters are kept on disk
+        if self.disk_cache is not None and not params and key not in self.cache:
+            self._restore(self.disk_cache, key)
 
+        entry = self.cache.get(key)
+        if entry is None and endpoint in self.polled_endpoints:
+            # A background poller keeps this entry current
+            entry = self.cache.peek(key)
+        if entry is None:
+            entry = self.cache.get_stale(key)
+            if entry is not None:
+                self._refresh_in_background(url, key, params)
+        if entry is not None:
+            return entry.data  # type: ignore[no-any-return]
+
+        data = await self._inflight.do(key, lambda: self._fetch(url, key, params))
+        return data  # type: ignore[no-any-return]
+
+    def _restore(self, disk_cache: DiskCache, key: CacheKey) -> None:
+        """Load a response stored on disk into the in-memory cache.
+
+        The entry keeps its original age, so it is served while still fresh
+        and revalidated with its validators otherwise.
+        """
+        stored = disk_cache.load(key)
+        if stored is None:
+            return
         try:
-            response = await self.client.get(url, params=params)
+            data = self.json_decoder(stored.body)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable stored response for {key[0]}: {e}")
+            return
+
+        logger.debug(f"Restored {key[0]} from disk, {stored.age():.0f}s old")
+        self.cache.put(
+            key,
+            data,
+            etag=stored.etag,
+            last_modified=stored.last_modified,
+            age=stored.age(),
+            body_hash=body_hash(stored.body),
+        )
+
+    def _adopt_shared(self, snapshot: SharedSnapshot, key: CacheKey) -> None:
+        """Cache a feed published by the leader if it is new or revalidated.
+
+        The published models become the feed's snapshot, so they are not
+        validated again; they also stand in for the response data, which is
+        not published. A revalidated feed only renews the cache entry and
+        keeps the snapshot. Once published, a feed is served from the
+        snapshot like a polled feed, as the leader keeps it current.
+        """
+        endpoint = key[0]
+        info = snapshot.info(endpoint)
+        if info is None:
+            return
+        adopted = self._shared_versions.get(endpoint)
+        entry = self.cache.peek(key)
+        if adopted is not None and adopted[0] == info.version and entry is not None:
+            if adopted[1] != info.fetched_at:
+                self.cache.put(
+                    key,
+                    entry.data,
+                    etag=info.etag,
+                    last_modified=info.last_modified,
+                    age=info.age(),
+                )
+                self._shared_versions[endpoint] = (info.version, info.fetched_at)
+            return
+
+        shared = snapshot.load(endpoint)
+        if shared is None or shared.models is None:
+            return
+        data = list(shared.models)
+        self.cache.put(
+            key,
+            data,
+            etag=shared.etag,
+            last_modified=shared.last_modified,
+            age=shared.age(),
+        )
+        snapshots: dict[str, Callable[[Any, Any], FeedSnapshot[Any] | None]] = {
+            WARNINGS_ENDPOINT: self._warning_snapshot,
+            CROWD_REPORTS_ENDPOINT: self._crowd_report_snapshot,
+            STATIONS_ENDPOINT: self._station_snapshot,
+        }
+        snapshots[endpoint](data, shared.models)
+        self._shared_versions[endpoint] = (shared.version, shared.fetched_at)
+        self.polled_endpoints.add(endpoint)
+
+    def reload(self, endpoint: str) -> bool:
+        """Load a response another process stored on disk if it is newer.
+
+        A newer response with the ETag of the cached one only updates the
+        fetch time, so the models parsed from it are kept.
+
+        Args:
+            endpoint: API endpoint path, stored without parameters
+
+        Returns:
+            True if the cached response was replaced or confirmed
+        """
+        if self.disk_cache is None:
+            return False
+        key = self.cache.make_key(endpoint)
+        info = self.disk_cache.info(key)
+        entry = self.cache.peek(key)
+        if info is None or (entry is not None and info[1] <= entry.fetched_at):
+            return False
+
+        etag, fetched_at = info
+        if entry is not None and etag is not None and etag == entry.etag:
+            self.cache.revalidated(key)
+            entry.fetched_at = fetched_at
+            return True
+        self._restore(self.disk_cache, key)
+        return key in self.cache
+
+    def _write_to_disk(self, func: Callable[..., None], *args: Any) -> None:
+        """Run a disk cache write in a worker thread without waiting for it."""
+        future = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        self._disk_writes.add(future)
+        future.add_done_callback(self._disk_writes.discard)
+
+    def _refresh_in_background(
+        self, url: str, key: CacheKey, params: dict[str, Any] | None
+    ) -> None:
+        """Start refreshing a stale cache entry unless a fetch is in flight."""
+        if key in self._inflight:
+            return
+
+        task = asyncio.ensure_future(
+            self._inflight.do(key, lambda: self._fetch(url, key, params))
+        )
+        self._background.add(task)
+        task.add_done_callback(self._background_done)
+
+    def _background_done(self, task: "asyncio.Future[Any]") -> None:
+        """Forget a finished background refresh, logging its failure."""
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background refresh failed: {task.exception()}")
+
+    async def fetch(self, endpoint: str, params: dict[str, Any] | None = None) -> Any:
+        """Return the response data of a request, cached like any other.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Response data as returned by the client's JSON decoder
+
+        Raises:
+            DWDAPIError: If the request fails
+        """
+        return await self._make_request(endpoint, params)
+
+    async def refresh(self, endpoint: str) -> None:
+        """Fetch an endpoint from the upstream even if it is cached.
+
+        The cached response is revalidated if it carries validators and
+        replaced otherwise. Requests for the endpoint that are already in
+        flight are joined instead.
+
+        Args:
+            endpoint: API endpoint path, fetched without parameters
+
+        Raises:
+            DWDAPIError: If the request fails
+        """
+        url = f"{self.base_url}{endpoint}"
+        key = self.cache.make_key(endpoint)
+        await self._inflight.do(key, lambda: self._fetch(url, key, None))
+
+    def fetched_at(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> datetime | None:
+        """Return when the cached response of a request was last fetched.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Time the upstream last confirmed the data, or None if not cached
+        """
+        entry = self.cache.peek(self.cache.make_key(endpoint, params))
+        if entry is None:
+            return None
+        return datetime.fromtimestamp(entry.fetched_at, UTC)
+
+    async def _fetch(
+        self, url: str, key: CacheKey, params: dict[str, Any] | None
+    ) -> Any:
+        """Fetch a document from the upstream and store it in the cache.
+
+        Args:
+            url: Absolute URL to fetch
+            key: Cache key of the request
+            params: Query parameters
+
+        Returns:
+            JSON response data
+
+        Raises:
+            DWDAPIError: If the request fails
+        """
+        stale = self.cache.peek(key)
+        breaker = self.circuit_breaker(key[0])
+        if not breaker.allow():
+            if stale is not None:
+                logger.warning(f"Circuit open for {key[0]}, serving stale data")
+                return stale.data
+            raise CircuitOpenError(f"Circuit open, not fetching {url}")
+
+        headers = {}
+        if stale is not None:
+            if stale.etag is not None:
+                headers["If-None-Match"] = stale.etag
+            if stale.last_modified is not None:
+                headers["If-Modified-Since"] = stale.last_modified
+
+        try:
+            try:
+                response = await self._get_with_retry(url, params, headers)
+            except BaseException:
+                breaker.record_failure()
+                raise
+
+            breaker.record_status(response.status_code)
+
+            if response.status_code == 304 and stale is not None:
+                logger.debug(f"{url} not modified, reusing cached response")
+                self.cache.revalidated(key)
+                if self.disk_cache is not None and not params:
+                    self._write_to_disk(self.disk_cache.touch, key)
+                return stale.data
+
             response.raise_for_status()
-            return response.json()  # type: ignore[no-any-return]
+            digest = body_hash(response.content)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if stale is not None and stale.body_hash == digest:
+                # Upstreams without validators often send identical bodies
+                logger.debug(f"{url} unchanged, reusing cached response")
+                validators = (stale.etag, stale.last_modified)
+                self.cache.unchanged(key, etag, last_modified)
+                if self.disk_cache is not None and not params:
+                    if validators == (etag, last_modified):
+                        self._write_to_disk(self.disk_cache.touch, key)
+                    else:
+                        self._write_to_disk(
+                            self.disk_cache.save,
+                            key,
+                            response.content,
+                            etag,
+                            last_modified,
+                        )
+                return stale.data
+
+            data = self.json_decoder(response.content)
         except httpx.HTTPError as e:
             logger.error(f"HTTP error fetching {url}: {e}")
             raise DWDAPIError(f"Failed to fetch data from {url}: {e}") from e
@@ -69,66 +566,532 @@ class DWDClient:
             logger.error(f"Unexpected error fetching {url}: {e}")
             raise DWDAPIError(f"Unexpected error fetching data: {e}") from e
 
+        self.cache.put(
+            key, data, etag=etag, last_modified=last_modified, body_hash=digest
+        )
+        if self.disk_cache is not None and not params:
+            self._write_to_disk(
+                self.disk_cache.save, key, response.content, etag, last_modified
+            )
+        return data
+
+    async def _get_with_retry(
+        self, url: str, params: dict[str, Any] | None, headers: dict[str, str]
+    ) -> httpx.Response:
+        """Send a GET request, retrying transient failures.
+
+        Connection errors, timeouts and the retry policy's status codes are
+        retried with backoff, honoring Retry-After. The last response is
+        returned once the attempts are exhausted, and responses marked with
+        the ``NO_RETRY`` extension are returned as they are.
+
+        Raises:
+            httpx.TransportError: If the final attempt fails to connect
+        """
+        retry = 0
+        while True:
+            try:
+                response = await self.client.get(url, params=params, headers=headers)
+            except httpx.TransportError as e:
+                delay = self.retry_policy.delay(retry)
+                if delay is None:
+                    raise
+                logger.warning(f"Retrying {url} in {delay:.2f}s after error: {e}")
+            else:
+                if (
+                    response.status_code not in self.retry_policy.retry_statuses
+                    or response.extensions.get(NO_RETRY)
+                ):
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                delay = self.retry_policy.delay(retry, retry_after)
+                if delay is None:
+                    return response
+                logger.warning(
+                    f"Retrying {url} in {delay:.2f}s after HTTP {response.status_code}"
+                )
+
+            await asyncio.sleep(delay)
+            retry += 1
+
+    def circuit_breaker(self, endpoint: str) -> CircuitBreaker:
+        """Return the circuit breaker guarding an endpoint."""
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=self.breaker_failure_threshold,
+                reset_timeout=self.breaker_reset_timeout,
+            )
+            self._breakers[endpoint] = breaker
+        return breaker
+
+    def _parse_cached[T](
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        data: Any,
+        parse: Callable[[Any], list[T]],
+    ) -> list[T]:
+        """Parse response data, reusing models parsed earlier from the same body.
+
+        Args:
+            endpoint: API endpoint path the data was fetched from
+            params: Query parameters the data was fetched with
+            data: Response data returned by ``_make_request``
+            parse: Function turning the response data into models
+
+        Returns:
+            Parsed models. The list is a copy and may be modified by the caller.
+        """
+        entry = self.cache.peek(self.cache.make_key(endpoint, params))
+        if entry is None or entry.data is not data:
+            return parse(data)
+
+        if entry.parsed is None:
+            entry.parsed = parse(data)
+        return list(entry.parsed)
+
+    def snapshot(self, endpoint: str) -> FeedSnapshot[Any] | None:
+        """Return the current snapshot of a feed.
+
+        Args:
+            endpoint: API endpoint path of the warnings, crowd reports or
+                station catalog feed
+
+        Returns:
+            The snapshot of the cached response, or None if the feed is not
+            cached or has not been parsed since it last changed
+        """
+        snapshot = self._snapshots.get(endpoint)
+        entry = self.cache.peek(self.cache.make_key(endpoint))
+        if snapshot is None or entry is None or entry.data is not snapshot.data:
+            return None
+        return snapshot
+
+    def _feed_snapshot[S: FeedSnapshot[Any]](
+        self,
+        kind: type[S],
+        endpoint: str,
+        data: Any,
+        create: Callable[[FeedSnapshot[Any] | None], S],
+    ) -> S | None:
+        """Return the snapshot of a cached feed response, creating it if new.
+
+        A new snapshot gets the next generation and replaces the previous
+        one, which stays valid for readers still holding it.
+
+        Args:
+            kind: Snapshot class of the feed
+            endpoint: API endpoint path the data was fetched without parameters
+            data: Response data returned by ``_make_request``
+            create: Function creating the snapshot from the previous one
+
+        Returns:
+            The snapshot, or None if the response body is not cached
+        """
+        current = self._snapshots.get(endpoint)
+        if isinstance(current, kind) and current.data is data:
+            return current
+        entry = self.cache.peek(self.cache.make_key(endpoint))
+        if entry is None or entry.data is not data:
+            return None
+
+        snapshot = create(current)
+        self._snapshots[endpoint] = snapshot
+        return snapshot
+
+    def _warning_snapshot(
+        self, data: Any, models: list[WarningInfo] | None = None
+    ) -> WarningSnapshot | None:
+        """Return the snapshot of a cached warnings response.
+
+        A new version of the feed is ingested incrementally against the
+        previous snapshot.
+
+        Args:
+            data: Response data returned by ``_make_request``
+            models: Models already parsed from the data, parsed if None
+        """
+
+        def create(current: FeedSnapshot[Any] | None) -> WarningSnapshot:
+            records: dict[str, tuple[Any, WarningInfo]] = {}
+            parsed = models
+            if parsed is None:
+                previous = current if isinstance(current, WarningSnapshot) else None
+                parsed, records = self._ingest_warnings(data, previous)
+            return WarningSnapshot(
+                endpoint=WARNINGS_ENDPOINT,
+                generation=next_generation(),
+                data=data,
+                models=tuple(parsed),
+                records=records,
+            )
+
+        return self._feed_snapshot(WarningSnapshot, WARNINGS_ENDPOINT, data, create)
+
+    def _crowd_report_snapshot(
+        self, data: Any, models: list[CrowdReport] | None = None
+    ) -> CrowdReportSnapshot | None:
+        """Return the snapshot of a cached crowd reports response.
+
+        Args:
+            data: Response data returned by ``_make_request``
+            models: Models already parsed from the data, parsed if None
+        """
+
+        def create(current: FeedSnapshot[Any] | None) -> CrowdReportSnapshot:
+            return CrowdReportSnapshot(
+                endpoint=CROWD_REPORTS_ENDPOINT,
+                generation=next_generation(),
+                data=data,
+                models=tuple(
+                    self._parse_crowd_reports(data) if models is None else models
+                ),
+            )
+
+        return self._feed_snapshot(
+            CrowdReportSnapshot, CROWD_REPORTS_ENDPOINT, data, create
+        )
+
+    def _station_snapshot(
+        self, data: Any, models: list[StationData] | None = None
+    ) -> StationSnapshot | None:
+        """Return the snapshot of a cached station catalog response.
+
+        Args:
+            data: Response data returned by ``_make_request``
+            models: Models already parsed from the data, parsed if None
+        """
+
+        def create(current: FeedSnapshot[Any] | None) -> StationSnapshot:
+            return StationSnapshot(
+                endpoint=STATIONS_ENDPOINT,
+                generation=next_generation(),
+                data=data,
+                models=tuple(self._parse_stations(data) if models is None else models),
+            )
+
+        return self._feed_snapshot(StationSnapshot, STATIONS_ENDPOINT, data, create)
+
+    async def find_nearest_stations(
+        self, lat: float, lon: float, k: int = 5, max_km: float | None = None
+    ) -> list[tuple[StationData, float]]:
+        """Find the weather stations closest to a location.
+
+        Uses the spatial index of the station catalog snapshot.
+
+        Args:
+            lat: Latitude in degrees
+            lon: Longitude in degrees
+            k: Maximum number of stations to return
+            max_km: Only return stations within this distance in kilometers
+
+        Returns:
+            Tuples of station and distance in kilometers, nearest first
+
+        Raises:
+            DWDAPIError: If the request fails
+        """
+        try:
+            data = await self._make_request(STATIONS_ENDPOINT)
+            snapshot = self._station_snapshot(data)
+            if snapshot is not None:
+                index = snapshot.spatial_index
+            else:
+                index = StationSpatialIndex(self._parse_stations(data))
+            return index.nearest(lat, lon, k=k, max_km=max_km)
+
+        except Exception as e:
+            logger.error(f"Error finding nearest stations: {e}")
+            raise DWDAPIError(f"Failed to find nearest stations: {e}") from e
+
     async def get_weather_stations(
         self, station_ids: list[str] | None = None, region: str | None = None
     ) -> list[StationData]:
         """Fetch weather station data.
 
+        Stations are cached individually. Only requested stations that are
+        not cached yet are fetched, and the result follows the order of
+        ``station_ids``. Long lists of missing stations are split into chunks
+        of ``station_chunk_size`` that are fetched concurrently.
+
+        A region is resolved to station IDs through an index of the station
+        catalog by federal state, and those stations are then served like
+        explicitly requested ones.
+
         Args:
             station_ids: List of specific station IDs to fetch
-            region: Region filter (implementation depends on API structure)
+            region: Federal state by name, code or alias, e.g. ``"Hessen"``,
+                ``"BY"`` or ``"Bavaria"``
 
         Returns:
             List of station data
 
         Raises:
+            UnknownRegionError: If the region is unknown
+            PartialFetchError: If some chunks failed; carries the stations
+                that were fetched and the IDs that were not
             DWDAPIError: If the request fails
         """
-        params = {}
-        if station_ids:
-            params["stationIds"] = ",".join(station_ids)
+        station_ids = station_ids or []
+        if region:
+            if resolve_state(region) is None:
+                raise UnknownRegionError(f"Unknown region: {region}")
+            in_region = await self._station_ids_in_region(region)
+            if station_ids:
+                allowed = set(in_region)
+                station_ids = [s for s in station_ids if s in allowed]
+            else:
+                station_ids = in_region
+            if not station_ids:
+                return []
+
+        cached, missing = self._cached_stations(station_ids)
+        if station_ids and not missing:
+            return cached
 
         try:
-            data = await self._make_request("/stationOverviewExtended", params)
-
-            # Handle different response formats
-            if isinstance(data, dict):
-                if "stations" in data:
-                    stations_data = data["stations"]
-                else:
-                    # Single station response
-                    stations_data = [data]
-            elif isinstance(data, list):
-                stations_data = data
+            if len(missing) > self.station_chunk_size:
+                fetched = await self._fetch_station_chunks(missing)
             else:
-                raise DWDAPIError(f"Unexpected response format: {type(data)}")
+                params = {}
+                if missing:
+                    params["stationIds"] = ",".join(missing)
 
-            stations = []
-            for station_data in stations_data:
                 try:
-                    # If the station_data is already a complete StationData object
-                    if "station" in station_data:
-                        station = StationData.model_validate(station_data)
-                    else:
-                        # If it's just station info, wrap it in StationData
-                        station_info = StationInfo.model_validate(station_data)
-                        station = StationData(station=station_info)
-                    stations.append(station)
-                except ValidationError as e:
-                    logger.warning(f"Failed to parse station data: {e}")
-                    continue
+                    fetched = await self._fetch_stations(params)
+
+                except Exception as e:
+                    logger.error(f"Error fetching weather stations: {e}")
+                    raise DWDAPIError(f"Failed to fetch weather stations: {e}") from e
+
+        except PartialFetchError as e:
+            e.results = self._in_request_order(station_ids, cached + e.results)
+            raise
 
+        if not station_ids:
+            return fetched
+        return self._in_request_order(station_ids, cached + fetched)
+
+    async def _station_ids_in_region(self, region: str) -> list[str]:
+        """Return the IDs of the catalog stations in a federal state.
+
+        The state index of the station catalog snapshot is used. Station
+        locations rarely change, so an expired catalog keeps answering
+        lookups and the catalog is only downloaded if it was never cached.
+
+        Raises:
+            DWDAPIError: If the station catalog cannot be fetched
+        """
+        entry = self.cache.peek(self.cache.make_key(STATIONS_ENDPOINT))
+        if entry is None:
+            stations = await self.get_weather_stations()
+            entry = self.cache.peek(self.cache.make_key(STATIONS_ENDPOINT))
+            if entry is None:
+                return StationStateIndex(stations).station_ids(region)
+
+        snapshot = self._station_snapshot(entry.data)
+        if snapshot is None:
+            stations = self._parse_stations(entry.data)
+            return StationStateIndex(stations).station_ids(region)
+        return snapshot.state_index.station_ids(region)
+
+    def _cached_stations(
+        self, station_ids: list[str]
+    ) -> tuple[list[StationData], list[str]]:
+        """Split station IDs into fresh cached stations and missing IDs.
+
+        Returns:
+            Tuple of cached stations and the IDs that need to be fetched
+        """
+        cached = []
+        missing = []
+        for station_id in dict.fromkeys(station_ids):
+            entry = self.station_cache.get(self._station_key(station_id))
+            if entry is None:
+                missing.append(station_id)
+            else:
+                cached.append(entry.data)
+        return cached, missing
+
+    def _store_stations(self, stations: list[StationData], age: float = 0.0) -> None:
+        """Cache stations individually by their station ID.
+
+        Args:
+            stations: Stations to cache
+            age: Seconds since the response of the stations was fetched
+        """
+        for station in stations:
+            key = self._station_key(station.station.station_id)
+            self.station_cache.put(key, station, age=age)
+
+    def stations_fetched_at(self, station_ids: list[str]) -> datetime | None:
+        """Return when the least recently fetched of some stations was fetched.
+
+        Args:
+            station_ids: IDs of stations cached by ``get_weather_stations``
+
+        Returns:
+            Fetch time of the oldest cached station, or None if none is cached
+        """
+        times = [
+            entry.fetched_at
+            for station_id in station_ids
+            if (entry := self.station_cache.peek(self._station_key(station_id)))
+        ]
+        if not times:
+            return None
+        return datetime.fromtimestamp(min(times), UTC)
+
+    @staticmethod
+    def _station_key(station_id: str) -> CacheKey:
+        """Return the per-station cache key for a station ID."""
+        return ResponseCache.make_key(STATIONS_ENDPOINT, {"stationId": station_id})
+
+    @staticmethod
+    def _in_request_order(
+        station_ids: list[str], stations: list[StationData]
+    ) -> list[StationData]:
+        """Sort stations by the position of their ID in the request.
+
+        Stations with IDs that were not requested are kept at the end.
+        """
+        position: dict[str, int] = {}
+        for index, station_id in enumerate(station_ids):
+            position.setdefault(station_id, index)
+        return sorted(
+            stations,
+            key=lambda s: position.get(s.station.station_id, len(station_ids)),
+        )
+
+    async def _fetch_stations(self, params: dict[str, Any]) -> list[StationData]:
+        """Fetch, parse and cache the stations of one station overview request."""
+        data = await self._make_request(STATIONS_ENDPOINT, params)
+        snapshot = None if params else self._station_snapshot(data)
+        if snapshot is not None:
+            stations = list(snapshot.models)
+        else:
+            stations = self._parse_cached(
+                STATIONS_ENDPOINT, params, data, self._parse_stations
+            )
+
+        # Stations are as old as the response they were fetched with
+        entry = self.cache.peek(self.cache.make_key(STATIONS_ENDPOINT, params))
+        age = 0.0
+        if entry is not None and entry.data is data:
+            age = max(0.0, time.time() - entry.fetched_at)
+        self._store_stations(stations, age)
+        return stations
+
+    async def _fetch_station_chunks(self, station_ids: list[str]) -> list[StationData]:
+        """Fetch a long list of stations in concurrent chunks.
+
+        Args:
+            station_ids: Station IDs to fetch
+
+        Returns:
+            Stations of all chunks, in the order the chunks were requested
+
+        Raises:
+            PartialFetchError: If some but not all chunks failed
+            DWDAPIError: If every chunk failed
+        """
+        size = self.station_chunk_size
+        chunks = [station_ids[i : i + size] for i in range(0, len(station_ids), size)]
+        semaphore = asyncio.Semaphore(self.max_concurrent_chunks)
+
+        async def fetch_chunk(chunk: list[str]) -> list[StationData]:
+            async with semaphore:
+                return await self._fetch_stations({"stationIds": ",".join(chunk)})
+
+        results = await asyncio.gather(
+            *(fetch_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
+
+        stations: list[StationData] = []
+        failed_ids: list[str] = []
+        errors: list[Exception] = []
+        for chunk, result in zip(chunks, results, strict=True):
+            if isinstance(result, Exception):
+                failed_ids.extend(chunk)
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                stations.extend(result)
+
+        if not errors:
             return stations
 
-        except Exception as e:
-            logger.error(f"Error fetching weather stations: {e}")
-            raise DWDAPIError(f"Failed to fetch weather stations: {e}") from e
+        logger.error(
+            f"Failed to fetch {len(errors)} of {len(chunks)} station chunks: "
+            f"{errors[0]}"
+        )
+        if len(errors) == len(chunks):
+            raise DWDAPIError(f"Failed to fetch weather stations: {errors[0]}")
+        raise PartialFetchError(
+            f"Failed to fetch {len(failed_ids)} of {len(station_ids)} stations: "
+            f"{errors[0]}",
+            results=stations,
+            failed_ids=failed_ids,
+        )
+
+    @staticmethod
+    def _parse_stations(data: Any) -> list[StationData]:
+        """Parse a station overview response into station data models."""
+        # Handle different response formats
+        if isinstance(data, dict):
+            if "stations" in data:
+                stations_data = data["stations"]
+            else:
+                # Single station response
+                stations_data = [data]
+        elif isinstance(data, list):
+            stations_data = data
+        else:
+            raise DWDAPIError(f"Unexpected response format: {type(data)}")
+
+        # Validate the whole list in one call when all records have the same
+        # shape, wrapping bare station info in StationData
+        if isinstance(stations_data, list) and all(
+            isinstance(item, dict) for item in stations_data
+        ):
+            with_station = sum("station" in item for item in stations_data)
+            try:
+                if with_station == len(stations_data):
+                    return _STATION_DATA_LIST.validate_python(stations_data)
+                if with_station == 0:
+                    infos = _STATION_INFO_LIST.validate_python(stations_data)
+                    return [StationData(station=info) for info in infos]
+            except ValidationError:
+                pass
+
+        return _validate_each(DWDClient._parse_station, stations_data, "station")
+
+    @staticmethod
+    def _parse_station(station_data: Any) -> StationData:
+        """Parse a single station record.
+
+        Raises:
+            ValidationError: If the record is not a valid station
+        """
+        # If the station_data is already a complete StationData object
+        if "station" in station_data:
+            return StationData.model_validate(station_data)
+        # If it's just station info, wrap it in StationData
+        station_info = StationInfo.model_validate(station_data)
+        return StationData(station=station_info)
 
     async def get_current_warnings(
         self, region: str | None = None, severity: int | None = None
     ) -> list[WarningInfo]:
         """Fetch current weather warnings.
 
+        Cached responses are queried through the region index of the feed
+        snapshot. Otherwise filters are applied to the raw records first
+        so that only warnings that can match are validated. Region names are
+        matched case-insensitively.
+
         Args:
             region: Region filter
             severity: Minimum severity level
@@ -140,70 +1103,341 @@ class DWDClient:
             DWDAPIError: If the request fails
         """
         try:
-            data = await self._make_request("/warnings_nowcast.json")
+            data = await self._make_request(WARNINGS_ENDPOINT)
 
-            warnings = []
-            if isinstance(data, dict) and "warnings" in data:
-                warnings_data = data["warnings"]
-            elif isinstance(data, list):
-                warnings_data = data
+            snapshot = self._warning_snapshot(data)
+            if snapshot is not None:
+                return snapshot.region_index.query(region, severity)
+
+            if region or severity is not None:
+                candidates = [
+                    record
+                    for record in self._warning_records(data)
+                    if self._may_match_warning(record, region, severity)
+                ]
+                warnings = _validate_list(
+                    _WARNING_LIST, WarningInfo.model_validate, candidates, "warning"
+                )
             else:
-                warnings_data = []
+                warnings = self._parse_warnings(data)
 
-            for warning_data in warnings_data:
-                try:
-                    warning = WarningInfo.model_validate(warning_data)
+            # Apply filters
+            return [w for w in warnings if warning_matches(w, region, severity)]
+
+        except Exception as e:
+            logger.error(f"Error fetching warnings: {e}")
+            raise DWDAPIError(f"Failed to fetch warnings: {e}") from e
+
+    @staticmethod
+    def _warning_records(data: Any) -> Any:
+        """Return the raw warning records of a nowcast warnings response."""
+        if isinstance(data, dict) and "warnings" in data:
+            return data["warnings"]
+        elif isinstance(data, list):
+            return data
+        else:
+            return []
+
+    @staticmethod
+    def _parse_warnings(data: Any) -> list[WarningInfo]:
+        """Parse a nowcast warnings response into warning models."""
+        return _validate_list(
+            _WARNING_LIST,
+            WarningInfo.model_validate,
+            DWDClient._warning_records(data),
+            "warning",
+        )
+
+    def _ingest_warnings(
+        self, data: Any, previous: WarningSnapshot | None
+    ) -> tuple[list[WarningInfo], dict[str, tuple[Any, WarningInfo]]]:
+        """Parse a warnings response, reusing the models of unchanged warnings.
+
+        Records are matched to the previous version of the feed by warning
+        ID. A record equal to the one the previous model was validated from
+        keeps that model; only new and changed records are validated.
+        Warnings that left the feed are dropped with the previous snapshot.
+
+        Args:
+            data: Nowcast warnings response
+            previous: Snapshot of the previous version of the feed
 
-                    # Apply filters
-                    if severity is not None and warning.level < severity:
-                        continue
-                    if region and region not in warning.regions:
-                        continue
+        Returns:
+            Models in feed order, and the raw record and model of each
+            warning by ID
+        """
+        records = self._warning_records(data)
+        if not isinstance(records, list):
+            return self._parse_warnings(data), {}
+
+        known = previous.records if previous is not None else {}
+        if not known:
+            try:
+                models = _WARNING_LIST.validate_python(records)
+            except ValidationError:
+                pass
+            else:
+                by_id = {
+                    m.warning_id: (r, m) for r, m in zip(records, models, strict=True)
+                }
+                return models, by_id
 
-                    warnings.append(warning)
+        models = []
+        by_id = {}
+        validated = 0
+        for record in records:
+            warning_id = record.get("warningId") if isinstance(record, dict) else None
+            match = known.get(warning_id) if isinstance(warning_id, str) else None
+            if match is not None and match[0] == record:
+                model = match[1]
+            else:
+                try:
+                    model = WarningInfo.model_validate(record)
                 except ValidationError as e:
                     logger.warning(f"Failed to parse warning data: {e}")
                     continue
+                validated += 1
+            models.append(model)
+            by_id[model.warning_id] = (record, model)
 
-            return warnings
+        logger.debug(
+            f"Ingested {len(models)} warnings, validated {validated} new or changed"
+        )
+        return models, by_id
 
-        except Exception as e:
-            logger.error(f"Error fetching warnings: {e}")
-            raise DWDAPIError(f"Failed to fetch warnings: {e}") from e
+    @staticmethod
+    def _may_match_warning(
+        record: Any, region: str | None, severity: int | None
+    ) -> bool:
+        """Check a raw warning record against the filters before validation.
 
-    async def get_crowd_reports(self, region: str | None = None) -> list[CrowdReport]:
+        Only records that would certainly be filtered out after validation
+        are rejected. Values whose validated form cannot be predicted without
+        validation, such as levels given as strings, are let through so the
+        filters on the validated model decide.
+        """
+        if not isinstance(record, dict):
+            return True
+
+        if severity is not None:
+            level = record.get("level")
+            if isinstance(level, int | float) and level < severity:
+                return False
+
+        if region:
+            regions = record.get("regions", [])
+            if isinstance(regions, list) and all(isinstance(r, str) for r in regions):
+                wanted = normalize_region(region)
+                if all(normalize_region(r) != wanted for r in regions):
+                    return False
+
+        return True
+
+    async def get_crowd_reports(
+        self,
+        region: str | None = None,
+        bbox: BoundingBox | None = None,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius_km: float | None = None,
+    ) -> list[CrowdReport]:
         """Fetch user-submitted weather reports.
 
+        Area filters are answered from the grid index of the feed snapshot.
+        All given filters must match.
+
         Args:
-            region: Region filter
+            region: Federal state by name, code or alias, approximated by
+                its bounding box, so reports from neighboring states near
+                the border, and from Berlin and Bremen within Brandenburg
+                and Niedersachsen, are included
+            bbox: Bounding box as (south, west, north, east) in degrees
+            lat: Latitude of the center of a radius filter
+            lon: Longitude of the center of a radius filter
+            radius_km: Radius around ``lat``/``lon`` in kilometers
 
         Returns:
             List of crowd-sourced weather reports
 
         Raises:
+            UnknownRegionError: If the region is unknown
+            ValueError: If the radius filter is incomplete
             DWDAPIError: If the request fails
         """
-        try:
-            data = await self._make_request("/crowd_meldungen_overview_v2.json")
+        area = bbox
+        if region:
+            state = resolve_state(region)
+            if state is None:
+                raise UnknownRegionError(f"Unknown region: {region}")
+            area = state.bbox if area is None else intersect_bbox(area, state.bbox)
 
-            reports = []
-            if isinstance(data, dict) and "reports" in data:
-                reports_data = data["reports"]
-            elif isinstance(data, list):
-                reports_data = data
-            else:
-                reports_data = []
+        center = None
+        if lat is not None or lon is not None or radius_km is not None:
+            if lat is None or lon is None or radius_km is None:
+                raise ValueError("lat, lon and radius_km must be given together")
+            center = (lat, lon)
 
-            for report_data in reports_data:
-                try:
-                    report = CrowdReport.model_validate(report_data)
-                    reports.append(report)
-                except ValidationError as e:
-                    logger.warning(f"Failed to parse crowd report data: {e}")
-                    continue
+        try:
+            data = await self._make_request(CROWD_REPORTS_ENDPOINT)
+            snapshot = self._crowd_report_snapshot(data)
+            if area is None and center is None:
+                if snapshot is not None:
+                    return list(snapshot.models)
+                return self._parse_crowd_reports(data)
 
-            return reports
+            if snapshot is not None:
+                index = snapshot.grid_index
+            else:
+                index = CrowdReportGridIndex(self._parse_crowd_reports(data))
+            return index.query(area, center, radius_km)
 
         except Exception as e:
             logger.error(f"Error fetching crowd reports: {e}")
             raise DWDAPIError(f"Failed to fetch crowd reports: {e}") from e
+
+    @staticmethod
+    def _parse_crowd_reports(data: Any) -> list[CrowdReport]:
+        """Parse a crowd reports response into report models."""
+        if isinstance(data, dict) and "reports" in data:
+            reports_data = data["reports"]
+        elif isinstance(data, list):
+            reports_data = data
+        else:
+            reports_data = []
+
+        return _validate_list(
+            _CROWD_REPORT_LIST, CrowdReport.model_validate, reports_data, "crowd report"
+        )
+
+    async def iter_weather_stations(
+        self, station_ids: list[str] | None = None
+    ) -> AsyncIterator[StationData]:
+        """Stream weather station data one station at a time.
+
+        Unlike ``get_weather_stations`` the response is parsed incrementally
+        and bypasses the caches, so memory use stays bounded by a single
+        station even for the full station overview.
+
+        Args:
+            station_ids: List of specific station IDs to fetch
+
+        Yields:
+            Station data in response order
+
+        Raises:
+            DWDAPIError: If the request fails
+        """
+        params = {}
+        if station_ids:
+            params["stationIds"] = ",".join(station_ids)
+
+        items = self._stream_items(
+            STATIONS_ENDPOINT, params, ("stations",), single_object=True
+        )
+        async for station_data in items:
+            try:
+                yield self._parse_station(station_data)
+            except ValidationError as e:
+                logger.warning(f"Failed to parse station data: {e}")
+
+    async def iter_current_warnings(
+        self, region: str | None = None, severity: int | None = None
+    ) -> AsyncIterator[WarningInfo]:
+        """Stream current weather warnings one warning at a time.
+
+        Args:
+            region: Region filter
+            severity: Minimum severity level
+
+        Yields:
+            Matching weather warnings in response order
+
+        Raises:
+            DWDAPIError: If the request fails
+        """
+        items = self._stream_items(WARNINGS_ENDPOINT, None, ("warnings",))
+        async for warning_data in items:
+            try:
+                warning = WarningInfo.model_validate(warning_data)
+            except ValidationError as e:
+                logger.warning(f"Failed to parse warning data: {e}")
+                continue
+
+            if warning_matches(warning, region, severity):
+                yield warning
+
+    async def iter_crowd_reports(
+        self, region: str | None = None
+    ) -> AsyncIterator[CrowdReport]:
+        """Stream user-submitted weather reports one report at a time.
+
+        Args:
+            region: Region filter
+
+        Yields:
+            Crowd-sourced weather reports in response order
+
+        Raises:
+            DWDAPIError: If the request fails
+        """
+        items = self._stream_items(CROWD_REPORTS_ENDPOINT, None, ("reports",))
+        async for report_data in items:
+            try:
+                yield CrowdReport.model_validate(report_data)
+            except ValidationError as e:
+                logger.warning(f"Failed to parse crowd report data: {e}")
+
+    async def _stream_items(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        item_keys: tuple[str, ...],
+        single_object: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Stream the raw items of a list document from the upstream.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            item_keys: Object keys that may hold the item array
+            single_object: Treat an object without item keys as one item
+
+        Yields:
+            Decoded JSON items
+
+        Raises:
+            DWDAPIError: If the request fails or the document is malformed
+        """
+        url = f"{self.base_url}{endpoint}"
+        breaker = self.circuit_breaker(endpoint)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open, not fetching {url}")
+
+        recorded = False
+        try:
+            async with self.client.stream("GET", url, params=params) as response:
+                breaker.record_status(response.status_code)
+                recorded = True
+                response.raise_for_status()
+
+                items = iter_json_items(
+                    response.aiter_bytes(), item_keys, single_object
+                )
+                async for item in items:
+                    yield item
+        except httpx.TransportError as e:
+            breaker.record_failure()
+            logger.error(f"HTTP error streaming {url}: {e}")
+            raise DWDAPIError(f"Failed to fetch data from {url}: {e}") from e
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP error streaming {url}: {e}")
+            raise DWDAPIError(f"Failed to fetch data from {url}: {e}") from e
+        except json.JSONDecodeError as e:
+            logger.error(f"Malformed response from {url}: {e}")
+            raise DWDAPIError(f"Malformed response from {url}: {e}") from e
+        except BaseException:
+            # A request cancelled before its status arrived must still end a
+            # half-open trial, or the circuit would never close again
+            if not recorded:
+                breaker.record_failure()
+            raise
@@ -0,0 +1,188 @@
+"""Server configuration loaded from environment variables."""
+
+import os
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from .client import DWDClient
+from .daemon import DaemonTransport
+from .persistence import DiskCache
+from .poller import CROWD_REPORTS_ENDPOINT, WARNINGS_ENDPOINT, FeedPoller, LeaderLock
+from .resilience import RetryPolicy
+
+ENV_PREFIX = "DWD_MCP_"
+
+
+def _env_bool(value: str) -> bool:
+    """Interpret an environment variable value as a boolean."""
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_limit(value: str) -> int | None:
+    """Interpret a connection limit, where "none" means unlimited."""
+    return None if value.strip().lower() == "none" else int(value)
+
+
+@dataclass
+class ServerConfig:
+    """Configuration of the MCP server and its DWD client.
+
+    Every field can be set through an environment variable named after the
+    field with the ``DWD_MCP_`` prefix, e.g. ``DWD_MCP_MAX_CONNECTIONS=50``.
+    """
+
+    base_url: str = "https://dwd.api.bund.dev"
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float = 5.0
+    connect_timeout: float = 30.0
+    read_timeout: float = 30.0
+    pool_timeout: float = 30.0
+    http2: bool = False
+    retry_attempts: int = 3
+    retry_max_delay: float = 10.0
+    breaker_failure_threshold: int = 5
+    breaker_reset_timeout: float = 30.0
+    station_chunk_size: int = 50
+    max_concurrent_chunks: int = 4
+    json_decoder: str = "auto"
+    poll_warnings_interval: float = 0.0
+    poll_crowd_reports_interval: float = 0.0
+    stale_while_revalidate: float = 0.0
+    cache_dir: str | None = None
+    fetch_daemon: bool = False
+    daemon_socket: str | None = None
+    transport: str = "stdio"
+    http_host: str = "127.0.0.1"
+    http_port: int = 8000
+    http_workers: int = 1
+    snapshot_interval: float = 5.0
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> "ServerConfig":
+        """Load the configuration from environment variables.
+
+        Args:
+            environ: Environment to read, defaults to ``os.environ``
+
+        Returns:
+            Configuration with defaults for unset variables
+
+        Raises:
+            ValueError: If a variable cannot be converted to the field type
+        """
+        env = os.environ if environ is None else environ
+        converters: dict[str, Callable[[str], object]] = {
+            "base_url": str,
+            "max_connections": _env_limit,
+            "max_keepalive_connections": _env_limit,
+            "keepalive_expiry": float,
+            "connect_timeout": float,
+            "read_timeout": float,
+            "pool_timeout": float,
+            "http2": _env_bool,
+            "retry_attempts": int,
+            "retry_max_delay": float,
+            "breaker_failure_threshold": int,
+            "breaker_reset_timeout": float,
+            "station_chunk_size": int,
+            "max_concurrent_chunks": int,
+            "json_decoder": str,
+            "poll_warnings_interval": float,
+            "poll_crowd_reports_interval": float,
+            "stale_while_revalidate": float,
+            "cache_dir": str,
+            "fetch_daemon": _env_bool,
+            "daemon_socket": str,
+            "transport": str,
+            "http_host": str,
+            "http_port": int,
+            "http_workers": int,
+            "snapshot_interval": float,
+        }
+
+        values = {}
+        for name, convert in converters.items():
+            raw = env.get(f"{ENV_PREFIX}{name.upper()}")
+            if raw is None or raw == "":
+                continue
+            try:
+                values[name] = convert(raw)
+            except ValueError as e:
+                raise ValueError(
+                    f"Invalid value for {ENV_PREFIX}{name.upper()}: {raw!r}"
+                ) from e
+
+        return cls(**values)  # type: ignore[arg-type]
+
+    def create_client(self, **overrides: Any) -> DWDClient:
+        """Create a DWD client using this configuration.
+
+        Args:
+            overrides: ``DWDClient`` arguments taking precedence over the
+                configuration
+        """
+        transport = None
+        if self.fetch_daemon:
+            # A custom transport replaces the client's own connection pool,
+            # so direct requests get a pool configured the same way
+            direct = httpx.AsyncHTTPTransport(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+            )
+            transport = DaemonTransport(
+                self.daemon_socket, base_url=self.base_url, fallback=direct
+            )
+
+        arguments: dict[str, Any] = {
+            "base_url": self.base_url,
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "keepalive_expiry": self.keepalive_expiry,
+            "connect_timeout": self.connect_timeout,
+            "read_timeout": self.read_timeout,
+            "pool_timeout": self.pool_timeout,
+            "http2": self.http2,
+            "transport": transport,
+            "retry_policy": RetryPolicy(
+                max_attempts=self.retry_attempts, max_delay=self.retry_max_delay
+            ),
+            "breaker_failure_threshold": self.breaker_failure_threshold,
+            "breaker_reset_timeout": self.breaker_reset_timeout,
+            "station_chunk_size": self.station_chunk_size,
+            "max_concurrent_chunks": self.max_concurrent_chunks,
+            "json_decoder": self.json_decoder,
+            "stale_while_revalidate": self.stale_while_revalidate,
+            "disk_cache": DiskCache(self.cache_dir) if self.cache_dir else None,
+        }
+        return DWDClient(**{**arguments, **overrides})
+
+    def create_poller(self, client: DWDClient) -> FeedPoller | None:
+        """Create a background poller for the client.
+
+        With a cache directory, the processes sharing it elect one of them
+        to poll the upstream, and the others load its responses from disk.
+
+        Returns:
+            The poller, or None if no feed has a polling interval
+        """
+        leader_lock = None
+        if self.cache_dir and client.disk_cache is not None:
+            leader_lock = LeaderLock(Path(self.cache_dir) / "poller.lock")
+        poller = FeedPoller(
+            client,
+            {
+                WARNINGS_ENDPOINT: self.poll_warnings_interval,
+                CROWD_REPORTS_ENDPOINT: self.poll_crowd_reports_interval,
+            },
+            leader_lock,
+        )
+        return poller if poller.intervals else None
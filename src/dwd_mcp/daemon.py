@@ -0,0 +1,420 @@
+"""Shared fetch daemon serving upstream responses over a Unix socket.
+
+Every MCP client launches its own server process. A single daemon per user
+fetches and caches upstream responses for all of them, so the processes
+share one cache and one set of upstream connections. Processes reach the
+daemon through ``DaemonTransport``, which starts the daemon on first use and
+fetches directly whenever the daemon is unavailable.
+"""
+
+import argparse
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from .client import DWDAPIError, DWDClient, body_hash
+from .resilience import NO_RETRY
+
+logger = logging.getLogger(__name__)
+
+
+def default_socket_path() -> Path:
+    """Return the per-user socket path of the fetch daemon.
+
+    Without a runtime directory the socket goes into a private directory
+    below the shared temporary directory, where other users cannot create
+    files in its place.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / f"dwd-mcp-{os.getuid()}.sock"
+    return Path(tempfile.gettempdir()) / f"dwd-mcp-{os.getuid()}" / "fetch.sock"
+
+
+def _peer_uid(writer: asyncio.StreamWriter, socket_path: Path) -> int:
+    """Return the user ID of the process at the other end of a connection."""
+    sock = writer.get_extra_info("socket")
+    if hasattr(socket, "SO_PEERCRED"):
+        credentials = sock.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+        )
+        _, uid, _ = struct.unpack("3i", credentials)
+        return uid  # type: ignore[no-any-return]
+    return os.stat(socket_path).st_uid
+
+
+async def _read_message(reader: asyncio.StreamReader) -> dict[str, Any] | None:
+    """Read one JSON message line, returning None at the end of the stream."""
+    line = await reader.readline()
+    if not line:
+        return None
+    return json.loads(line)  # type: ignore[no-any-return]
+
+
+def _encode_message(message: dict[str, Any]) -> bytes:
+    """Encode a message as one JSON line."""
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+class FetchDaemon:
+    """Serves cached upstream responses to local processes.
+
+    Requests are answered by a ``DWDClient`` that keeps raw response bodies,
+    so responses are passed on without being decoded and encoded again.
+    Bodies without an upstream ETag get one derived from their content,
+    which lets processes revalidate their own copies against the daemon.
+
+    Each request is one JSON line with the ``path``, the query ``params``
+    and an optional ``etag``. The reply is a JSON line with the ``status``,
+    response ``headers`` and body ``length``, followed by the body bytes.
+    Failed fetches are replied with the upstream's error status, or 502 if
+    there was no response; the daemon's client has retried them already.
+    """
+
+    def __init__(
+        self, client: DWDClient, socket_path: str | Path, idle_timeout: float = 300.0
+    ):
+        """Initialize the daemon.
+
+        Args:
+            client: Client fetching from the upstream, created with
+                ``json_decoder=bytes`` so it caches raw bodies
+            socket_path: Path of the Unix socket to listen on
+            idle_timeout: Seconds without requests after which the daemon
+                exits, zero or less to run until cancelled
+        """
+        self.client = client
+        self.socket_path = Path(socket_path)
+        self.idle_timeout = idle_timeout
+        self.requests = 0
+        self._last_active = time.monotonic()
+        self._active = 0
+
+    async def serve(self) -> None:
+        """Listen until the daemon has been idle for ``idle_timeout``.
+
+        Returns immediately if another daemon already serves the socket, or
+        if the socket's directory belongs to another user.
+        """
+        directory = self.socket_path.parent
+        directory.mkdir(mode=0o700, exist_ok=True)
+        if os.stat(directory).st_uid not in (os.getuid(), 0):
+            logger.warning(f"Not serving in {directory}, owned by another user")
+            return
+
+        lock_path = self.socket_path.with_name(self.socket_path.name + ".lock")
+        lock_file = os.fdopen(
+            os.open(lock_path, os.O_WRONLY | os.O_CREAT | os.O_NOFOLLOW, 0o600), "w"
+        )
+        try:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                logger.info(f"Another fetch daemon serves {self.socket_path}")
+                return
+
+            # Holding the lock, any existing socket file is left over
+            self.socket_path.unlink(missing_ok=True)
+            server = await asyncio.start_unix_server(
+                self._handle, path=str(self.socket_path)
+            )
+            logger.info(f"Fetch daemon listening on {self.socket_path}")
+            try:
+                async with server:
+                    await self._wait_until_idle()
+            finally:
+                self.socket_path.unlink(missing_ok=True)
+        finally:
+            lock_file.close()
+
+    async def _wait_until_idle(self) -> None:
+        """Return once no request has been served for ``idle_timeout``."""
+        if self.idle_timeout <= 0:
+            await asyncio.Event().wait()
+        while True:
+            idle = time.monotonic() - self._last_active
+            if not self._active and idle >= self.idle_timeout:
+                logger.info("Fetch daemon idle, exiting")
+                return
+            await asyncio.sleep(max(self.idle_timeout - idle, 0.05))
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the requests of one connection."""
+        try:
+            while (request := await _read_message(reader)) is not None:
+                self._active += 1
+                try:
+                    header, body = await self.respond(request)
+                finally:
+                    self._active -= 1
+                    self._last_active = time.monotonic()
+                writer.write(_encode_message({**header, "length": len(body)}) + body)
+                await writer.drain()
+        except (ConnectionError, json.JSONDecodeError) as e:
+            logger.debug(f"Dropping daemon connection: {e}")
+        finally:
+            writer.close()
+
+    async def respond(self, request: dict[str, Any]) -> tuple[dict[str, Any], bytes]:
+        """Fetch the response for one request.
+
+        Returns:
+            Reply header and body
+        """
+        self.requests += 1
+        endpoint = request["endpoint"]
+        params = request.get("params") or None
+        try:
+            body = await self.client.fetch(endpoint, params)
+        except DWDAPIError as e:
+            status = 502
+            if isinstance(e.__cause__, httpx.HTTPStatusError):
+                status = e.__cause__.response.status_code
+            return {"status": status, "headers": {}, "error": str(e)}, b""
+        if not isinstance(body, bytes):
+            raise TypeError("The daemon's client must keep raw response bodies")
+
+        entry = self.client.cache.peek(self.client.cache.make_key(endpoint, params))
+        headers = {}
+        if entry is not None and entry.data is body:
+            etag = entry.etag
+            if etag is None:
+                digest = entry.body_hash or body_hash(body)
+                etag = f'"{digest.hex()}"'
+            headers["ETag"] = etag
+            if entry.last_modified is not None:
+                headers["Last-Modified"] = entry.last_modified
+            if request.get("etag") == etag:
+                return {"status": 304, "headers": headers}, b""
+        return {"status": 200, "headers": headers}, body
+
+
+class DaemonTransport(httpx.AsyncBaseTransport):
+    """HTTP transport that fetches through the shared fetch daemon.
+
+    If no daemon is listening one is started in the background. While the
+    daemon cannot be reached, requests are sent directly to the upstream,
+    and starting it is not tried again for ``retry_interval`` seconds.
+    Requests are forwarded by their endpoint relative to ``base_url``, which
+    the daemon resolves against its own base URL; requests outside of it
+    are sent directly. Replies of the daemon are marked with the
+    ``NO_RETRY`` extension, since the daemon has retried failed fetches
+    itself. A socket served by another user's process is never trusted.
+    """
+
+    def __init__(
+        self,
+        socket_path: str | Path | None = None,
+        base_url: str = "https://dwd.api.bund.dev",
+        spawn: bool = True,
+        spawn_timeout: float = 5.0,
+        retry_interval: float = 30.0,
+        fallback: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            socket_path: Socket of the daemon, defaults to
+                ``default_socket_path()``
+            base_url: Base URL of the requests, as configured for the client
+            spawn: Start a daemon if none is listening
+            spawn_timeout: Seconds to wait for a started daemon to listen
+            retry_interval: Seconds to fetch directly after the daemon could
+                not be reached
+            fallback: Transport for direct requests
+        """
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.base_path = httpx.URL(base_url).path.rstrip("/")
+        self.spawn = spawn
+        self.spawn_timeout = spawn_timeout
+        self.retry_interval = retry_interval
+        self.fallback = fallback or httpx.AsyncHTTPTransport()
+        self.process: subprocess.Popen[bytes] | None = None
+        self._unavailable_until = 0.0
+        self._spawn_lock = asyncio.Lock()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request through the daemon, or directly as a fallback."""
+        endpoint = self._endpoint(request)
+        if (
+            request.method == "GET"
+            and endpoint is not None
+            and time.monotonic() >= self._unavailable_until
+        ):
+            try:
+                return await self._via_daemon(request, endpoint)
+            except OSError as e:
+                logger.warning(f"Fetch daemon unavailable, fetching directly: {e}")
+                self._unavailable_until = time.monotonic() + self.retry_interval
+        return await self.fallback.handle_async_request(request)
+
+    def _endpoint(self, request: httpx.Request) -> str | None:
+        """Return the endpoint of a request, or None if outside the base URL."""
+        path = request.url.path
+        if not path.startswith(f"{self.base_path}/"):
+            return None
+        return path[len(self.base_path) :]
+
+    async def _via_daemon(
+        self, request: httpx.Request, endpoint: str
+    ) -> httpx.Response:
+        """Forward a request to the daemon, starting it if necessary.
+
+        Raises:
+            OSError: If the daemon cannot be reached or does not reply in time
+        """
+        reader, writer = await self._connect()
+        # Without a reply within the read timeout the request is sent directly
+        timeout = request.extensions.get("timeout", {}).get("read")
+        try:
+            async with asyncio.timeout(timeout):
+                return await self._exchange(request, endpoint, reader, writer)
+        finally:
+            writer.close()
+
+    async def _exchange(
+        self,
+        request: httpx.Request,
+        endpoint: str,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> httpx.Response:
+        """Send one request over a daemon connection and read the reply."""
+        try:
+            message = {
+                "endpoint": endpoint,
+                "params": dict(request.url.params),
+                "etag": request.headers.get("If-None-Match"),
+            }
+            writer.write(_encode_message(message))
+            await writer.drain()
+
+            header = await _read_message(reader)
+            if header is None:
+                raise ConnectionResetError("Fetch daemon closed the connection")
+            body = await reader.readexactly(header["length"])
+        except asyncio.IncompleteReadError as e:
+            raise ConnectionResetError("Fetch daemon closed the connection") from e
+
+        return httpx.Response(
+            header["status"],
+            headers=header["headers"],
+            content=body,
+            request=request,
+            extensions={NO_RETRY: True},
+        )
+
+    async def _open(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Open a connection to the daemon if it runs as the current user.
+
+        Raises:
+            PermissionError: If the socket is served by another user
+        """
+        reader, writer = await asyncio.open_unix_connection(str(self.socket_path))
+        try:
+            uid = _peer_uid(writer, self.socket_path)
+        except OSError:
+            writer.close()
+            raise
+        if uid != os.getuid():
+            writer.close()
+            raise PermissionError(
+                f"Fetch daemon socket {self.socket_path} is served by user {uid}"
+            )
+        return reader, writer
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Open a connection to the daemon, starting it if none is listening."""
+        try:
+            return await self._open()
+        except (FileNotFoundError, ConnectionRefusedError):
+            if not self.spawn:
+                raise
+
+        async with self._spawn_lock:
+            try:
+                return await self._open()
+            except (FileNotFoundError, ConnectionRefusedError):
+                pass
+
+            logger.info(f"Starting fetch daemon on {self.socket_path}")
+            self.process = spawn_daemon(self.socket_path)
+            deadline = time.monotonic() + self.spawn_timeout
+            while True:
+                try:
+                    return await self._open()
+                except (FileNotFoundError, ConnectionRefusedError):
+                    if time.monotonic() >= deadline:
+                        raise
+                    await asyncio.sleep(0.05)
+
+    async def aclose(self) -> None:
+        """Close the fallback transport."""
+        await self.fallback.aclose()
+
+
+def spawn_daemon(socket_path: str | Path) -> subprocess.Popen[bytes]:
+    """Start a detached fetch daemon process.
+
+    The daemon inherits the environment, and with it the configuration, of
+    the calling process. A thread waits for the process, so a daemon exiting
+    when idle does not remain a zombie while the caller runs.
+    """
+    process = subprocess.Popen(
+        [sys.executable, "-m", "dwd_mcp.daemon", "--socket", str(socket_path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    threading.Thread(target=process.wait, daemon=True).start()
+    return process
+
+
+async def run_daemon(socket_path: str | Path, idle_timeout: float) -> None:
+    """Run a fetch daemon configured from the environment."""
+    from .config import ServerConfig
+
+    # The daemon itself must fetch directly
+    config = replace(ServerConfig.from_env(), fetch_daemon=False)
+    client = config.create_client(json_decoder=bytes)
+    try:
+        await FetchDaemon(client, socket_path, idle_timeout).serve()
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    """Entry point of the fetch daemon."""
+    parser = argparse.ArgumentParser(description="Shared DWD fetch daemon")
+    parser.add_argument("--socket", default=str(default_socket_path()))
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=300.0,
+        help="Seconds without requests before exiting (0 to run forever)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run_daemon(args.socket, args.idle_timeout))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""JSON decoders for upstream response bodies."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+JSONDecoder = Callable[[bytes], Any]
+
+# Tried in order when the decoder is selected automatically
+FAST_DECODERS = ("orjson", "msgspec")
+
+
+def _load_decoder(name: str) -> JSONDecoder:
+    """Import and return the decoding function of a JSON library.
+
+    Raises:
+        ImportError: If the library is not installed
+        ValueError: If the name is not a known decoder
+    """
+    if name == "orjson":
+        import orjson
+
+        return orjson.loads  # type: ignore[no-any-return]
+    if name == "msgspec":
+        import msgspec
+
+        return msgspec.json.Decoder().decode  # type: ignore[no-any-return]
+    if name == "json":
+        return json.loads
+    raise ValueError(f"Unknown JSON decoder: {name!r}")
+
+
+def get_json_decoder(name: str = "auto") -> JSONDecoder:
+    """Return a function decoding JSON directly from raw bytes.
+
+    Args:
+        name: ``"orjson"``, ``"msgspec"``, ``"json"`` for the standard
+            library, or ``"auto"`` for the fastest installed one
+
+    Returns:
+        Function turning a UTF-8 JSON document into Python objects
+
+    Raises:
+        ImportError: If the requested library is not installed
+        ValueError: If the name is not a known decoder
+    """
+    if name != "auto":
+        return _load_decoder(name)
+
+    for candidate in FAST_DECODERS:
+        try:
+            return _load_decoder(candidate)
+        except ImportError:
+            continue
+    return json.loads
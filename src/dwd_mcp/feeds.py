@@ -0,0 +1,84 @@
+"""Immutable snapshots of the parsed feeds and their indexes."""
+
+import itertools
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+
+from .indexes import CrowdReportGridIndex, StationSpatialIndex, WarningRegionIndex
+from .models import CrowdReport, StationData, WarningInfo
+from .regions import StationStateIndex
+
+# Generations are unique across clients, so caches outliving a client never
+# confuse its snapshots with those of the next one
+_generations = itertools.count(1)
+
+
+def next_generation() -> int:
+    """Return a generation number higher than all previous ones."""
+    return next(_generations)
+
+
+@dataclass(frozen=True)
+class FeedSnapshot[T]:
+    """One version of a feed: its models and the indexes derived from them.
+
+    A snapshot is never modified once created. New response data gets a new
+    snapshot with the next generation, which replaces the previous one in a
+    single assignment, so readers need no locks and anything computed from
+    a feed can be cached under its generation. Indexes are built on first
+    use and kept with the snapshot.
+
+    Attributes:
+        endpoint: API endpoint path of the feed
+        generation: Number of the version, increasing with every new body
+        data: Response data the models were parsed from
+        models: Parsed models in feed order
+    """
+
+    endpoint: str
+    generation: int
+    data: Any = field(repr=False, compare=False)
+    models: tuple[T, ...] = field(repr=False, compare=False)
+
+
+@dataclass(frozen=True)
+class WarningSnapshot(FeedSnapshot[WarningInfo]):
+    """Snapshot of the nowcast warnings feed.
+
+    Attributes:
+        records: Raw record and model of each warning by ID, so the next
+            version of the feed only validates new and changed warnings
+    """
+
+    records: dict[str, tuple[Any, WarningInfo]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @cached_property
+    def region_index(self) -> WarningRegionIndex:
+        """Index of the warnings by region."""
+        return WarningRegionIndex(list(self.models))
+
+
+class CrowdReportSnapshot(FeedSnapshot[CrowdReport]):
+    """Snapshot of the crowd reports feed."""
+
+    @cached_property
+    def grid_index(self) -> CrowdReportGridIndex:
+        """Index of the reports by location."""
+        return CrowdReportGridIndex(list(self.models))
+
+
+class StationSnapshot(FeedSnapshot[StationData]):
+    """Snapshot of the station catalog."""
+
+    @cached_property
+    def spatial_index(self) -> StationSpatialIndex:
+        """Index of the stations by location."""
+        return StationSpatialIndex(list(self.models))
+
+    @cached_property
+    def state_index(self) -> StationStateIndex:
+        """Index of the stations by federal state."""
+        return StationStateIndex(list(self.models))
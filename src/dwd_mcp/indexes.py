@@ -0,0 +1,384 @@
+"""Lookup indexes built over parsed upstream snapshots."""
+
+import heapq
+import math
+import unicodedata
+from bisect import bisect_right
+from collections.abc import Sequence
+from typing import Any
+
+from .models import CrowdReport, StationData, WarningInfo
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised without numpy installed
+    np = None
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Area as (south, west, north, east) in degrees
+BoundingBox = tuple[float, float, float, float]
+
+
+def normalize_region(name: str) -> str:
+    """Normalize a region name for case- and whitespace-insensitive lookup."""
+    return unicodedata.normalize("NFC", name).strip().casefold()
+
+
+def warning_matches(
+    warning: WarningInfo, region: str | None, severity: int | None
+) -> bool:
+    """Return True if a warning passes the region and severity filters."""
+    if severity is not None and warning.level < severity:
+        return False
+    if region:
+        wanted = normalize_region(region)
+        return any(normalize_region(r) == wanted for r in warning.regions)
+    return True
+
+
+class WarningRegionIndex:
+    """Inverted index from normalized region names to warnings.
+
+    Every bucket is sorted by descending level, so a severity filter only
+    touches the matching prefix of a bucket. Results are returned in the
+    order of the original warning list.
+    """
+
+    def __init__(self, warnings: list[WarningInfo]):
+        """Build the index.
+
+        Args:
+            warnings: Warnings of one snapshot, in feed order
+        """
+        self.warnings = warnings
+        buckets: dict[str, list[tuple[int, int]]] = {}
+        for position, warning in enumerate(warnings):
+            for region in {normalize_region(r) for r in warning.regions}:
+                buckets.setdefault(region, []).append((-warning.level, position))
+
+        everything = [(-w.level, position) for position, w in enumerate(warnings)]
+        self._all = self._sorted(everything)
+        self._buckets = {region: self._sorted(b) for region, b in buckets.items()}
+
+    @staticmethod
+    def _sorted(
+        entries: list[tuple[int, int]],
+    ) -> tuple[list[int], list[int]]:
+        """Sort bucket entries by level and split them into parallel lists."""
+        entries.sort()
+        return [level for level, _ in entries], [pos for _, pos in entries]
+
+    def query(
+        self, region: str | None = None, severity: int | None = None
+    ) -> list[WarningInfo]:
+        """Return the warnings matching the filters.
+
+        Args:
+            region: Region name, matched after normalization
+            severity: Minimum severity level
+
+        Returns:
+            Matching warnings in feed order
+        """
+        if region:
+            bucket = self._buckets.get(normalize_region(region))
+            if bucket is None:
+                return []
+        else:
+            bucket = self._all
+
+        levels, positions = bucket
+        end = len(levels) if severity is None else bisect_right(levels, -severity)
+        return [self.warnings[position] for position in sorted(positions[:end])]
+
+
+def haversine_km(
+    lat: float, lon: float, lats: Sequence[float], lons: Sequence[float]
+) -> list[float]:
+    """Return great-circle distances from one point to many points.
+
+    Uses numpy to compute all distances in one vectorized pass when it is
+    installed and falls back to a plain loop otherwise.
+
+    Args:
+        lat: Latitude of the origin in degrees
+        lon: Longitude of the origin in degrees
+        lats: Latitudes of the targets in degrees
+        lons: Longitudes of the targets in degrees
+
+    Returns:
+        Distances in kilometers, in target order
+    """
+    if np is not None:
+        phi1 = np.radians(lat)
+        phi2 = np.radians(np.asarray(lats, dtype=float))
+        dphi = phi2 - phi1
+        dlambda = np.radians(np.asarray(lons, dtype=float) - lon)
+        a = (
+            np.sin(dphi / 2) ** 2
+            + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+        )
+        distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+        return distances.tolist()  # type: ignore[no-any-return]
+
+    phi1 = math.radians(lat)
+    distances = []
+    for target_lat, target_lon in zip(lats, lons, strict=True):
+        phi2 = math.radians(target_lat)
+        dphi = phi2 - phi1
+        dlambda = math.radians(target_lon - lon)
+        a = (
+            math.sin(dphi / 2) ** 2
+            + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+        )
+        distances.append(2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a)))
+    return distances
+
+
+def _unit_vector(lat: float, lon: float) -> tuple[float, float, float]:
+    """Convert coordinates in degrees to a point on the unit sphere."""
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    return (math.cos(phi) * math.cos(lam), math.cos(phi) * math.sin(lam), math.sin(phi))
+
+
+class StationSpatialIndex:
+    """KD-tree over station coordinates for nearest-station queries.
+
+    Stations are indexed as points on the unit sphere, where straight-line
+    (chord) distance orders points exactly like great-circle distance. The
+    tree finds the nearest candidates without scanning every station; their
+    distances in kilometers are then computed with the haversine formula.
+    Stations without coordinates are not indexed.
+    """
+
+    def __init__(self, stations: list[StationData]):
+        """Build the index.
+
+        Args:
+            stations: Station catalog of one snapshot
+        """
+        self.stations = [
+            s
+            for s in stations
+            if s.station.latitude is not None and s.station.longitude is not None
+        ]
+        points = [
+            (_unit_vector(s.station.latitude, s.station.longitude), i)  # type: ignore
+            for i, s in enumerate(self.stations)
+        ]
+        self._root = self._build(points, 0)
+
+    def __len__(self) -> int:
+        return len(self.stations)
+
+    @classmethod
+    def _build(
+        cls, points: list[tuple[tuple[float, float, float], int]], depth: int
+    ) -> Any:
+        """Recursively build a tree node as (point, index, axis, left, right)."""
+        if not points:
+            return None
+        axis = depth % 3
+        points.sort(key=lambda p: p[0][axis])
+        median = len(points) // 2
+        point, index = points[median]
+        return (
+            point,
+            index,
+            axis,
+            cls._build(points[:median], depth + 1),
+            cls._build(points[median + 1 :], depth + 1),
+        )
+
+    def nearest(
+        self, lat: float, lon: float, k: int = 5, max_km: float | None = None
+    ) -> list[tuple[StationData, float]]:
+        """Find the stations closest to a point.
+
+        Args:
+            lat: Latitude in degrees
+            lon: Longitude in degrees
+            k: Maximum number of stations to return
+            max_km: Only return stations within this distance
+
+        Returns:
+            Tuples of station and distance in kilometers, nearest first
+        """
+        if k <= 0 or self._root is None:
+            return []
+
+        target = _unit_vector(lat, lon)
+        # Squared chord length equivalent to the maximum great-circle distance
+        limit = math.inf
+        if max_km is not None:
+            angle = min(max_km / EARTH_RADIUS_KM, math.pi)
+            limit = (2 * math.sin(angle / 2)) ** 2 * (1 + 1e-9)
+
+        # Max-heap of the best candidates as (-squared distance, index)
+        best: list[tuple[float, int]] = []
+        # Nodes to visit with a lower bound of their squared distance
+        stack: list[tuple[Any, float]] = [(self._root, 0.0)]
+        while stack:
+            node, bound = stack.pop()
+            if node is None or bound > (-best[0][0] if len(best) == k else limit):
+                continue
+            point, index, axis, left, right = node
+            dist = (
+                (point[0] - target[0]) ** 2
+                + (point[1] - target[1]) ** 2
+                + (point[2] - target[2]) ** 2
+            )
+            worst = -best[0][0] if len(best) == k else limit
+            if dist <= worst and dist <= limit:
+                if len(best) == k:
+                    heapq.heapreplace(best, (-dist, index))
+                else:
+                    heapq.heappush(best, (-dist, index))
+
+            diff = target[axis] - point[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            # The far side is pushed first so the near side is explored first
+            stack.append((far, diff * diff))
+            stack.append((near, 0.0))
+
+        indexes = [index for _, index in sorted(best, key=lambda b: (-b[0], b[1]))]
+        found = [self.stations[i] for i in indexes]
+        distances = haversine_km(
+            lat,
+            lon,
+            [s.station.latitude for s in found],  # type: ignore[misc]
+            [s.station.longitude for s in found],  # type: ignore[misc]
+        )
+        return [
+            (station, distance)
+            for station, distance in zip(found, distances, strict=True)
+            if max_km is None or distance <= max_km
+        ]
+
+
+def intersect_bbox(a: BoundingBox, b: BoundingBox) -> BoundingBox:
+    """Return the intersection of two bounding boxes, possibly empty."""
+    return (max(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), min(a[3], b[3]))
+
+
+def radius_bbox(lat: float, lon: float, radius_km: float) -> BoundingBox:
+    """Return a bounding box containing every point within a radius.
+
+    Args:
+        lat: Latitude of the center in degrees
+        lon: Longitude of the center in degrees
+        radius_km: Radius in kilometers
+
+    Returns:
+        Bounding box as (south, west, north, east) in degrees
+    """
+    dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    south = max(lat - dlat, -90.0)
+    north = min(lat + dlat, 90.0)
+    # The widest longitude span is at the latitude closest to a pole
+    widest = max(abs(south), abs(north))
+    if widest >= 90.0 or dlat >= 90.0:
+        return (south, -180.0, north, 180.0)
+    dlon = min(dlat / math.cos(math.radians(widest)), 180.0)
+    return (south, lon - dlon, north, lon + dlon)
+
+
+class CrowdReportGridIndex:
+    """Uniform grid over crowd report coordinates for area queries.
+
+    Reports are bucketed into cells of ``cell_degrees`` by latitude and
+    longitude, so a query only looks at the cells overlapping its area.
+    Results are returned in the order of the original report list.
+    """
+
+    def __init__(self, reports: list[CrowdReport], cell_degrees: float = 0.25):
+        """Build the index.
+
+        Args:
+            reports: Crowd reports of one snapshot, in feed order
+            cell_degrees: Edge length of a grid cell in degrees
+        """
+        self.reports = reports
+        self.cell_degrees = cell_degrees
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        for position, report in enumerate(reports):
+            cell = (self._row(report.latitude), self._column(report.longitude))
+            self._cells.setdefault(cell, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.reports)
+
+    def _row(self, lat: float) -> int:
+        return math.floor(lat / self.cell_degrees)
+
+    def _column(self, lon: float) -> int:
+        return math.floor(lon / self.cell_degrees)
+
+    def _candidates(self, bbox: BoundingBox) -> list[int]:
+        """Return positions of reports in the cells overlapping a box."""
+        south, west, north, east = bbox
+        if south > north or west > east:
+            return []
+        rows = range(self._row(south), self._row(north) + 1)
+        columns = range(self._column(west), self._column(east) + 1)
+        if len(rows) * len(columns) > len(self._cells):
+            # Scanning the occupied cells is cheaper for very large boxes
+            return [
+                position
+                for (row, column), positions in self._cells.items()
+                if row in rows and column in columns
+                for position in positions
+            ]
+        return [
+            position
+            for row in rows
+            for column in columns
+            for position in self._cells.get((row, column), ())
+        ]
+
+    def query(
+        self,
+        bbox: BoundingBox | None = None,
+        center: tuple[float, float] | None = None,
+        radius_km: float | None = None,
+    ) -> list[CrowdReport]:
+        """Return the reports inside an area.
+
+        Args:
+            bbox: Bounding box as (south, west, north, east) in degrees
+            center: Latitude and longitude of a radius filter
+            radius_km: Radius around ``center`` in kilometers
+
+        Returns:
+            Reports matching all given filters, in feed order
+        """
+        area: BoundingBox = (-90.0, -180.0, 90.0, 180.0)
+        if bbox is not None:
+            area = intersect_bbox(area, bbox)
+        if center is not None and radius_km is not None:
+            area = intersect_bbox(area, radius_bbox(*center, radius_km))
+
+        south, west, north, east = area
+        positions = sorted(
+            position
+            for position in self._candidates(area)
+            if south <= self.reports[position].latitude <= north
+            and west <= self.reports[position].longitude <= east
+        )
+        reports = [self.reports[position] for position in positions]
+        if center is None or radius_km is None or not reports:
+            return reports
+
+        distances = haversine_km(
+            center[0],
+            center[1],
+            [r.latitude for r in reports],
+            [r.longitude for r in reports],
+        )
+        return [
+            report
+            for report, distance in zip(reports, distances, strict=True)
+            if distance <= radius_km
+        ]
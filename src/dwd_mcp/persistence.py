@@ -0,0 +1,158 @@
+"""On-disk store of raw upstream responses for warm restarts."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from .cache import CacheKey
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class StoredResponse:
+    """A raw response body with its validators and wall-clock fetch time."""
+
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+    def age(self, now: float | None = None) -> float:
+        """Return the seconds since the response was fetched or revalidated."""
+        return max(0.0, (time.time() if now is None else now) - self.fetched_at)
+
+
+class DiskCache:
+    """SQLite-backed store of raw responses shared across process restarts.
+
+    The database is opened on first use, so creating a store costs nothing
+    until a response is looked up or saved. Storage errors are logged and
+    treated like a missing entry; the store never fails a request.
+    """
+
+    def __init__(self, directory: str | Path, filename: str = "responses.sqlite3"):
+        """Initialize the store.
+
+        Args:
+            directory: Directory holding the database, created if missing
+            filename: Name of the database file
+        """
+        self.path = Path(directory) / filename
+        self._connection: sqlite3.Connection | None = None
+        # Writes may run in worker threads while reads happen on the loop
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(key: CacheKey) -> str:
+        """Serialize a cache key for storage."""
+        return json.dumps(key, separators=(",", ":"))
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def load(self, key: CacheKey) -> StoredResponse | None:
+        """Return the stored response for a key, if any."""
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT body, etag, last_modified, fetched_at "
+                        "FROM responses WHERE key = ?",
+                        (self._key(key),),
+                    )
+                    .fetchone()
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read {self.path}: {e}")
+            return None
+        return None if row is None else StoredResponse(*row)
+
+    def info(self, key: CacheKey) -> tuple[str | None, float] | None:
+        """Return the ETag and fetch time of a stored response.
+
+        Unlike ``load`` this does not read the body, so it is cheap enough
+        to check for responses stored by other processes.
+        """
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT etag, fetched_at FROM responses WHERE key = ?",
+                        (self._key(key),),
+                    )
+                    .fetchone()
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read {self.path}: {e}")
+            return None
+        return None if row is None else (row[0], row[1])
+
+    def save(
+        self,
+        key: CacheKey,
+        body: bytes,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        fetched_at: float | None = None,
+    ) -> None:
+        """Store a response, replacing any previous one for the key."""
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, body, etag, last_modified, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        self._key(key),
+                        body,
+                        etag,
+                        last_modified,
+                        time.time() if fetched_at is None else fetched_at,
+                    ),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write {self.path}: {e}")
+
+    def touch(self, key: CacheKey, fetched_at: float | None = None) -> None:
+        """Record that the upstream confirmed a stored response unchanged."""
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "UPDATE responses SET fetched_at = ? WHERE key = ?",
+                    (time.time() if fetched_at is None else fetched_at, self._key(key)),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write {self.path}: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,154 @@
+"""Background polling that keeps frequently used feeds in memory."""
+
+import asyncio
+import fcntl
+import logging
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import IO, Any
+
+from .client import CROWD_REPORTS_ENDPOINT, WARNINGS_ENDPOINT, DWDClient
+
+logger = logging.getLogger(__name__)
+
+# Parses a freshly fetched feed so tool calls find its models and indexes
+# ready; a crowd report filter covering the whole world builds the grid index
+_WARMERS: dict[str, Callable[[DWDClient], Awaitable[Any]]] = {
+    WARNINGS_ENDPOINT: lambda client: client.get_current_warnings(),
+    CROWD_REPORTS_ENDPOINT: lambda client: client.get_crowd_reports(
+        bbox=(-90.0, -180.0, 90.0, 180.0)
+    ),
+}
+
+
+class LeaderLock:
+    """Exclusive file lock that elects one of several processes as leader.
+
+    The lock is tried without blocking. The operating system releases it
+    when its holder exits, so the next process to try takes over.
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize the lock.
+
+        Args:
+            path: Lock file, created if missing
+        """
+        self.path = Path(path)
+        self._file: IO[str] | None = None
+
+    @property
+    def held(self) -> bool:
+        """Return True if this process holds the lock."""
+        return self._file is not None
+
+    def acquire(self) -> bool:
+        """Take the lock unless another process holds it.
+
+        Returns:
+            True if this process holds the lock
+        """
+        if self._file is not None:
+            return True
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file = open(self.path, "a")
+        try:
+            fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            file.close()
+            return False
+        logger.info(f"Acquired {self.path}, polling as leader")
+        self._file = file
+        return True
+
+    def release(self) -> None:
+        """Give up the lock if held."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class FeedPoller:
+    """Refreshes feeds in the background on fixed intervals.
+
+    Each polled feed is fetched, parsed and indexed by a background task.
+    The new cache entry replaces the previous one in a single step, and
+    while the poller runs the client serves the feed from memory even after
+    its TTL has passed, so tool calls do not wait for the upstream.
+
+    Processes sharing a disk cache can elect a leader through a lock. Only
+    the leader fetches from the upstream and writes the disk cache; the
+    others load the responses it stored. When the leader exits, the next
+    process to poll takes over.
+    """
+
+    def __init__(
+        self,
+        client: DWDClient,
+        intervals: dict[str, float],
+        leader_lock: LeaderLock | None = None,
+    ):
+        """Initialize the poller.
+
+        Args:
+            client: Client whose cache is kept current
+            intervals: Seconds between refreshes per endpoint. Endpoints with
+                an interval of zero or less are not polled.
+            leader_lock: Lock shared with the other processes using the
+                client's disk cache, None to always poll the upstream
+        """
+        unknown = set(intervals) - set(_WARMERS)
+        if unknown:
+            raise ValueError(f"Cannot poll endpoints: {', '.join(sorted(unknown))}")
+        self.client = client
+        self.intervals = {e: i for e, i in intervals.items() if i > 0}
+        self.leader_lock = leader_lock
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def running(self) -> bool:
+        """Return True if the polling tasks are running."""
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Start one polling task per endpoint."""
+        if self._tasks:
+            return
+        for endpoint, interval in self.intervals.items():
+            self.client.polled_endpoints.add(endpoint)
+            self._tasks.append(asyncio.create_task(self._poll(endpoint, interval)))
+
+    async def stop(self) -> None:
+        """Stop polling and let the client fetch the feeds on demand again."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self.client.polled_endpoints.difference_update(self.intervals)
+        if self.leader_lock is not None:
+            self.leader_lock.release()
+
+    async def refresh(self, endpoint: str) -> None:
+        """Fetch, parse and index one feed.
+
+        Without leadership the feed is loaded from the disk cache instead,
+        and left alone if the leader has not stored a newer response.
+
+        Raises:
+            DWDAPIError: If the feed cannot be fetched or parsed
+        """
+        if self.leader_lock is None or self.leader_lock.acquire():
+            await self.client.refresh(endpoint)
+        elif not self.client.reload(endpoint):
+            return
+        await _WARMERS[endpoint](self.client)
+
+    async def _poll(self, endpoint: str, interval: float) -> None:
+        """Refresh a feed until cancelled, logging failures."""
+        while True:
+            try:
+                await self.refresh(endpoint)
+            except Exception as e:
+                logger.warning(f"Background refresh of {endpoint} failed: {e}")
+            await asyncio.sleep(interval)
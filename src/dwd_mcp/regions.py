@@ -0,0 +1,127 @@
+"""German federal states and the names they are referred to by."""
+
+from dataclasses import dataclass
+
+from .indexes import BoundingBox, normalize_region
+from .models import StationData
+
+
+class UnknownRegionError(ValueError):
+    """Raised when a region filter does not name a federal state."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class State:
+    """A German federal state.
+
+    Attributes:
+        name: German name as used by the DWD
+        code: ISO 3166-2 subdivision code without the country prefix
+        aliases: Further names, e.g. English or transliterated ones
+        bbox: Approximate bounding box as (south, west, north, east)
+    """
+
+    name: str
+    code: str
+    aliases: tuple[str, ...]
+    bbox: BoundingBox
+
+
+STATES = (
+    State(
+        "Baden-Württemberg",
+        "BW",
+        ("Baden-Wuerttemberg",),
+        (47.53, 7.51, 49.79, 10.50),
+    ),
+    State("Bayern", "BY", ("Bavaria",), (47.27, 8.97, 50.57, 13.84)),
+    State("Berlin", "BE", (), (52.33, 13.08, 52.68, 13.77)),
+    State("Brandenburg", "BB", (), (51.36, 11.26, 53.56, 14.77)),
+    State("Bremen", "HB", (), (53.01, 8.48, 53.61, 8.99)),
+    State("Hamburg", "HH", (), (53.39, 8.10, 54.03, 10.33)),
+    State("Hessen", "HE", ("Hesse",), (49.39, 7.77, 51.66, 10.24)),
+    State(
+        "Mecklenburg-Vorpommern",
+        "MV",
+        ("Mecklenburg-Western Pomerania",),
+        (53.11, 10.59, 54.69, 14.41),
+    ),
+    State("Niedersachsen", "NI", ("Lower Saxony",), (51.29, 6.65, 53.90, 11.60)),
+    State(
+        "Nordrhein-Westfalen",
+        "NW",
+        ("NRW", "North Rhine-Westphalia"),
+        (50.32, 5.86, 52.53, 9.46),
+    ),
+    State(
+        "Rheinland-Pfalz",
+        "RP",
+        ("Rhineland-Palatinate",),
+        (48.97, 6.11, 50.94, 8.51),
+    ),
+    State("Saarland", "SL", (), (49.11, 6.36, 49.64, 7.41)),
+    State("Sachsen", "SN", ("Saxony",), (50.17, 11.87, 51.69, 15.04)),
+    State("Sachsen-Anhalt", "ST", ("Saxony-Anhalt",), (50.94, 10.56, 53.05, 13.19)),
+    State("Schleswig-Holstein", "SH", (), (53.36, 7.86, 55.06, 11.32)),
+    State(
+        "Thüringen",
+        "TH",
+        ("Thueringen", "Thuringia"),
+        (50.20, 9.88, 51.65, 12.66),
+    ),
+)
+
+_BY_NAME = {
+    normalize_region(name): state
+    for state in STATES
+    for name in (state.name, state.code, *state.aliases)
+}
+
+
+def resolve_state(name: str) -> State | None:
+    """Look up a federal state by name, code or alias.
+
+    Args:
+        name: Name matched case-insensitively, e.g. ``"BY"``, ``"Bayern"``
+            or ``"Bavaria"``
+
+    Returns:
+        The state, or None if the name is not known
+    """
+    return _BY_NAME.get(normalize_region(name))
+
+
+def state_key(name: str) -> str:
+    """Return the lookup key of a state name, code or alias.
+
+    Known states map to their normalized German name, so all names of a
+    state share one key. Other names are only normalized.
+    """
+    state = resolve_state(name)
+    return normalize_region(state.name if state else name)
+
+
+class StationStateIndex:
+    """Index from federal states to the IDs of their weather stations."""
+
+    def __init__(self, stations: list[StationData]):
+        """Build the index.
+
+        Args:
+            stations: Station catalog of one snapshot
+        """
+        self._ids: dict[str, list[str]] = {}
+        for station in stations:
+            if station.station.state:
+                key = state_key(station.station.state)
+                self._ids.setdefault(key, []).append(station.station.station_id)
+
+    def station_ids(self, region: str) -> list[str]:
+        """Return the IDs of the stations in a state, in catalog order.
+
+        Args:
+            region: State name, code or alias, matched case-insensitively
+        """
+        return list(self._ids.get(state_key(region), ()))
@@ -0,0 +1,163 @@
+"""Retry and circuit breaker policies for upstream requests."""
+
+import logging
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Parse a Retry-After header into a delay in seconds.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+        now: Current time used for HTTP dates, defaults to the wall clock
+
+    Returns:
+        Delay in seconds, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+
+    now = now or datetime.now(UTC)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+# Response extension marking responses that were retried before they reached
+# the client, such as replies of the fetch daemon, so they are not retried again
+NO_RETRY = "dwd_mcp.no_retry"
+
+
+@dataclass
+class RetryPolicy:
+    """Capped exponential backoff with full jitter for idempotent requests.
+
+    Attributes:
+        max_attempts: Total number of attempts including the first one
+        base_delay: Backoff ceiling for the first retry in seconds
+        max_delay: Upper bound for any single delay. A Retry-After longer
+            than this is not waited for and the request fails instead.
+        retry_statuses: HTTP status codes that are considered transient
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset({429, 502, 503, 504})
+    )
+
+    def delay(self, retry: int, retry_after: float | None = None) -> float | None:
+        """Return the delay before a retry.
+
+        Args:
+            retry: Zero-based number of the retry
+            retry_after: Delay requested by the upstream, if any
+
+        Returns:
+            Seconds to wait, or None if the request should not be retried
+        """
+        if retry + 1 >= self.max_attempts:
+            return None
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+
+class CircuitState(Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops calling an upstream endpoint after repeated failures.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail fast. Once ``reset_timeout`` has passed a single trial
+    request is let through; its outcome closes or reopens the circuit.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial
+            clock: Monotonic time source, injectable for tests
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state of the circuit."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self.clock() - self._opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent to the upstream."""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request and close the circuit."""
+        if self._opened_at is not None:
+            logger.info("Upstream recovered, closing circuit")
+        self.failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_status(self, status_code: int) -> None:
+        """Record a response, counting server errors and 429 as failures."""
+        if status_code >= 500 or status_code == 429:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if needed."""
+        self.failures += 1
+        if self._trial_in_flight or self.failures >= self.failure_threshold:
+            if self._opened_at is None:
+                logger.warning(
+                    f"Opening circuit after {self.failures} consecutive failures"
+                )
+            self._opened_at = self.clock()
+        self._trial_in_flight = False
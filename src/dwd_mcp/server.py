@@ -1,15 +1,34 @@
 """MCP server for DWD weather data."""
 
 import asyncio
+import contextlib
 import logging
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from typing import Any
 
-from mcp.server import Server
+import uvicorn
+from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from mcp.types import AnyUrl, Resource, TextContent, Tool
-
-from .client import DWDAPIError, DWDClient
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.types import Receive, Scope, Send
+
+from .client import (
+    CROWD_REPORTS_ENDPOINT,
+    STATIONS_ENDPOINT,
+    WARNINGS_ENDPOINT,
+    DWDAPIError,
+    DWDClient,
+    PartialFetchError,
+)
+from .config import ServerConfig
+from .feeds import FeedSnapshot
+from .models import StationData
+from .regions import UnknownRegionError
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +38,9 @@ app = Server("dwd-mcp")
 # Global client instance
 dwd_client: DWDClient | None = None
 
+# Rendered resources by URI with the generation of the feed they show
+_rendered_resources: dict[str, tuple[int, str]] = {}
+
 
 @app.list_tools()
 async def handle_list_tools() -> list[Tool]:
@@ -39,7 +61,10 @@ async def handle_list_tools() -> list[Tool]:
                     },
                     "region": {
                         "type": "string",
-                        "description": "Region filter (optional)",
+                        "description": (
+                            "Federal state name, code or English name, "
+                            "e.g. 'Hessen', 'HE' or 'Hesse' (optional)"
+                        ),
                     },
                 },
                 "additionalProperties": False,
@@ -75,73 +100,180 @@ async def handle_list_tools() -> list[Tool]:
                 "properties": {
                     "region": {
                         "type": "string",
-                        "description": "Region filter (optional)",
+                        "description": (
+                            "Federal state name, code or English name, "
+                            "e.g. 'Bayern', 'BY' or 'Bavaria' (optional). "
+                            "Approximate: matches the state's bounding box, "
+                            "which includes areas of neighboring states and "
+                            "countries, e.g. Berlin within Brandenburg"
+                        ),
+                    },
+                    "bbox": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "minItems": 4,
+                        "maxItems": 4,
+                        "description": (
+                            "Bounding box as [south, west, north, east] "
+                            "in degrees (optional)"
+                        ),
+                    },
+                    "lat": {
+                        "type": "number",
+                        "description": "Latitude of a radius filter (optional)",
+                    },
+                    "lon": {
+                        "type": "number",
+                        "description": "Longitude of a radius filter (optional)",
+                    },
+                    "radius_km": {
+                        "type": "number",
+                        "minimum": 0,
+                        "description": "Radius around lat/lon in kilometers",
+                    },
+                },
+                "additionalProperties": False,
+            },
+        ),
+        Tool(
+            name="find_nearest_stations",
+            description="Find the weather stations closest to a location",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "lat": {
+                        "type": "number",
+                        "minimum": -90,
+                        "maximum": 90,
+                        "description": "Latitude in degrees",
+                    },
+                    "lon": {
+                        "type": "number",
+                        "minimum": -180,
+                        "maximum": 180,
+                        "description": "Longitude in degrees",
+                    },
+                    "k": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": 100,
+                        "description": "Number of stations to return (default 5)",
+                    },
+                    "max_km": {
+                        "type": "number",
+                        "minimum": 0,
+                        "description": "Maximum distance in kilometers (optional)",
                     },
                 },
+                "required": ["lat", "lon"],
                 "additionalProperties": False,
             },
         ),
     ]
 
 
+def format_stations(
+    stations: list[StationData], fetched_at: datetime | None = None
+) -> list[str]:
+    """Render weather stations and when they were fetched as Markdown lines."""
+    result_lines = ["# Weather Stations\n"]
+    result_lines.extend(format_freshness(fetched_at))
+
+    for station in stations:
+        result_lines.append(f"## Station: {station.station.station_name or 'Unknown'}")
+        result_lines.append(f"- **ID**: {station.station.station_id}")
+
+        if station.station.latitude and station.station.longitude:
+            result_lines.append(
+                f"- **Location**: {station.station.latitude:.4f}°N, "
+                f"{station.station.longitude:.4f}°E"
+            )
+
+        if station.station.elevation:
+            result_lines.append(f"- **Elevation**: {station.station.elevation}m")
+
+        if station.station.state:
+            result_lines.append(f"- **State**: {station.station.state}")
+
+        if station.measurements:
+            result_lines.append("- **Current Measurements**:")
+            for measurement in station.measurements:
+                value_str = (
+                    f"{measurement.value} {measurement.unit}"
+                    if measurement.value is not None and measurement.unit
+                    else str(measurement.value) if measurement.value is not None
+                    else "N/A"
+                )
+                result_lines.append(f"  - {measurement.parameter}: {value_str}")
+
+        if station.last_updated:
+            result_lines.append(f"- **Last Updated**: {station.last_updated}")
+
+        result_lines.append("")
+
+    return result_lines
+
+
+def format_age(seconds: float) -> str:
+    """Render a duration in seconds in its largest sensible units."""
+    seconds = max(0, int(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+
+
+def format_freshness(
+    fetched_at: datetime | None, now: datetime | None = None
+) -> list[str]:
+    """Render the time the data was fetched and its age as Markdown lines."""
+    if fetched_at is None:
+        return []
+    age = ((now or datetime.now(UTC)) - fetched_at).total_seconds()
+    return [
+        f"*Data as of {fetched_at.isoformat(timespec='seconds')} "
+        f"({format_age(age)} old)*\n"
+    ]
+
+
 @app.call_tool()
 async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
     global dwd_client
 
     if dwd_client is None:
-        dwd_client = DWDClient()
+        dwd_client = ServerConfig.from_env().create_client()
 
     try:
         if name == "get_weather_stations":
             station_ids = arguments.get("station_ids")
             region = arguments.get("region")
 
-            stations = await dwd_client.get_weather_stations(
-                station_ids=station_ids, region=region
-            )
+            failed_ids: list[str] = []
+            try:
+                stations = await dwd_client.get_weather_stations(
+                    station_ids=station_ids, region=region
+                )
+            except PartialFetchError as e:
+                stations = e.results
+                failed_ids = e.failed_ids
+            except UnknownRegionError as e:
+                return [TextContent(type="text", text=f"Invalid arguments: {e}")]
 
             if not stations:
                 return [TextContent(type="text", text="No weather stations found.")]
 
-            # Format the response
-            result_lines = ["# Weather Stations\n"]
-
-            for station in stations:
+            result_lines = format_stations(
+                stations,
+                dwd_client.stations_fetched_at(
+                    [station.station.station_id for station in stations]
+                ),
+            )
+            if failed_ids:
                 result_lines.append(
-                    f"## Station: {station.station.station_name or 'Unknown'}"
+                    f"**Note**: Could not fetch stations {', '.join(failed_ids)}"
                 )
-                result_lines.append(f"- **ID**: {station.station.station_id}")
-
-                if station.station.latitude and station.station.longitude:
-                    result_lines.append(
-                        f"- **Location**: {station.station.latitude:.4f}°N, "
-                        f"{station.station.longitude:.4f}°E"
-                    )
-
-                if station.station.elevation:
-                    result_lines.append(
-                        f"- **Elevation**: {station.station.elevation}m"
-                    )
-
-                if station.station.state:
-                    result_lines.append(f"- **State**: {station.station.state}")
-
-                if station.measurements:
-                    result_lines.append("- **Current Measurements**:")
-                    for measurement in station.measurements:
-                        value_str = (
-                            f"{measurement.value} {measurement.unit}"
-                            if measurement.value is not None and measurement.unit
-                            else str(measurement.value) if measurement.value is not None
-                            else "N/A"
-                        )
-                        result_lines.append(f"  - {measurement.parameter}: {value_str}")
-
-                if station.last_updated:
-                    result_lines.append(f"- **Last Updated**: {station.last_updated}")
-
-                result_lines.append("")
 
             return [TextContent(type="text", text="\n".join(result_lines))]
 
@@ -157,6 +289,9 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
                 return [TextContent(type="text", text="No weather warnings found.")]
 
             result_lines = ["# Current Weather Warnings\n"]
+            result_lines.extend(
+                format_freshness(dwd_client.fetched_at(WARNINGS_ENDPOINT))
+            )
 
             for warning in warnings:
                 result_lines.append(f"## {warning.headline}")
@@ -178,13 +313,26 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
 
         elif name == "get_crowd_reports":
             region = arguments.get("region")
-
-            reports = await dwd_client.get_crowd_reports(region=region)
+            bbox = arguments.get("bbox")
+
+            try:
+                reports = await dwd_client.get_crowd_reports(
+                    region=region,
+                    bbox=tuple(bbox) if bbox else None,
+                    lat=arguments.get("lat"),
+                    lon=arguments.get("lon"),
+                    radius_km=arguments.get("radius_km"),
+                )
+            except ValueError as e:
+                return [TextContent(type="text", text=f"Invalid arguments: {e}")]
 
             if not reports:
                 return [TextContent(type="text", text="No crowd reports found.")]
 
             result_lines = ["# User-Submitted Weather Reports\n"]
+            result_lines.extend(
+                format_freshness(dwd_client.fetched_at(CROWD_REPORTS_ENDPOINT))
+            )
 
             for report in reports:
                 result_lines.append(f"## Report {report.report_id}")
@@ -205,6 +353,40 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
 
             return [TextContent(type="text", text="\n".join(result_lines))]
 
+        elif name == "find_nearest_stations":
+            lat = arguments["lat"]
+            lon = arguments["lon"]
+            k = arguments.get("k", 5)
+            max_km = arguments.get("max_km")
+
+            nearest = await dwd_client.find_nearest_stations(
+                lat, lon, k=k, max_km=max_km
+            )
+
+            if not nearest:
+                return [TextContent(type="text", text="No weather stations found.")]
+
+            result_lines = [f"# Weather Stations near {lat:.4f}°N, {lon:.4f}°E\n"]
+            result_lines.extend(
+                format_freshness(dwd_client.fetched_at(STATIONS_ENDPOINT))
+            )
+
+            for station, distance in nearest:
+                info = station.station
+                result_lines.append(f"## Station: {info.station_name or 'Unknown'}")
+                result_lines.append(f"- **ID**: {info.station_id}")
+                result_lines.append(f"- **Distance**: {distance:.1f} km")
+                result_lines.append(
+                    f"- **Location**: {info.latitude:.4f}°N, {info.longitude:.4f}°E"
+                )
+
+                if info.state:
+                    result_lines.append(f"- **State**: {info.state}")
+
+                result_lines.append("")
+
+            return [TextContent(type="text", text="\n".join(result_lines))]
+
         else:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
@@ -241,26 +423,57 @@ async def handle_list_resources() -> list[Resource]:
     ]
 
 
+def render_resource(
+    uri: str, snapshot: FeedSnapshot[Any] | None, models: list[Any]
+) -> str:
+    """Render models as a JSON resource.
+
+    The text is kept until the feed snapshot it was rendered from is
+    replaced, so repeated reads of an unchanged feed are not rendered again.
+
+    Args:
+        uri: Resource URI
+        snapshot: Current snapshot of the feed the models come from, None
+            if the feed is not cached
+        models: Models to render
+    """
+    if snapshot is not None:
+        rendered = _rendered_resources.get(uri)
+        if rendered is not None and rendered[0] == snapshot.generation:
+            return rendered[1]
+
+    text = "\n".join([model.model_dump_json(indent=2) for model in models])
+    if snapshot is not None:
+        _rendered_resources[uri] = (snapshot.generation, text)
+    return text
+
+
 @app.read_resource()
 async def handle_read_resource(uri: str) -> str:
     """Read a resource by URI."""
     global dwd_client
 
     if dwd_client is None:
-        dwd_client = DWDClient()
+        dwd_client = ServerConfig.from_env().create_client()
 
     try:
         if uri == "weather://stations/all":
             stations = await dwd_client.get_weather_stations()
-            return "\n".join([station.json(indent=2) for station in stations])
+            return render_resource(
+                uri, dwd_client.snapshot(STATIONS_ENDPOINT), stations
+            )
 
         elif uri == "weather://warnings/current":
             warnings = await dwd_client.get_current_warnings()
-            return "\n".join([warning.json(indent=2) for warning in warnings])
+            return render_resource(
+                uri, dwd_client.snapshot(WARNINGS_ENDPOINT), warnings
+            )
 
         elif uri == "weather://reports/crowd":
             reports = await dwd_client.get_crowd_reports()
-            return "\n".join([report.json(indent=2) for report in reports])
+            return render_resource(
+                uri, dwd_client.snapshot(CROWD_REPORTS_ENDPOINT), reports
+            )
 
         else:
             raise ValueError(f"Unknown resource URI: {uri}")
@@ -270,8 +483,34 @@ async def handle_read_resource(uri: str) -> str:
         raise
 
 
-async def main() -> None:
-    """Run the MCP server."""
+def create_http_app(json_response: bool = False, stateless: bool = False) -> Starlette:
+    """Create an ASGI app serving the MCP server over streamable HTTP.
+
+    All sessions share the module's DWD client, and with it one connection
+    pool and cache. The MCP endpoint is mounted at ``/mcp``.
+
+    Args:
+        json_response: Answer with plain JSON instead of SSE streams
+        stateless: Handle every request without a session, so that any of
+            several processes sharing a socket can answer it
+    """
+    session_manager = StreamableHTTPSessionManager(
+        app=app, json_response=json_response, stateless=stateless
+    )
+
+    async def handle_mcp(scope: Scope, receive: Receive, send: Send) -> None:
+        await session_manager.handle_request(scope, receive, send)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_: Starlette) -> AsyncIterator[None]:
+        async with session_manager.run():
+            yield
+
+    return Starlette(routes=[Mount("/mcp", app=handle_mcp)], lifespan=lifespan)
+
+
+async def run_stdio() -> None:
+    """Serve a single MCP client over stdin and stdout."""
     async with stdio_server() as (read_stream, write_stream):
         await app.run(
             read_stream,
@@ -279,10 +518,48 @@ async def main() -> None:
             InitializationOptions(
                 server_name="dwd-mcp",
                 server_version="0.1.0",
-                capabilities=app.get_capabilities({}, {}),  # type: ignore[arg-type]
+                capabilities=app.get_capabilities(NotificationOptions(), {}),
             ),
         )
 
 
+async def run_http(host: str, port: int) -> None:
+    """Serve many MCP clients over streamable HTTP."""
+    server = uvicorn.Server(
+        uvicorn.Config(create_http_app(), host=host, port=port, log_level="info")
+    )
+    logger.info(f"Serving MCP over HTTP at http://{host}:{port}/mcp/")
+    await server.serve()
+
+
+async def main() -> None:
+    """Run the MCP server.
+
+    The server speaks MCP over stdio by default, or over streamable HTTP if
+    ``DWD_MCP_TRANSPORT`` is ``http``. Feeds with a configured polling
+    interval are refreshed in the background for as long as the server runs.
+    """
+    global dwd_client
+
+    config = ServerConfig.from_env()
+    if config.transport not in ("stdio", "http"):
+        raise ValueError(f"Unknown transport: {config.transport!r}")
+    if dwd_client is None:
+        dwd_client = config.create_client()
+
+    poller = config.create_poller(dwd_client)
+    if poller is not None:
+        poller.start()
+
+    try:
+        if config.transport == "http":
+            await run_http(config.http_host, config.http_port)
+        else:
+            await run_stdio()
+    finally:
+        if poller is not None:
+            await poller.stop()
+
+
 if __name__ == "__main__":
     asyncio.run(main())
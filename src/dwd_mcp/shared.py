@@ -0,0 +1,201 @@
+"""Feed snapshots shared between processes through a memory-mapped file.
+
+In multi-worker mode one leader process fetches and parses the feeds and
+publishes them in a snapshot file. Worker processes map the file read-only
+and load a feed from it only when the leader has published a new version,
+so they neither fetch nor validate the feeds themselves.
+
+The file starts with a magic number and the length of a JSON directory,
+followed by the directory and one blob of pickled models per feed. The
+directory lists each feed's version, validators, fetch time and blob
+location, so a revalidated feed only changes the directory and readers
+keep their models. A new snapshot is written to a temporary file that
+then replaces the old one, so readers keep a consistent mapping until they
+switch to the new file.
+"""
+
+import json
+import logging
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"DWDSNAP1"
+_HEADER = struct.Struct(f"<{len(_MAGIC)}sI")
+
+
+@dataclass
+class SharedEntry:
+    """A published feed: the models parsed from a response and its metadata.
+
+    Attributes:
+        version: Increases whenever the feed's data changes
+        models: Models parsed from the response, None if not loaded
+        etag: ETag of the response
+        last_modified: Last-Modified of the response
+        fetched_at: Wall-clock time the upstream last confirmed the data
+    """
+
+    version: int
+    models: list[Any] | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float = 0.0
+
+    def age(self, now: float | None = None) -> float:
+        """Return the seconds since the feed was fetched or revalidated."""
+        return max(0.0, (time.time() if now is None else now) - self.fetched_at)
+
+
+def write_snapshot(
+    path: str | Path,
+    entries: dict[str, SharedEntry],
+    blobs: dict[tuple[str, int], bytes] | None = None,
+) -> None:
+    """Publish feeds by atomically replacing the snapshot file.
+
+    Args:
+        path: Snapshot file
+        entries: Published feeds by endpoint, with their models
+        blobs: Pickled models by endpoint and version, reused if present and
+            added otherwise, so unchanged feeds are not pickled again
+    """
+    path = Path(path)
+    if blobs is None:
+        blobs = {}
+    directory = {}
+    written = []
+    offset = 0
+    for endpoint, entry in entries.items():
+        blob = blobs.get((endpoint, entry.version))
+        if blob is None:
+            blob = pickle.dumps(entry.models, protocol=pickle.HIGHEST_PROTOCOL)
+            blobs[endpoint, entry.version] = blob
+        directory[endpoint] = {
+            "version": entry.version,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "fetched_at": entry.fetched_at,
+            "offset": offset,
+            "length": len(blob),
+        }
+        written.append(blob)
+        offset += len(blob)
+
+    header = json.dumps(directory, separators=(",", ":")).encode()
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, len(header)))
+            file.write(header)
+            for blob in written:
+                file.write(blob)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+class SharedSnapshot:
+    """Read-only view of a snapshot file published by another process.
+
+    The file is mapped into memory and only its directory is parsed when a
+    new file is published. A feed's blob is unpickled when it is loaded.
+    Missing or malformed files are logged and read as an empty snapshot.
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize the view.
+
+        Args:
+            path: Snapshot file, which does not have to exist yet
+        """
+        self.path = Path(path)
+        self._mmap: mmap.mmap | None = None
+        self._directory: dict[str, dict[str, Any]] = {}
+        self._identity: tuple[int, int, int] | None = None
+        self._base = 0
+
+    def _refresh(self) -> None:
+        """Map the snapshot file again if it has been replaced."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if identity == self._identity:
+            return
+
+        self._identity = identity
+        try:
+            with open(self.path, "rb") as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, length = _HEADER.unpack_from(mapped)
+            if magic != _MAGIC:
+                raise ValueError("not a snapshot file")
+            directory = json.loads(mapped[_HEADER.size : _HEADER.size + length])
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"Could not read snapshot {self.path}: {e}")
+            return
+
+        self.close()
+        self._mmap = mapped
+        self._directory = directory
+        self._base = _HEADER.size + length
+
+    def version(self, endpoint: str) -> int | None:
+        """Return the published version of a feed, or None if not published."""
+        info = self.info(endpoint)
+        return None if info is None else info.version
+
+    def info(self, endpoint: str) -> SharedEntry | None:
+        """Return the published metadata of a feed without loading its models.
+
+        Returns:
+            The feed without models, or None if it is not published
+        """
+        self._refresh()
+        record = self._directory.get(endpoint)
+        if record is None:
+            return None
+        return SharedEntry(
+            version=record["version"],
+            etag=record["etag"],
+            last_modified=record["last_modified"],
+            fetched_at=record["fetched_at"],
+        )
+
+    def load(self, endpoint: str) -> SharedEntry | None:
+        """Load the published version of a feed.
+
+        Returns:
+            The feed, or None if it is not published or cannot be read
+        """
+        entry = self.info(endpoint)
+        if entry is None or self._mmap is None:
+            return None
+
+        record = self._directory[endpoint]
+        start = self._base + record["offset"]
+        try:
+            with memoryview(self._mmap)[start : start + record["length"]] as blob:
+                entry.models = pickle.loads(blob)
+        except Exception as e:
+            logger.warning(f"Could not load {endpoint} from {self.path}: {e}")
+            return None
+        return entry
+
+    def close(self) -> None:
+        """Unmap the snapshot file."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._directory = {}
@@ -0,0 +1,55 @@
+"""Coalescing of concurrent identical requests."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its result.
+
+    Concurrent callers for the same key await one shared task. The task is
+    shielded from its waiters: cancelling one waiter does not cancel the
+    call for the others, and errors are raised to every waiter.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single-flight group."""
+        self._calls: dict[Hashable, asyncio.Task[Any]] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Run ``func`` for the key, or join a call already in flight.
+
+        Args:
+            key: Identifies calls that produce the same result
+            func: Coroutine function performing the call
+
+        Returns:
+            The result of the shared call
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.shared += 1
+
+        return await asyncio.shield(task)  # type: ignore[no-any-return]
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        """Drop a finished call so the next caller starts a new one."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._calls
@@ -0,0 +1,154 @@
+"""Incremental parsing of large JSON documents."""
+
+import codecs
+import json
+from collections.abc import AsyncIterator, Collection
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_decoder = json.JSONDecoder()
+
+
+class _Buffer:
+    """Text buffer filled on demand from an async byte stream."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self.chunks = chunks
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    async def fill(self) -> bool:
+        """Read the next chunk, returning False at the end of the stream."""
+        if self.eof:
+            return False
+        try:
+            chunk = await anext(self.chunks)
+        except StopAsyncIteration:
+            self.text = self.text[self.pos :] + self.decoder.decode(b"", final=True)
+            self.pos = 0
+            self.eof = True
+            return False
+        # Drop consumed text so the buffer only holds the current item
+        self.text = self.text[self.pos :] + self.decoder.decode(chunk)
+        self.pos = 0
+        return True
+
+    async def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not await self.fill():
+                raise json.JSONDecodeError("Unexpected end of data", self.text, 0)
+
+    async def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be ``char``."""
+        found = await self.peek()
+        if found != char:
+            raise json.JSONDecodeError(
+                f"Expecting {char!r}, found {found!r}", self.text, self.pos
+            )
+        self.pos += 1
+
+    async def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        await self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not await self.fill():
+                    raise
+                continue
+            # A value ending at the buffer boundary may continue in the next
+            # chunk, so only accept it once more data is seen. A number is
+            # also cut short by a boundary after e.g. "1e" or "1.5E-", where
+            # only its leading part decodes.
+            if not self._may_continue(value, end) or not await self.fill():
+                self.pos = end
+                return value
+
+    def _may_continue(self, value: Any, end: int) -> bool:
+        """Check whether a value decoded up to ``end`` may be incomplete."""
+        if end == len(self.text):
+            return True
+        if isinstance(value, bool) or not isinstance(value, int | float):
+            return False
+        return all(char in _NUMBER_CHARS for char in self.text[end:])
+
+
+async def _array_items(buffer: _Buffer) -> AsyncIterator[Any]:
+    """Yield the items of the array starting at the buffer position."""
+    await buffer.expect("[")
+    if await buffer.peek() == "]":
+        buffer.pos += 1
+        return
+
+    while True:
+        yield await buffer.value()
+        if await buffer.peek() == ",":
+            buffer.pos += 1
+            continue
+        await buffer.expect("]")
+        return
+
+
+async def iter_json_items(
+    chunks: AsyncIterator[bytes],
+    item_keys: Collection[str] = (),
+    single_object: bool = False,
+) -> AsyncIterator[Any]:
+    """Incrementally yield the items of a JSON list document.
+
+    The document is either a top-level array or an object holding the array
+    under one of ``item_keys``. Only the item currently being decoded is
+    kept in memory.
+
+    Args:
+        chunks: Raw response body chunks
+        item_keys: Object keys that hold the item array
+        single_object: Yield an object without any of ``item_keys`` as a
+            single item instead of ignoring it
+
+    Yields:
+        Decoded JSON items in document order
+
+    Raises:
+        json.JSONDecodeError: If the document is malformed or truncated
+    """
+    buffer = _Buffer(chunks)
+
+    if await buffer.peek() == "[":
+        async for item in _array_items(buffer):
+            yield item
+        return
+
+    await buffer.expect("{")
+    other: dict[str, Any] = {}
+    found = False
+    if await buffer.peek() == "}":
+        buffer.pos += 1
+    else:
+        while True:
+            key = await buffer.value()
+            await buffer.expect(":")
+            if key in item_keys and not found and await buffer.peek() == "[":
+                found = True
+                async for item in _array_items(buffer):
+                    yield item
+            else:
+                other[key] = await buffer.value()
+
+            if await buffer.peek() == ",":
+                buffer.pos += 1
+                continue
+            await buffer.expect("}")
+            break
+
+    if not found and single_object:
+        yield other
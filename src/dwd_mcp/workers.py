@@ -0,0 +1,258 @@
+"""Pre-fork multi-worker mode of the HTTP transport.
+
+One process serving HTTP is limited to a single core for rendering tool
+output. In multi-worker mode the server binds its socket and forks worker
+processes that all accept connections on it. The parent stays behind as the
+leader: it alone fetches, parses and indexes the feeds and publishes them in
+a shared snapshot, which the workers serve without fetching or validating
+them again.
+"""
+
+import asyncio
+import logging
+import os
+import shutil
+import signal
+import socket
+import tempfile
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import uvicorn
+
+from . import server
+from .client import (
+    CROWD_REPORTS_ENDPOINT,
+    STATIONS_ENDPOINT,
+    WARNINGS_ENDPOINT,
+    DWDAPIError,
+    DWDClient,
+)
+from .config import ServerConfig
+from .shared import SharedEntry, SharedSnapshot, write_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Fetches a feed unless it is cached, then parses and indexes it; like the
+# poller's warmers, with a nearest station query building the station models
+_PUBLISHERS: dict[str, Callable[[DWDClient], Awaitable[Any]]] = {
+    WARNINGS_ENDPOINT: lambda client: client.get_current_warnings(),
+    CROWD_REPORTS_ENDPOINT: lambda client: client.get_crowd_reports(
+        bbox=(-90.0, -180.0, 90.0, 180.0)
+    ),
+    STATIONS_ENDPOINT: lambda client: client.find_nearest_stations(0.0, 0.0, k=1),
+}
+
+
+class SnapshotPublisher:
+    """Publishes the leader's feeds to the workers.
+
+    On every round each feed is brought up to date through the client, so
+    the upstream is only contacted when a cached response has expired. The
+    snapshot file is rewritten only when a feed's data or metadata has
+    changed, and a feed's version, and with it its models, only when its
+    data has.
+    """
+
+    def __init__(
+        self,
+        client: DWDClient,
+        path: str | Path,
+        interval: float = 5.0,
+        endpoints: tuple[str, ...] = tuple(_PUBLISHERS),
+    ):
+        """Initialize the publisher.
+
+        Args:
+            client: Client fetching and parsing the feeds
+            path: Snapshot file the workers read
+            interval: Seconds between publishing rounds
+            endpoints: Feeds to publish
+        """
+        unknown = set(endpoints) - set(_PUBLISHERS)
+        if unknown:
+            raise ValueError(f"Cannot publish endpoints: {', '.join(sorted(unknown))}")
+        self.client = client
+        self.path = Path(path)
+        self.interval = interval
+        self.endpoints = endpoints
+        self.entries: dict[str, SharedEntry] = {}
+        # Response data each published version was parsed from
+        self._data: dict[str, Any] = {}
+        self._blobs: dict[tuple[str, int], bytes] = {}
+
+    async def publish(self) -> bool:
+        """Bring the feeds up to date and publish those that changed.
+
+        Feeds that cannot be fetched keep their previously published version.
+
+        Returns:
+            True if a new snapshot was written
+        """
+        changed = False
+        for endpoint in self.endpoints:
+            try:
+                await _PUBLISHERS[endpoint](self.client)
+            except DWDAPIError as e:
+                logger.warning(f"Could not refresh {endpoint} for workers: {e}")
+                continue
+
+            entry = self.client.cache.peek(self.client.cache.make_key(endpoint))
+            snapshot = self.client.snapshot(endpoint)
+            if entry is None or snapshot is None:
+                continue
+            previous = self.entries.get(endpoint)
+            metadata = (entry.etag, entry.last_modified, entry.fetched_at)
+            if previous is not None and self._data[endpoint] is entry.data:
+                if metadata == (
+                    previous.etag,
+                    previous.last_modified,
+                    previous.fetched_at,
+                ):
+                    continue
+                # Revalidated: the workers keep their models
+                version = previous.version
+                models = previous.models
+            else:
+                version = 1 if previous is None else previous.version + 1
+                models = list(snapshot.models)
+
+            self.entries[endpoint] = SharedEntry(
+                version=version,
+                models=models,
+                etag=entry.etag,
+                last_modified=entry.last_modified,
+                fetched_at=entry.fetched_at,
+            )
+            self._data[endpoint] = entry.data
+            changed = True
+
+        if changed:
+            self._blobs = {
+                key: blob
+                for key, blob in self._blobs.items()
+                if self.entries[key[0]].version == key[1]
+            }
+            await asyncio.to_thread(
+                write_snapshot, self.path, dict(self.entries), self._blobs
+            )
+        return changed
+
+    async def run(self) -> None:
+        """Publish every ``interval`` seconds until cancelled."""
+        while True:
+            try:
+                await self.publish()
+            except Exception as e:
+                logger.warning(f"Publishing the snapshot failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+async def _work(config: ServerConfig, sock: socket.socket, snapshot: Path) -> None:
+    """Serve HTTP in a worker process until it is stopped or the leader exits."""
+    client = config.create_client(shared_snapshot=SharedSnapshot(snapshot))
+    server.dwd_client = client
+    # Requests of one client may reach any worker, so none keeps sessions
+    http = uvicorn.Server(
+        uvicorn.Config(server.create_http_app(stateless=True), log_level="info")
+    )
+    leader = os.getppid()
+
+    async def watch_leader() -> None:
+        while os.getppid() == leader:
+            await asyncio.sleep(1.0)
+        logger.warning("Leader exited, stopping worker")
+        http.should_exit = True
+
+    watcher = asyncio.create_task(watch_leader())
+    try:
+        await http.serve(sockets=[sock])
+    finally:
+        watcher.cancel()
+        await client.close()
+
+
+def _reap(workers: set[int]) -> None:
+    """Forget workers that have exited."""
+    for pid in list(workers):
+        try:
+            done, status = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            done, status = pid, 0
+        if done:
+            workers.discard(pid)
+            logger.warning(
+                f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}"
+            )
+
+
+async def _lead(config: ServerConfig, snapshot: Path, workers: set[int]) -> None:
+    """Publish snapshots for the workers until all of them have exited."""
+    client = config.create_client()
+    publisher = SnapshotPublisher(client, snapshot, config.snapshot_interval)
+    publishing = asyncio.create_task(publisher.run())
+    try:
+        while workers:
+            await asyncio.sleep(0.5)
+            _reap(workers)
+    finally:
+        publishing.cancel()
+        await asyncio.gather(publishing, return_exceptions=True)
+        await client.close()
+
+
+def _interrupt(signum: int, frame: Any) -> None:
+    """Stop the leader on SIGTERM as on Ctrl-C."""
+    raise KeyboardInterrupt
+
+
+def serve_workers(config: ServerConfig) -> None:
+    """Serve MCP over HTTP from ``config.http_workers`` forked processes.
+
+    Must be called before an event loop runs in this process. Returns once
+    all workers have exited, and stops the workers when interrupted.
+    """
+    sock = uvicorn.Config(
+        server.create_http_app(stateless=True),
+        host=config.http_host,
+        port=config.http_port,
+    ).bind_socket()
+    directory = tempfile.mkdtemp(prefix="dwd-mcp-")
+    snapshot = Path(directory) / "snapshot"
+    workers: set[int] = set()
+    try:
+        for _ in range(config.http_workers):
+            pid = os.fork()
+            if pid == 0:
+                code = 1
+                try:
+                    asyncio.run(_work(config, sock, snapshot))
+                    code = 0
+                except Exception:
+                    logger.exception("Worker failed")
+                finally:
+                    os._exit(code)
+            workers.add(pid)
+
+        logger.info(
+            f"Serving MCP over HTTP at http://{config.http_host}:{config.http_port}"
+            f"/mcp/ with {len(workers)} workers"
+        )
+        signal.signal(signal.SIGTERM, _interrupt)
+        asyncio.run(_lead(config, snapshot, workers))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in workers:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        sock.close()
+        shutil.rmtree(directory, ignore_errors=True)
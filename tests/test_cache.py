@@ -0,0 +1,142 @@
+"""Tests for the response cache."""
+
+import pytest
+
+from dwd_mcp.cache import ResponseCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create a controllable clock."""
+        return FakeClock()
+
+    def test_make_key_ignores_param_order(self):
+        """Test that keys are independent of parameter order."""
+        key_a = ResponseCache.make_key("/x", {"a": 1, "b": "2"})
+        key_b = ResponseCache.make_key("/x", {"b": "2", "a": "1"})
+
+        assert key_a == key_b
+        assert ResponseCache.make_key("/x") == ResponseCache.make_key("/x", {})
+        assert ResponseCache.make_key("/x", {"a": None}) == ResponseCache.make_key("/x")
+
+    def test_hit_and_expiry(self, clock):
+        """Test that entries are served until their TTL elapses."""
+        cache = ResponseCache(ttls={"/warnings": 10.0}, clock=clock)
+        key = cache.make_key("/warnings")
+
+        cache.put(key, {"warnings": []})
+        clock.now = 9.9
+        assert cache.get(key).data == {"warnings": []}
+
+        clock.now = 10.0
+        assert cache.get(key) is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_per_endpoint_ttl(self, clock):
+        """Test that each endpoint uses its own TTL."""
+        cache = ResponseCache(
+            ttls={"/fast": 1.0, "/slow": 100.0}, default_ttl=5.0, clock=clock
+        )
+        for endpoint in ("/fast", "/slow", "/other"):
+            cache.put(cache.make_key(endpoint), endpoint)
+
+        clock.now = 2.0
+        assert cache.get(cache.make_key("/fast")) is None
+        assert cache.get(cache.make_key("/slow")).data == "/slow"
+        assert cache.get(cache.make_key("/other")).data == "/other"
+
+    def test_zero_ttl_disables_caching(self, clock):
+        """Test that a non-positive TTL stores nothing."""
+        cache = ResponseCache(ttls={"/live": 0}, clock=clock)
+
+        assert cache.put(cache.make_key("/live"), "data") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, clock):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResponseCache(default_ttl=60.0, max_entries=2, clock=clock)
+        key_a, key_b, key_c = (cache.make_key(e) for e in ("/a", "/b", "/c"))
+
+        cache.put(key_a, "a")
+        cache.put(key_b, "b")
+        cache.get(key_a)
+        cache.put(key_c, "c")
+
+        assert key_a in cache
+        assert key_b not in cache
+        assert key_c in cache
+        assert cache.stats.evictions == 1
+
+    def test_revalidated_extends_expired_entry(self, clock):
+        """Test that revalidation keeps data and parsed models with a new TTL."""
+        cache = ResponseCache(default_ttl=10.0, clock=clock)
+        key = cache.make_key("/warnings")
+        entry = cache.put(key, {"warnings": []}, etag='"abc"')
+        entry.parsed = ["model"]
+
+        clock.now = 15.0
+        assert cache.get(key) is None
+        assert cache.peek(key) is entry
+
+        cache.revalidated(key)
+        cached = cache.get(key)
+        assert cached is entry
+        assert cached.parsed == ["model"]
+        assert cached.etag == '"abc"'
+        assert cache.stats.revalidations == 1
+
+    def test_unchanged_takes_new_validators(self, clock):
+        """Test that an identical body keeps the entry under new validators."""
+        cache = ResponseCache(default_ttl=10.0, clock=clock)
+        key = cache.make_key("/warnings")
+        entry = cache.put(key, {"warnings": []}, etag='"abc"', body_hash=b"h")
+        entry.parsed = ["model"]
+
+        clock.now = 15.0
+        cache.unchanged(key, etag='"def"')
+        cached = cache.get(key)
+        assert cached is entry
+        assert cached.parsed == ["model"]
+        assert cached.etag == '"def"'
+        assert cached.body_hash == b"h"
+        assert cache.stats.unchanged_bodies == 1
+        assert cache.stats.revalidations == 0
+
+    def test_get_stale_within_window(self, clock):
+        """Test that expired entries are only returned inside the window."""
+        cache = ResponseCache(
+            ttls={"/warnings": 10.0}, clock=clock, stale_while_revalidate=5.0
+        )
+        key = cache.make_key("/warnings")
+        cache.put(key, {"warnings": []})
+
+        assert cache.get_stale(key) is None
+        clock.now = 12.0
+        assert cache.get(key) is None
+        assert cache.get_stale(key).data == {"warnings": []}
+        clock.now = 15.0
+        assert cache.get_stale(key) is None
+        assert cache.stats.stale_hits == 1
+
+    def test_get_stale_disabled_by_default(self, clock):
+        """Test that no stale entries are served without a window."""
+        cache = ResponseCache(ttls={"/warnings": 10.0}, clock=clock)
+        key = cache.make_key("/warnings")
+        cache.put(key, {"warnings": []})
+
+        clock.now = 10.0
+        assert cache.get_stale(key) is None
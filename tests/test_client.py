@@ -1,11 +1,22 @@
 """Tests for the DWD API client."""
 
-from unittest.mock import patch
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
-from dwd_mcp.client import DWDAPIError, DWDClient
-from dwd_mcp.models import StationData
+from dwd_mcp.cache import ResponseCache
+from dwd_mcp.client import (
+    CircuitOpenError,
+    DWDAPIError,
+    DWDClient,
+    PartialFetchError,
+)
+from dwd_mcp.models import StationData, WarningInfo
+from dwd_mcp.persistence import DiskCache
+from dwd_mcp.resilience import RetryPolicy
 
 
 class TestDWDClient:
@@ -101,6 +112,186 @@ class TestDWDClient:
             with pytest.raises(DWDAPIError, match="Failed to fetch weather stations"):
                 await client.get_weather_stations()
 
+    async def test_get_weather_stations_chunked(self):
+        """Test that long station lists are fetched in concurrent chunks."""
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ids = request.url.params["stationIds"].split(",")
+            requested.append(ids)
+            return httpx.Response(200, json=[{"stationId": i} for i in ids])
+
+        station_ids = [str(10000 + i) for i in range(7)]
+        async with DWDClient(
+            transport=httpx.MockTransport(handler), station_chunk_size=3
+        ) as client:
+            stations = await client.get_weather_stations(station_ids=station_ids)
+
+        assert sorted(requested) == [
+            station_ids[0:3],
+            station_ids[3:6],
+            station_ids[6:],
+        ]
+        assert [s.station.station_id for s in stations] == station_ids
+
+    async def test_get_weather_stations_partial_failure(self):
+        """Test that a failing chunk does not discard the other chunks."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ids = request.url.params["stationIds"].split(",")
+            if "10003" in ids:
+                return httpx.Response(404)
+            return httpx.Response(200, json=[{"stationId": i} for i in ids])
+
+        station_ids = [str(10000 + i) for i in range(6)]
+        async with DWDClient(
+            transport=httpx.MockTransport(handler), station_chunk_size=2
+        ) as client:
+            with pytest.raises(PartialFetchError) as exc_info:
+                await client.get_weather_stations(station_ids=station_ids)
+
+        assert exc_info.value.failed_ids == ["10002", "10003"]
+        assert [s.station.station_id for s in exc_info.value.results] == [
+            "10000",
+            "10001",
+            "10004",
+            "10005",
+        ]
+
+    async def test_get_weather_stations_all_chunks_fail(self):
+        """Test that a plain error is raised if every chunk fails."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404)
+
+        async with DWDClient(
+            transport=httpx.MockTransport(handler), station_chunk_size=1
+        ) as client:
+            with pytest.raises(DWDAPIError, match="Failed to fetch weather stations"):
+                await client.get_weather_stations(station_ids=["1", "2"])
+
+    async def test_get_weather_stations_partial_cache_hit(self):
+        """Test that only stations missing from the cache are fetched."""
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ids = request.url.params["stationIds"].split(",")
+            requested.append(ids)
+            return httpx.Response(200, json=[{"stationId": i} for i in ids])
+
+        async with DWDClient(transport=httpx.MockTransport(handler)) as client:
+            await client.get_weather_stations(station_ids=["10637", "10382"])
+            stations = await client.get_weather_stations(
+                station_ids=["10637", "10382", "10865"]
+            )
+            again = await client.get_weather_stations(station_ids=["10865", "10637"])
+
+        assert requested == [["10637", "10382"], ["10865"]]
+        assert [s.station.station_id for s in stations] == ["10637", "10382", "10865"]
+        assert [s.station.station_id for s in again] == ["10865", "10637"]
+
+    async def test_get_weather_stations_station_cache_expiry(self):
+        """Test that expired stations are fetched again."""
+        now = [0.0]
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ids = request.url.params["stationIds"].split(",")
+            requested.append(ids)
+            return httpx.Response(200, json=[{"stationId": i} for i in ids])
+
+        async with DWDClient(
+            transport=httpx.MockTransport(handler),
+            cache=ResponseCache(
+                ttls={"/stationOverviewExtended": 10.0}, clock=lambda: now[0]
+            ),
+        ) as client:
+            await client.get_weather_stations(station_ids=["10637"])
+            now[0] = 5.0
+            await client.get_weather_stations(station_ids=["10382"])
+            now[0] = 12.0
+            await client.get_weather_stations(station_ids=["10637", "10382"])
+
+        assert requested == [["10637"], ["10382"], ["10637"]]
+
+    async def test_stations_fetched_at(self):
+        """Test that stations are as old as the response they came with."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[{"stationId": "10637"}])
+
+        async with DWDClient(transport=httpx.MockTransport(handler)) as client:
+            await client.get_weather_stations()
+            fetched_at = client.stations_fetched_at(["10637", "99999"])
+            assert abs(time.time() - fetched_at.timestamp()) < 5
+            assert client.stations_fetched_at(["99999"]) is None
+
+            # Stations taken from a cached catalog keep the catalog's age
+            key = client.cache.make_key("/stationOverviewExtended")
+            client.cache.peek(key).fetched_at -= 60
+            client.station_cache.clear()
+            await client.get_weather_stations()
+            age = time.time() - client.stations_fetched_at(["10637"]).timestamp()
+            assert 59 < age < 65
+
+    async def test_get_weather_stations_all_warms_station_cache(
+        self, client, sample_station_response
+    ):
+        """Test that fetching all stations fills the per-station cache."""
+        with patch.object(client, "_make_request") as mock_request:
+            mock_request.return_value = [sample_station_response]
+
+            await client.get_weather_stations()
+            stations = await client.get_weather_stations(station_ids=["10382"])
+
+            assert [s.station.station_id for s in stations] == ["10382"]
+            mock_request.assert_called_once_with("/stationOverviewExtended", {})
+
+    async def test_get_weather_stations_by_region(self, sample_station_response):
+        """Test that regions resolve to stations through the state index."""
+        now = [0.0]
+        catalog = [
+            {**sample_station_response, "stationId": "10637", "state": "Hessen"},
+            {**sample_station_response, "stationId": "10870", "state": "Bayern"},
+            {**sample_station_response, "stationId": "10738", "state": "Hessen"},
+        ]
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            ids = request.url.params.get("stationIds")
+            if ids is None:
+                return httpx.Response(200, json=catalog)
+            wanted = ids.split(",")
+            return httpx.Response(
+                200, json=[s for s in catalog if s["stationId"] in wanted]
+            )
+
+        cache = ResponseCache(
+            ttls={"/stationOverviewExtended": 10.0}, clock=lambda: now[0]
+        )
+        async with DWDClient(
+            transport=httpx.MockTransport(handler), cache=cache
+        ) as client:
+
+            async def ids(**kwargs):
+                stations = await client.get_weather_stations(**kwargs)
+                return [s.station.station_id for s in stations]
+
+            assert await ids(region="hessen") == ["10637", "10738"]
+            assert await ids(region="Bavaria") == ["10870"]
+            assert await ids(region="HE", station_ids=["10738", "10870"]) == ["10738"]
+            with pytest.raises(ValueError, match="Unknown region: Atlantis"):
+                await ids(region="Atlantis")
+            assert len(requests) == 1
+
+            # The expired catalog still answers the lookup; only the expired
+            # stations of the region are fetched
+            now[0] = 11.0
+            assert await ids(region="BY") == ["10870"]
+            assert len(requests) == 2
+            assert requests[-1].url.params["stationIds"] == "10870"
+
     async def test_get_current_warnings_success(self, client, sample_warning_response):
         """Test successful warning data retrieval."""
         with patch.object(client, "_make_request") as mock_request:
@@ -146,6 +337,164 @@ class TestDWDClient:
             warnings = await client.get_current_warnings(region="München")
             assert len(warnings) == 0
 
+    async def test_get_current_warnings_isolates_invalid_records(
+        self, client, sample_warning_response, caplog
+    ):
+        """Test that one invalid record does not discard the valid ones."""
+        invalid = {**sample_warning_response, "warningId": "BAD", "level": "high"}
+        second = {**sample_warning_response, "warningId": "WARN002"}
+
+        with patch.object(client, "_make_request") as mock_request:
+            mock_request.return_value = [sample_warning_response, invalid, second]
+
+            warnings = await client.get_current_warnings()
+
+        assert [w.warning_id for w in warnings] == ["WARN001", "WARN002"]
+        assert "Failed to parse warning data" in caplog.text
+
+    async def test_get_weather_stations_mixed_formats(self, client):
+        """Test that wrapped and bare station records can be mixed."""
+        records = [
+            {"station": {"stationId": "10637"}, "measurements": []},
+            {"stationId": "10382"},
+            {"stationName": "missing id"},
+        ]
+
+        with patch.object(client, "_make_request") as mock_request:
+            mock_request.return_value = records
+
+            stations = await client.get_weather_stations()
+
+        assert [s.station.station_id for s in stations] == ["10637", "10382"]
+
+    @pytest.mark.parametrize(
+        ("region", "severity"),
+        [
+            (None, None),
+            (None, 1),
+            (None, 3),
+            ("Berlin", None),
+            ("Berlin", 2),
+            ("Bayern", 4),
+            ("Nowhere", None),
+        ],
+    )
+    async def test_get_current_warnings_prefilter_matches_full_validation(
+        self, client, sample_warning_response, region, severity
+    ):
+        """Test that pre-filtering raw records keeps the filter semantics."""
+        base = sample_warning_response
+        records = [
+            base,
+            {**base, "warningId": "W2", "level": 4, "regions": ["Bayern"]},
+            {**base, "warningId": "W3", "level": "3", "regions": ["Berlin"]},
+            {**base, "warningId": "W4", "level": 1.0},
+            {**base, "warningId": "W5", "regions": []},
+            {k: v for k, v in base.items() if k != "regions"} | {"warningId": "W6"},
+            {**base, "warningId": "W7", "level": 2.5},
+            {**base, "warningId": "W8", "regions": ["Berlin", 7]},
+            {**base, "warningId": "W9", "headline": None, "level": 4},
+            "not a warning",
+        ]
+        expected = [
+            w.warning_id
+            for w in DWDClient._parse_warnings(records)
+            if (severity is None or w.level >= severity)
+            and (not region or region in w.regions)
+        ]
+
+        with patch.object(client, "_make_request") as mock_request:
+            mock_request.return_value = records
+
+            warnings = await client.get_current_warnings(
+                region=region, severity=severity
+            )
+
+        assert [w.warning_id for w in warnings] == expected
+
+    async def test_get_current_warnings_skips_validating_filtered_records(
+        self, client, sample_warning_response, caplog
+    ):
+        """Test that records rejected by the filters are not validated."""
+        invalid_low = {**sample_warning_response, "level": 1, "headline": None}
+
+        with patch.object(client, "_make_request") as mock_request:
+            mock_request.return_value = [sample_warning_response, invalid_low]
+
+            warnings = await client.get_current_warnings(severity=2)
+
+        assert [w.warning_id for w in warnings] == ["WARN001"]
+        assert "Failed to parse warning data" not in caplog.text
+
+    async def test_get_current_warnings_region_index_reused(
+        self, sample_warning_response
+    ):
+        """Test that the region index is built once per feed snapshot."""
+        now = [0.0]
+        body = {"warnings": [sample_warning_response]}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=body)
+
+        cache = ResponseCache(
+            ttls={"/warnings_nowcast.json": 10.0}, clock=lambda: now[0]
+        )
+        async with DWDClient(
+            transport=httpx.MockTransport(handler), cache=cache
+        ) as client:
+            assert len(await client.get_current_warnings(region="berlin")) == 1
+            snapshot = client.snapshot("/warnings_nowcast.json")
+            index = snapshot.region_index
+
+            assert await client.get_current_warnings(region="Hessen") == []
+            assert len(await client.get_current_warnings(severity=2)) == 1
+            assert client.snapshot("/warnings_nowcast.json") is snapshot
+            assert snapshot.region_index is index
+
+            now[0] = 11.0
+            body["warnings"] = [{**sample_warning_response, "level": 4}]
+            await client.get_current_warnings(region="Berlin")
+            current = client.snapshot("/warnings_nowcast.json")
+            assert current.generation > snapshot.generation
+            assert current.region_index is not index
+            # Readers holding the previous snapshot keep a consistent view
+            assert snapshot.region_index is index
+
+    async def test_find_nearest_stations(self, sample_station_response):
+        """Test nearest-station lookup and reuse of the spatial index."""
+        munich = {
+            **sample_station_response,
+            "stationId": "10870",
+            "stationName": "München",
+            "lat": 48.1374,
+            "lon": 11.5755,
+        }
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=[sample_station_response, munich])
+
+        async with DWDClient(transport=httpx.MockTransport(handler)) as client:
+            nearest = await client.find_nearest_stations(48.0, 11.5, k=1)
+            index = client.snapshot("/stationOverviewExtended").spatial_index
+
+            assert [s.station.station_id for s, _ in nearest] == ["10870"]
+            assert nearest[0][1] == pytest.approx(16.3, abs=0.5)
+
+            within = await client.find_nearest_stations(48.0, 11.5, max_km=100)
+            assert [s.station.station_id for s, _ in within] == ["10870"]
+            assert client.snapshot("/stationOverviewExtended").spatial_index is index
+            assert len(requests) == 1
+
+    async def test_find_nearest_stations_error(self, client):
+        """Test that fetch errors are raised as DWDAPIError."""
+        with patch.object(client, "_make_request") as mock_request:
+            mock_request.side_effect = DWDAPIError("boom")
+
+            with pytest.raises(DWDAPIError, match="nearest stations"):
+                await client.find_nearest_stations(52.5, 13.4)
+
     async def test_get_crowd_reports_success(self, client):
         """Test successful crowd reports retrieval."""
         sample_report = {
@@ -173,6 +522,53 @@ class TestDWDClient:
 
             mock_request.assert_called_once_with("/crowd_meldungen_overview_v2.json")
 
+    async def test_get_crowd_reports_area_filters(self):
+        """Test region, bounding box and radius filters on crowd reports."""
+        reports = [
+            {
+                "reportId": report_id,
+                "lat": lat,
+                "lon": lon,
+                "weatherCondition": "sunny",
+                "timestamp": "2024-01-15T12:30:00Z",
+            }
+            for report_id, lat, lon in [
+                ("berlin", 52.52, 13.405),
+                ("potsdam", 52.39, 13.065),
+                ("munich", 48.137, 11.575),
+            ]
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"reports": reports})
+
+        async with DWDClient(transport=httpx.MockTransport(handler)) as client:
+
+            async def ids(**filters):
+                found = await client.get_crowd_reports(**filters)
+                return [r.report_id for r in found]
+
+            assert await ids() == ["berlin", "potsdam", "munich"]
+            assert await ids(region="Bavaria") == ["munich"]
+            assert await ids(region="by") == ["munich"]
+            assert await ids(bbox=(52.0, 12.0, 53.0, 14.0)) == ["berlin", "potsdam"]
+            assert await ids(lat=52.52, lon=13.4, radius_km=10) == ["berlin"]
+            assert await ids(lat=52.52, lon=13.4, radius_km=30) == [
+                "berlin",
+                "potsdam",
+            ]
+            assert await ids(region="Bayern", lat=52.52, lon=13.4, radius_km=30) == []
+
+            snapshot = client.snapshot("/crowd_meldungen_overview_v2.json")
+            assert "grid_index" in vars(snapshot)
+
+    async def test_get_crowd_reports_invalid_filters(self, client):
+        """Test that unknown regions and incomplete radius filters are rejected."""
+        with pytest.raises(ValueError, match="Unknown region"):
+            await client.get_crowd_reports(region="Atlantis")
+        with pytest.raises(ValueError, match="radius_km"):
+            await client.get_crowd_reports(lat=52.5, lon=13.4)
+
     async def test_make_request_http_error(self, client):
         """Test HTTP error handling in _make_request."""
         with patch.object(client.client, "get") as mock_get:
@@ -182,6 +578,577 @@ class TestDWDClient:
             with pytest.raises(DWDAPIError, match="Unexpected error fetching data"):
                 await client._make_request("/test")
 
+    async def test_make_request_uses_cache(self, client):
+        """Test that repeated requests are served from the response cache."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            return httpx.Response(200, json={"warnings": []})
+
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        first = await client._make_request("/warnings_nowcast.json")
+        second = await client._make_request("/warnings_nowcast.json")
+
+        assert first == second == {"warnings": []}
+        assert len(calls) == 1
+        assert client.cache.stats.hits == 1
+        assert client.cache.stats.misses == 1
+
+    async def test_make_request_cache_keyed_on_params(self, client):
+        """Test that different query parameters are cached separately."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.params["stationIds"])
+            return httpx.Response(200, json=[])
+
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await client._make_request("/stationOverviewExtended", {"stationIds": "1"})
+        await client._make_request("/stationOverviewExtended", {"stationIds": "2"})
+        await client._make_request("/stationOverviewExtended", {"stationIds": "1"})
+
+        assert calls == ["1", "2"]
+
+    async def test_make_request_errors_not_cached(self, client):
+        """Test that failed responses are not stored in the cache."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500)
+
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with pytest.raises(DWDAPIError):
+            await client._make_request("/warnings_nowcast.json")
+        assert len(client.cache) == 0
+
+    async def test_make_request_revalidates_with_etag(self, sample_warning_response):
+        """Test that expired entries are revalidated and reused on 304."""
+        now = [0.0]
+        seen_headers = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.append(dict(request.headers))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                json=[sample_warning_response],
+                headers={"ETag": '"v1"', "Last-Modified": "Mon, 15 Jan 2024"},
+            )
+
+        cache = ResponseCache(
+            ttls={"/warnings_nowcast.json": 10.0}, clock=lambda: now[0]
+        )
+        async with DWDClient(cache=cache) as client:
+            client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            first = await client.get_current_warnings()
+            now[0] = 11.0
+            second = await client.get_current_warnings()
+
+        assert len(seen_headers) == 2
+        assert "if-none-match" not in seen_headers[0]
+        assert seen_headers[1]["if-none-match"] == '"v1"'
+        assert seen_headers[1]["if-modified-since"] == "Mon, 15 Jan 2024"
+        assert cache.stats.revalidations == 1
+        # The parsed models are reused rather than validated again
+        assert second[0] is first[0]
+
+    async def test_make_request_replaces_modified_entry(self, client):
+        """Test that a changed document replaces the cached entry."""
+        now = [0.0]
+        bodies = iter([{"version": 1}, {"version": 2}])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=next(bodies), headers={"ETag": '"x"'})
+
+        client.cache = ResponseCache(default_ttl=10.0, clock=lambda: now[0])
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert await client._make_request("/test") == {"version": 1}
+        now[0] = 11.0
+        assert await client._make_request("/test") == {"version": 2}
+        assert client.cache.stats.revalidations == 0
+
+    async def test_warnings_ingested_incrementally(self, sample_warning_response):
+        """Test that only new and changed warnings are validated again."""
+        now = [0.0]
+        kept = {**sample_warning_response, "warningId": "kept"}
+        changed = {**sample_warning_response, "warningId": "changed"}
+        gone = {**sample_warning_response, "warningId": "gone"}
+        bodies = iter(
+            [
+                {"warnings": [kept, changed, gone]},
+                {
+                    "warnings": [
+                        {**sample_warning_response, "warningId": "new"},
+                        {**kept},
+                        {**changed, "level": 4},
+                    ]
+                },
+            ]
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=next(bodies))
+
+        cache = ResponseCache(
+            ttls={"/warnings_nowcast.json": 10.0}, clock=lambda: now[0]
+        )
+        async with DWDClient(
+            transport=httpx.MockTransport(handler), cache=cache
+        ) as client:
+            first = {w.warning_id: w for w in await client.get_current_warnings()}
+            now[0] = 11.0
+            with patch.object(
+                WarningInfo, "model_validate", wraps=WarningInfo.model_validate
+            ) as validate:
+                second = await client.get_current_warnings()
+
+        assert [w.warning_id for w in second] == ["new", "kept", "changed"]
+        assert validate.call_count == 2
+        assert second[1] is first["kept"]
+        assert second[2].level == 4
+
+    async def test_make_request_reuses_identical_body(self, sample_warning_response):
+        """Test that an unchanged body is neither decoded nor parsed again."""
+        now = [0.0]
+        bodies = iter([[sample_warning_response]] * 2 + [[]])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=next(bodies))
+
+        cache = ResponseCache(
+            ttls={"/warnings_nowcast.json": 10.0}, clock=lambda: now[0]
+        )
+        async with DWDClient(cache=cache) as client:
+            client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            first = await client.get_current_warnings()
+            snapshot = client.snapshot("/warnings_nowcast.json")
+            now[0] = 11.0
+            with (
+                patch.object(client, "json_decoder", side_effect=AssertionError),
+                patch.object(DWDClient, "_parse_warnings", side_effect=AssertionError),
+            ):
+                second = await client.get_current_warnings()
+            assert client.snapshot("/warnings_nowcast.json") is snapshot
+            assert cache.stats.unchanged_bodies == 1
+
+            now[0] = 22.0
+            assert await client.get_current_warnings() == []
+            assert cache.stats.unchanged_bodies == 1
+
+        assert second[0] is first[0]
+
+    async def test_make_request_coalesces_concurrent_calls(self, client):
+        """Test that concurrent identical requests share one upstream fetch."""
+        calls = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"warnings": []})
+
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        results = await asyncio.gather(
+            *(client._make_request("/warnings_nowcast.json") for _ in range(5))
+        )
+
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+
+    async def test_stale_while_revalidate(self):
+        """Test that stale data is served while one background fetch runs."""
+        now = [0.0]
+        version = [0]
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            version[0] += 1
+            if version[0] > 1:
+                await release.wait()
+            return httpx.Response(200, json={"version": version[0]})
+
+        cache = ResponseCache(
+            ttls={"/data": 10.0}, clock=lambda: now[0], stale_while_revalidate=5.0
+        )
+        async with DWDClient(
+            transport=httpx.MockTransport(handler), cache=cache
+        ) as client:
+            assert await client._make_request("/data") == {"version": 1}
+
+            # Inside the window stale data is returned without waiting, and
+            # concurrent callers share one background refresh
+            now[0] = 12.0
+            results = await asyncio.gather(
+                *(client._make_request("/data") for _ in range(5))
+            )
+            assert results == [{"version": 1}] * 5
+            assert version[0] == 2
+
+            release.set()
+            await asyncio.sleep(0.01)
+            assert await client._make_request("/data") == {"version": 2}
+
+            # Past the window callers wait for the upstream
+            now[0] = 30.0
+            assert await client._make_request("/data") == {"version": 3}
+
+    async def test_stale_while_revalidate_failed_refresh(self, caplog):
+        """Test that a failed background refresh keeps the stale entry."""
+        now = [0.0]
+        responses = [httpx.Response(200, json={"ok": True}), httpx.Response(404)]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return responses.pop(0)
+
+        cache = ResponseCache(
+            ttls={"/data": 10.0}, clock=lambda: now[0], stale_while_revalidate=5.0
+        )
+        async with DWDClient(
+            transport=httpx.MockTransport(handler), cache=cache
+        ) as client:
+            await client._make_request("/data")
+            now[0] = 11.0
+            assert await client._make_request("/data") == {"ok": True}
+            await asyncio.sleep(0.01)
+
+            assert cache.peek(cache.make_key("/data")).data == {"ok": True}
+        assert "Background refresh failed" in caplog.text
+
+    async def test_disk_cache_warm_restart(self, tmp_path):
+        """Test that a new client serves or revalidates stored responses."""
+        now = [0.0]
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"warnings": []}, headers={"ETag": '"v1"'})
+
+        def make_client():
+            cache = ResponseCache(
+                ttls={"/warnings_nowcast.json": 60.0}, clock=lambda: now[0]
+            )
+            return DWDClient(
+                transport=httpx.MockTransport(handler),
+                cache=cache,
+                disk_cache=DiskCache(tmp_path),
+            )
+
+        async with make_client() as client:
+            await client._make_request("/warnings_nowcast.json")
+            await client._make_request("/stationOverviewExtended", {"stationIds": "1"})
+
+        # A fresh stored response is served without a request
+        async with make_client() as client:
+            data = await client._make_request("/warnings_nowcast.json")
+            assert data == {"warnings": []}
+            assert len(requests) == 2
+
+        # An expired stored response is revalidated instead of downloaded
+        with patch("dwd_mcp.persistence.time.time", return_value=time.time() + 120):
+            async with make_client() as client:
+                data = await client._make_request("/warnings_nowcast.json")
+                assert data == {"warnings": []}
+                assert requests[-1].headers["If-None-Match"] == '"v1"'
+                assert len(requests) == 3
+
+        # Requests with parameters are not stored
+        assert (
+            DiskCache(tmp_path).load(
+                ResponseCache.make_key("/stationOverviewExtended", {"stationIds": "1"})
+            )
+            is None
+        )
+
+    async def test_unchanged_body_stores_new_validators(self, tmp_path):
+        """Test that an identical body under a new ETag updates the store."""
+        now = [0.0]
+        etags = iter(['"v1"', '"v2"'])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, json={"warnings": []}, headers={"ETag": next(etags)}
+            )
+
+        async with DWDClient(
+            transport=httpx.MockTransport(handler),
+            cache=ResponseCache(
+                ttls={"/warnings_nowcast.json": 10.0}, clock=lambda: now[0]
+            ),
+            disk_cache=DiskCache(tmp_path),
+        ) as client:
+            await client._make_request("/warnings_nowcast.json")
+            now[0] = 11.0
+            await client._make_request("/warnings_nowcast.json")
+            assert client.cache.stats.unchanged_bodies == 1
+
+        stored = DiskCache(tmp_path).load(
+            ResponseCache.make_key("/warnings_nowcast.json")
+        )
+        assert stored.etag == '"v2"'
+
+    async def test_reload_responses_stored_by_another_process(self, tmp_path):
+        """Test that newer stored responses replace or confirm cached ones."""
+        key = ResponseCache.make_key("/warnings_nowcast.json")
+        store = DiskCache(tmp_path)
+        failing = httpx.MockTransport(lambda request: httpx.Response(500))
+
+        async with DWDClient(
+            transport=failing, disk_cache=DiskCache(tmp_path)
+        ) as client:
+            assert client.reload("/warnings_nowcast.json") is False
+
+            now = time.time()
+            store.save(key, b'{"warnings": []}', etag='"v1"', fetched_at=now - 10)
+            assert client.reload("/warnings_nowcast.json") is True
+            entry = client.cache.peek(key)
+            assert entry.data == {"warnings": []}
+            assert client.reload("/warnings_nowcast.json") is False
+
+            # The same ETag only renews the entry, keeping its snapshot
+            await client.get_current_warnings()
+            snapshot = client.snapshot("/warnings_nowcast.json")
+            store.touch(key, fetched_at=now)
+            assert client.reload("/warnings_nowcast.json") is True
+            assert client.cache.peek(key) is entry
+            assert entry.fetched_at == now
+            assert client.snapshot("/warnings_nowcast.json") is snapshot
+
+            store.save(key, b'{"warnings": [], "v": 2}', fetched_at=now + 1)
+            assert client.reload("/warnings_nowcast.json") is True
+            assert client.cache.peek(key).data == {"warnings": [], "v": 2}
+
+    async def test_custom_transport_and_timeouts(self):
+        """Test that transport, timeouts and pool limits are configurable."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"ok": True})
+
+        async with DWDClient(
+            transport=httpx.MockTransport(handler),
+            connect_timeout=1.0,
+            read_timeout=5.0,
+            pool_timeout=2.0,
+        ) as client:
+            assert client.client.timeout.connect == 1.0
+            assert client.client.timeout.read == 5.0
+            assert client.client.timeout.pool == 2.0
+            assert await client._make_request("/test") == {"ok": True}
+
+    async def test_make_request_retries_transient_errors(self):
+        """Test that transient failures are retried with backoff."""
+        responses = iter(
+            [
+                httpx.Response(502),
+                httpx.Response(503, headers={"Retry-After": "2"}),
+                httpx.Response(200, json={"ok": True}),
+            ]
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return next(responses)
+
+        async with DWDClient(
+            transport=httpx.MockTransport(handler),
+            retry_policy=RetryPolicy(max_attempts=3, base_delay=0.1),
+        ) as client:
+            with patch("dwd_mcp.client.asyncio.sleep", new=AsyncMock()) as sleep:
+                assert await client._make_request("/test") == {"ok": True}
+
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert len(delays) == 2
+        assert 0 <= delays[0] <= 0.1
+        assert delays[1] == 2.0
+
+    async def test_make_request_does_not_retry_client_errors(self):
+        """Test that non-transient errors fail without retrying."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(404)
+
+        async with DWDClient(transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(DWDAPIError, match="Failed to fetch data"):
+                await client._make_request("/test")
+
+        assert calls == 1
+
+    async def test_circuit_breaker_fails_fast(self):
+        """Test that an open circuit stops requests to a failing endpoint."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            raise httpx.ConnectError("connection refused")
+
+        async with DWDClient(
+            transport=httpx.MockTransport(handler),
+            retry_policy=RetryPolicy(max_attempts=1),
+            breaker_failure_threshold=2,
+        ) as client:
+            for _ in range(2):
+                with pytest.raises(DWDAPIError, match="Failed to fetch data"):
+                    await client._make_request("/test")
+
+            with pytest.raises(CircuitOpenError):
+                await client._make_request("/test")
+
+            # Other endpoints have their own circuit
+            with pytest.raises(DWDAPIError, match="Failed to fetch data"):
+                await client._make_request("/other")
+
+        assert calls == 3
+
+    async def test_circuit_breaker_opens_on_server_errors(self):
+        """Test that a persistent 500 opens the circuit like other failures."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(500)
+
+        async with DWDClient(
+            transport=httpx.MockTransport(handler),
+            cache=ResponseCache(default_ttl=0.0),
+            breaker_failure_threshold=2,
+        ) as client:
+            for _ in range(2):
+                with pytest.raises(DWDAPIError, match="Failed to fetch data"):
+                    await client._make_request("/test")
+            for _ in range(3):
+                with pytest.raises(CircuitOpenError):
+                    await client._make_request("/test")
+            # Streamed requests count server errors too
+            for _ in range(2):
+                with pytest.raises(DWDAPIError, match="Failed to fetch data"):
+                    [i async for i in client._stream_items("/stream", None, ())]
+            with pytest.raises(CircuitOpenError):
+                [i async for i in client._stream_items("/stream", None, ())]
+
+        assert calls == 4
+
+    async def test_cancelled_stream_ends_half_open_trial(self):
+        """Test that a stream cancelled before its response frees the circuit."""
+        upstream_up = False
+        requested = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requested.set()
+            if not upstream_up:
+                await asyncio.Event().wait()
+            return httpx.Response(200, json={"warnings": []})
+
+        async with DWDClient(
+            transport=httpx.MockTransport(handler),
+            breaker_failure_threshold=1,
+            breaker_reset_timeout=0.05,
+        ) as client:
+            client.circuit_breaker("/test").record_failure()
+            await asyncio.sleep(0.1)
+
+            async def consume() -> None:
+                [i async for i in client._stream_items("/test", None, ("warnings",))]
+
+            task = asyncio.create_task(consume())
+            await requested.wait()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+            upstream_up = True
+            await asyncio.sleep(0.1)
+            assert await client._make_request("/test") == {"warnings": []}
+
+    async def test_circuit_breaker_serves_stale_data(self):
+        """Test that stale cached data is served while the circuit is open."""
+        now = [0.0]
+        upstream_up = True
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if upstream_up:
+                return httpx.Response(200, json={"version": 1})
+            return httpx.Response(503)
+
+        async with DWDClient(
+            transport=httpx.MockTransport(handler),
+            cache=ResponseCache(default_ttl=10.0, clock=lambda: now[0]),
+            retry_policy=RetryPolicy(max_attempts=1),
+            breaker_failure_threshold=1,
+        ) as client:
+            assert await client._make_request("/test") == {"version": 1}
+
+            upstream_up = False
+            now[0] = 11.0
+            with pytest.raises(DWDAPIError):
+                await client._make_request("/test")
+            assert await client._make_request("/test") == {"version": 1}
+
+    async def test_iter_weather_stations(self):
+        """Test that stations are streamed and validated one at a time."""
+        document = {
+            "stations": [{"stationId": "10637"}, {"bad": 1}, {"stationId": "1"}]
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=document)
+
+        async with DWDClient(transport=httpx.MockTransport(handler)) as client:
+            stations = [s async for s in client.iter_weather_stations()]
+
+        assert [s.station.station_id for s in stations] == ["10637", "1"]
+
+    async def test_iter_current_warnings_filters(self, sample_warning_response):
+        """Test that streamed warnings are filtered like the list variant."""
+        low = {**sample_warning_response, "warningId": "LOW", "level": 1}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[low, sample_warning_response])
+
+        async with DWDClient(transport=httpx.MockTransport(handler)) as client:
+            warnings = [w async for w in client.iter_current_warnings(severity=2)]
+
+        assert [w.warning_id for w in warnings] == ["WARN001"]
+
+    async def test_iter_crowd_reports_malformed(self):
+        """Test that a truncated document raises DWDAPIError."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b'[{"reportId": "CR001", ')
+
+        async with DWDClient(transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(DWDAPIError, match="Malformed response"):
+                [r async for r in client.iter_crowd_reports()]
+
+    async def test_custom_json_decoder(self):
+        """Test that response bodies are decoded with the configured decoder."""
+        bodies = []
+
+        def decode(body: bytes) -> dict:
+            bodies.append(body)
+            return {"decoded": True}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b'{"raw": true}')
+
+        async with DWDClient(
+            transport=httpx.MockTransport(handler), json_decoder=decode
+        ) as client:
+            assert await client._make_request("/test") == {"decoded": True}
+
+        assert bodies == [b'{"raw": true}']
+
     async def test_context_manager(self):
         """Test client as async context manager."""
         async with DWDClient() as client:
@@ -0,0 +1,110 @@
+"""Tests for the server configuration."""
+
+import pytest
+
+from dwd_mcp.config import ServerConfig
+from dwd_mcp.daemon import DaemonTransport
+
+
+class TestServerConfig:
+    """Tests for ServerConfig."""
+
+    def test_defaults(self):
+        """Test that an empty environment yields the defaults."""
+        config = ServerConfig.from_env({})
+
+        assert config == ServerConfig()
+        assert config.http2 is False
+
+    def test_from_env(self):
+        """Test that environment variables override the defaults."""
+        config = ServerConfig.from_env(
+            {
+                "DWD_MCP_BASE_URL": "http://localhost:8080",
+                "DWD_MCP_MAX_CONNECTIONS": "none",
+                "DWD_MCP_MAX_KEEPALIVE_CONNECTIONS": "5",
+                "DWD_MCP_KEEPALIVE_EXPIRY": "30",
+                "DWD_MCP_CONNECT_TIMEOUT": "2.5",
+                "DWD_MCP_HTTP2": "true",
+                "DWD_MCP_RETRY_ATTEMPTS": "5",
+                "UNRELATED": "ignored",
+            }
+        )
+
+        assert config.base_url == "http://localhost:8080"
+        assert config.max_connections is None
+        assert config.max_keepalive_connections == 5
+        assert config.keepalive_expiry == 30.0
+        assert config.connect_timeout == 2.5
+        assert config.read_timeout == 30.0
+        assert config.http2 is True
+        assert config.retry_attempts == 5
+
+    def test_http_transport(self):
+        """Test that the transport and its address are configurable."""
+        config = ServerConfig.from_env(
+            {
+                "DWD_MCP_TRANSPORT": "http",
+                "DWD_MCP_HTTP_HOST": "0.0.0.0",
+                "DWD_MCP_HTTP_PORT": "9000",
+            }
+        )
+
+        assert config.transport == "http"
+        assert config.http_host == "0.0.0.0"
+        assert config.http_port == 9000
+
+    def test_invalid_value(self):
+        """Test that malformed values name the offending variable."""
+        with pytest.raises(ValueError, match="DWD_MCP_READ_TIMEOUT"):
+            ServerConfig.from_env({"DWD_MCP_READ_TIMEOUT": "soon"})
+
+    async def test_create_client(self):
+        """Test that the client is built with the configured settings."""
+        config = ServerConfig(base_url="http://localhost:8080/", read_timeout=7.0)
+
+        client = config.create_client()
+        try:
+            assert client.base_url == "http://localhost:8080"
+            assert client.client.timeout.read == 7.0
+        finally:
+            await client.close()
+
+    async def test_create_poller(self):
+        """Test that a poller is only created for feeds with an interval."""
+        client = ServerConfig().create_client()
+        try:
+            assert ServerConfig().create_poller(client) is None
+
+            config = ServerConfig.from_env({"DWD_MCP_POLL_WARNINGS_INTERVAL": "30"})
+            poller = config.create_poller(client)
+            assert poller.intervals == {"/warnings_nowcast.json": 30.0}
+        finally:
+            await client.close()
+
+    async def test_create_client_with_disk_cache(self, tmp_path):
+        """Test that a cache directory enables the disk cache."""
+        config = ServerConfig.from_env({"DWD_MCP_CACHE_DIR": str(tmp_path)})
+
+        client = config.create_client()
+        try:
+            assert client.disk_cache.path.parent == tmp_path
+        finally:
+            await client.close()
+
+    async def test_create_client_with_fetch_daemon(self, tmp_path):
+        """Test that the fetch daemon option routes requests through it."""
+        config = ServerConfig.from_env(
+            {
+                "DWD_MCP_FETCH_DAEMON": "1",
+                "DWD_MCP_DAEMON_SOCKET": str(tmp_path / "d.sock"),
+            }
+        )
+
+        client = config.create_client()
+        try:
+            transport = client.client._transport
+            assert isinstance(transport, DaemonTransport)
+            assert transport.socket_path == tmp_path / "d.sock"
+        finally:
+            await client.close()
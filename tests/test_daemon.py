@@ -0,0 +1,254 @@
+"""Tests for the shared fetch daemon."""
+
+import asyncio
+import json
+import os
+import stat
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from dwd_mcp.client import DWDAPIError, DWDClient
+from dwd_mcp.daemon import DaemonTransport, FetchDaemon, default_socket_path
+from dwd_mcp.resilience import RetryPolicy
+
+BODY = {"warnings": [], "time": 1}
+
+
+@pytest.fixture
+def upstream():
+    """Count requests to a stand-in upstream serving a fixed body."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        if request.url.path == "/unavailable":
+            return httpx.Response(503)
+        return httpx.Response(200, json=BODY)
+
+    return requests, httpx.MockTransport(handler)
+
+
+@pytest.fixture
+async def daemon(tmp_path, upstream):
+    """Run a fetch daemon on a socket in a temporary directory."""
+    _, transport = upstream
+    client = DWDClient(
+        transport=transport,
+        json_decoder=bytes,
+        retry_policy=RetryPolicy(max_attempts=3, base_delay=0.0),
+    )
+    daemon = FetchDaemon(client, tmp_path / "d.sock", idle_timeout=0)
+    task = asyncio.create_task(daemon.serve())
+    while not daemon.socket_path.exists():
+        await asyncio.sleep(0.01)
+    yield daemon
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await client.close()
+
+
+class TestFetchDaemon:
+    """Tests for FetchDaemon and DaemonTransport."""
+
+    async def test_processes_share_one_upstream_fetch(self, daemon, upstream):
+        """Test that clients of one daemon share its cached responses."""
+        requests, _ = upstream
+        clients = [
+            DWDClient(transport=DaemonTransport(daemon.socket_path, spawn=False))
+            for _ in range(3)
+        ]
+        try:
+            results = [await c._make_request("/warnings_nowcast.json") for c in clients]
+        finally:
+            for client in clients:
+                await client.close()
+
+        assert results == [BODY] * 3
+        assert len(requests) == 1
+        assert daemon.requests == 3
+
+    async def test_revalidation_against_daemon(self, daemon, upstream):
+        """Test that copies matching the daemon's are confirmed with a 304."""
+        transport = DaemonTransport(daemon.socket_path, spawn=False)
+        async with httpx.AsyncClient(transport=transport) as http:
+            first = await http.get("http://dwd/warnings_nowcast.json")
+            etag = first.headers["ETag"]
+            second = await http.get(
+                "http://dwd/warnings_nowcast.json", headers={"If-None-Match": etag}
+            )
+            failed = await http.get("http://dwd/missing")
+
+        assert json.loads(first.content) == BODY
+        assert second.status_code == 304
+        assert second.content == b""
+        assert failed.status_code == 404
+
+    async def test_failures_are_not_retried_again(self, daemon, upstream):
+        """Test that clients pass on failures the daemon has retried."""
+        requests, _ = upstream
+        async with DWDClient(
+            transport=DaemonTransport(daemon.socket_path, spawn=False),
+            retry_policy=RetryPolicy(max_attempts=3, base_delay=0.0),
+        ) as client:
+            with pytest.raises(DWDAPIError, match="404"):
+                await client._make_request("/missing")
+            assert len(requests) == 1
+
+            with pytest.raises(DWDAPIError, match="503"):
+                await client._make_request("/unavailable")
+            assert len(requests) == 4
+
+    async def test_base_url_with_path(self, tmp_path):
+        """Test that the base URL's path is not applied twice."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            return httpx.Response(200, json=BODY)
+
+        base_url = "http://dwd/api/v1"
+        async with DWDClient(
+            base_url=base_url,
+            transport=httpx.MockTransport(handler),
+            json_decoder=bytes,
+        ) as upstream_client:
+            daemon = FetchDaemon(upstream_client, tmp_path / "d.sock", idle_timeout=0)
+            task = asyncio.create_task(daemon.serve())
+            while not daemon.socket_path.exists():
+                await asyncio.sleep(0.01)
+            try:
+                transport = DaemonTransport(
+                    daemon.socket_path, base_url=base_url, spawn=False
+                )
+                async with DWDClient(base_url=base_url, transport=transport) as client:
+                    assert await client.fetch("/warnings_nowcast.json") == BODY
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+        assert requests == ["/api/v1/warnings_nowcast.json"]
+        assert daemon.requests == 1
+
+    async def test_second_daemon_exits(self, daemon):
+        """Test that only one daemon serves a socket."""
+        other = FetchDaemon(daemon.client, daemon.socket_path)
+
+        await asyncio.wait_for(other.serve(), timeout=1)
+        assert daemon.socket_path.exists()
+
+    async def test_idle_daemon_exits(self, tmp_path, upstream):
+        """Test that the daemon exits and removes its socket when idle."""
+        _, transport = upstream
+        async with DWDClient(transport=transport, json_decoder=bytes) as client:
+            daemon = FetchDaemon(client, tmp_path / "d.sock", idle_timeout=0.1)
+            await asyncio.wait_for(daemon.serve(), timeout=2)
+
+        assert not daemon.socket_path.exists()
+
+    async def test_fallback_to_direct_fetch(self, tmp_path, upstream, caplog):
+        """Test that requests go upstream directly without a daemon."""
+        requests, direct = upstream
+        transport = DaemonTransport(
+            tmp_path / "none.sock", spawn=False, retry_interval=60, fallback=direct
+        )
+        async with DWDClient(
+            transport=transport, cache_ttls={"/warnings_nowcast.json": 0}
+        ) as client:
+            assert await client._make_request("/warnings_nowcast.json") == BODY
+            assert await client._make_request("/warnings_nowcast.json") == BODY
+
+        assert len(requests) == 2
+        assert caplog.text.count("Fetch daemon unavailable") == 1
+
+    async def test_daemon_of_other_user_not_trusted(
+        self, daemon, upstream, caplog, monkeypatch
+    ):
+        """Test that a socket served by another user is bypassed."""
+        requests, direct = upstream
+        monkeypatch.setattr(
+            "dwd_mcp.daemon._peer_uid", lambda writer, path: os.getuid() + 1
+        )
+        transport = DaemonTransport(daemon.socket_path, spawn=False, fallback=direct)
+        async with DWDClient(transport=transport) as client:
+            assert await client._make_request("/warnings_nowcast.json") == BODY
+
+        assert daemon.requests == 0
+        assert len(requests) == 1
+        assert "served by user" in caplog.text
+
+    async def test_default_socket_in_private_directory(
+        self, tmp_path, upstream, monkeypatch
+    ):
+        """Test that without a runtime directory the socket is kept private."""
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        socket_path = default_socket_path()
+        assert socket_path.parent == tmp_path / f"dwd-mcp-{os.getuid()}"
+
+        _, transport = upstream
+        async with DWDClient(transport=transport, json_decoder=bytes) as client:
+            daemon = FetchDaemon(client, socket_path, idle_timeout=0.1)
+            await asyncio.wait_for(daemon.serve(), timeout=2)
+
+        assert stat.S_IMODE(os.stat(socket_path.parent).st_mode) == 0o700
+
+
+class TestDaemonSpawn:
+    """Tests for starting the daemon on first use."""
+
+    @pytest.fixture
+    def standin(self):
+        """Serve a fixed JSON body over real HTTP from a thread."""
+        hits = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                body = json.dumps(BODY).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_port}", hits
+        server.shutdown()
+
+    async def test_spawn_on_first_use(self, tmp_path, standin, monkeypatch):
+        """Test that a daemon process is started and then shared."""
+        base_url, hits = standin
+        monkeypatch.setenv("DWD_MCP_BASE_URL", base_url)
+        socket_path = tmp_path / "d.sock"
+
+        first = DaemonTransport(socket_path, spawn_timeout=20)
+        second = DaemonTransport(socket_path, spawn=False)
+        try:
+            async with DWDClient(base_url=base_url, transport=first) as client:
+                assert await client._make_request("/warnings_nowcast.json") == BODY
+            async with DWDClient(base_url=base_url, transport=second) as client:
+                assert await client._make_request("/warnings_nowcast.json") == BODY
+
+            assert first.process is not None
+            assert hits == ["/warnings_nowcast.json"]
+
+            # The exited daemon is reaped without waiting for it here
+            first.process.terminate()
+            async with asyncio.timeout(10):
+                while first.process.returncode is None:
+                    await asyncio.sleep(0.05)
+        finally:
+            if first.process is not None:
+                first.process.terminate()
+                first.process.wait(timeout=10)
@@ -0,0 +1,42 @@
+"""Tests for the JSON decoder selection."""
+
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from dwd_mcp.decoders import get_json_decoder
+
+DOCUMENT = {"warnings": [{"headline": "Sturmböen ☂", "level": 2, "end": None}]}
+RAW = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+
+
+class TestGetJsonDecoder:
+    """Tests for get_json_decoder."""
+
+    @pytest.mark.parametrize("name", ["auto", "json", "orjson", "msgspec"])
+    def test_decodes_bytes(self, name):
+        """Test that every available decoder parses raw UTF-8 bytes."""
+        if name in ("orjson", "msgspec"):
+            pytest.importorskip(name)
+
+        assert get_json_decoder(name)(RAW) == DOCUMENT
+
+    def test_auto_falls_back_to_stdlib(self):
+        """Test that auto selection works without any fast library."""
+        with patch.dict(sys.modules, {"orjson": None, "msgspec": None}):
+            decoder = get_json_decoder("auto")
+
+        assert decoder is json.loads
+
+    def test_missing_library(self):
+        """Test that explicitly requesting a missing library fails."""
+        with patch.dict(sys.modules, {"orjson": None}):
+            with pytest.raises(ImportError):
+                get_json_decoder("orjson")
+
+    def test_unknown_decoder(self):
+        """Test that unknown decoder names are rejected."""
+        with pytest.raises(ValueError, match="Unknown JSON decoder"):
+            get_json_decoder("yaml")
@@ -0,0 +1,56 @@
+"""Tests for feed snapshots."""
+
+import dataclasses
+
+import pytest
+
+from dwd_mcp.feeds import StationSnapshot, WarningSnapshot, next_generation
+from dwd_mcp.models import StationData, StationInfo, WarningInfo
+
+
+class TestFeedSnapshot:
+    """Tests for FeedSnapshot and its feed-specific subclasses."""
+
+    def test_immutable_with_lazy_indexes(self):
+        """Test that snapshots cannot change and build indexes once."""
+        warning = WarningInfo(
+            warningId="W1",
+            level=2,
+            type="THUNDER",
+            headline="Thunderstorm Warning",
+            description="Severe thunderstorms expected",
+            startTime="2024-01-15T14:00:00Z",
+            regions=["Berlin"],
+        )
+        snapshot = WarningSnapshot(
+            endpoint="/warnings_nowcast.json",
+            generation=next_generation(),
+            data={},
+            models=(warning,),
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.generation = 0  # type: ignore[misc]
+        assert "region_index" not in vars(snapshot)
+        assert snapshot.region_index.query("berlin", None) == [warning]
+        assert snapshot.region_index is snapshot.region_index
+
+    def test_station_indexes(self):
+        """Test the spatial and state indexes of a station snapshot."""
+        station = StationData(
+            station=StationInfo(stationId="10382", lat=52.47, lon=13.40, state="Berlin")
+        )
+        snapshot = StationSnapshot(
+            endpoint="/stationOverviewExtended",
+            generation=next_generation(),
+            data=[],
+            models=(station,),
+        )
+
+        assert snapshot.spatial_index.nearest(52.5, 13.4, k=1)[0][0] is station
+        assert snapshot.state_index.station_ids("BE") == ["10382"]
+
+    def test_generations_increase(self):
+        """Test that every generation is higher than the previous one."""
+        first = next_generation()
+        assert next_generation() > first
@@ -0,0 +1,233 @@
+"""Tests for the snapshot indexes."""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from dwd_mcp import indexes
+from dwd_mcp.indexes import (
+    CrowdReportGridIndex,
+    StationSpatialIndex,
+    WarningRegionIndex,
+    haversine_km,
+    normalize_region,
+    radius_bbox,
+    warning_matches,
+)
+from dwd_mcp.models import CrowdReport, StationData, StationInfo, WarningInfo
+
+REGIONS = ["Berlin", "Brandenburg", "Bayern", "Kreis München", "Hessen"]
+
+
+def make_warning(warning_id: str, level: int, regions: list[str]) -> WarningInfo:
+    """Create a warning with the given level and regions."""
+    return WarningInfo(
+        warningId=warning_id,
+        level=level,
+        type="THUNDER",
+        headline="Thunderstorm Warning",
+        description="Severe thunderstorms expected",
+        startTime=datetime(2024, 1, 15, 14),
+        regions=regions,
+    )
+
+
+def make_station(station_id: str, lat: float | None, lon: float | None) -> StationData:
+    """Create a station at the given coordinates."""
+    return StationData(station=StationInfo(stationId=station_id, lat=lat, lon=lon))
+
+
+def make_report(report_id: str, lat: float, lon: float) -> CrowdReport:
+    """Create a crowd report at the given coordinates."""
+    return CrowdReport(
+        reportId=report_id,
+        lat=lat,
+        lon=lon,
+        weatherCondition="sunny",
+        timestamp=datetime(2024, 1, 15, 12),
+    )
+
+
+class TestWarningRegionIndex:
+    """Tests for WarningRegionIndex."""
+
+    @pytest.fixture
+    def warnings(self):
+        """Create a random but reproducible set of warnings."""
+        rng = random.Random(42)
+        return [
+            make_warning(
+                f"W{i}", rng.randint(1, 4), rng.sample(REGIONS, rng.randint(0, 3))
+            )
+            for i in range(200)
+        ]
+
+    @pytest.mark.parametrize("region", [None, *REGIONS, "kreis münchen ", "Nowhere"])
+    @pytest.mark.parametrize("severity", [None, 1, 2, 3, 4])
+    def test_query_matches_linear_scan(self, warnings, region, severity):
+        """Test that index queries equal a filter over all warnings."""
+        index = WarningRegionIndex(warnings)
+
+        expected = [w for w in warnings if warning_matches(w, region, severity)]
+        assert index.query(region, severity) == expected
+
+    def test_duplicate_regions_listed_once(self):
+        """Test that a warning naming a region twice is returned once."""
+        warning = make_warning("W1", 2, ["Berlin", "berlin"])
+        index = WarningRegionIndex([warning])
+
+        assert index.query("BERLIN") == [warning]
+
+    def test_normalize_region(self):
+        """Test that normalization ignores case, whitespace and composition."""
+        composed = "M\u00fcnchen"
+        decomposed = "Mu\u0308nchen"
+
+        assert normalize_region(f"  {decomposed.upper()} ") == normalize_region(
+            composed
+        )
+
+
+class TestStationSpatialIndex:
+    """Tests for StationSpatialIndex."""
+
+    @pytest.fixture
+    def stations(self):
+        """Create a random but reproducible station catalog around Germany."""
+        rng = random.Random(7)
+        return [
+            make_station(f"S{i}", rng.uniform(47.0, 55.0), rng.uniform(5.5, 15.5))
+            for i in range(500)
+        ]
+
+    @staticmethod
+    def brute_force(stations, lat, lon, k, max_km=None):
+        """Rank all stations by haversine distance."""
+        distances = haversine_km(
+            lat,
+            lon,
+            [s.station.latitude for s in stations],
+            [s.station.longitude for s in stations],
+        )
+        ranked = sorted(zip(distances, range(len(stations)), strict=True))
+        return [
+            stations[i].station.station_id
+            for distance, i in ranked[:k]
+            if max_km is None or distance <= max_km
+        ]
+
+    @pytest.mark.parametrize(
+        "lat,lon", [(52.52, 13.405), (48.14, 11.58), (50.11, 8.68), (40.0, 0.0)]
+    )
+    @pytest.mark.parametrize("k", [1, 5, 20])
+    def test_nearest_matches_brute_force(self, stations, lat, lon, k):
+        """Test that KD-tree results equal a full haversine ranking."""
+        index = StationSpatialIndex(stations)
+
+        result = index.nearest(lat, lon, k=k)
+
+        assert [s.station.station_id for s, _ in result] == self.brute_force(
+            stations, lat, lon, k
+        )
+        distances = [distance for _, distance in result]
+        assert distances == sorted(distances)
+
+    @pytest.mark.parametrize("max_km", [0.0, 10.0, 50.0, 200.0])
+    def test_nearest_within_max_km(self, stations, max_km):
+        """Test that stations farther than max_km are not returned."""
+        index = StationSpatialIndex(stations)
+
+        result = index.nearest(51.0, 10.0, k=50, max_km=max_km)
+
+        assert all(distance <= max_km for _, distance in result)
+        assert [s.station.station_id for s, _ in result] == self.brute_force(
+            stations, 51.0, 10.0, 50, max_km
+        )
+
+    def test_stations_without_coordinates_skipped(self):
+        """Test that stations lacking coordinates are not indexed."""
+        stations = [make_station("A", 52.5, 13.4), make_station("B", None, None)]
+        index = StationSpatialIndex(stations)
+
+        assert len(index) == 1
+        assert [s.station.station_id for s, _ in index.nearest(0.0, 0.0)] == ["A"]
+
+    def test_empty_index(self):
+        """Test that an empty index returns no stations."""
+        assert StationSpatialIndex([]).nearest(52.5, 13.4) == []
+        assert (
+            StationSpatialIndex([make_station("A", 1.0, 1.0)]).nearest(1.0, 1.0, k=0)
+            == []
+        )
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_haversine_km(self, monkeypatch, use_numpy):
+        """Test great-circle distances with and without numpy."""
+        if use_numpy and indexes.np is None:
+            pytest.skip("numpy not installed")
+        if not use_numpy:
+            monkeypatch.setattr(indexes, "np", None)
+
+        # Berlin to Munich is about 504 km
+        distances = haversine_km(52.52, 13.405, [48.1374, 52.52], [11.5755, 13.405])
+
+        assert distances[0] == pytest.approx(504.4, abs=1.0)
+        assert distances[1] == pytest.approx(0.0)
+
+
+class TestCrowdReportGridIndex:
+    """Tests for CrowdReportGridIndex."""
+
+    @pytest.fixture
+    def reports(self):
+        """Create a random but reproducible set of reports around Germany."""
+        rng = random.Random(3)
+        return [
+            make_report(f"R{i}", rng.uniform(47.0, 55.0), rng.uniform(5.5, 15.5))
+            for i in range(500)
+        ]
+
+    @pytest.mark.parametrize(
+        "bbox",
+        [
+            (52.0, 13.0, 53.0, 14.0),
+            (47.27, 8.97, 50.57, 13.84),
+            (-90.0, -180.0, 90.0, 180.0),
+            (50.0, 10.0, 49.0, 11.0),
+            (50.1, 10.1, 50.1, 10.1),
+        ],
+    )
+    @pytest.mark.parametrize("cell_degrees", [0.1, 0.25, 2.0])
+    def test_bbox_matches_linear_scan(self, reports, bbox, cell_degrees):
+        """Test that bounding box queries equal a filter over all reports."""
+        index = CrowdReportGridIndex(reports, cell_degrees=cell_degrees)
+        south, west, north, east = bbox
+
+        expected = [
+            r
+            for r in reports
+            if south <= r.latitude <= north and west <= r.longitude <= east
+        ]
+        assert index.query(bbox=bbox) == expected
+
+    @pytest.mark.parametrize("radius_km", [0.0, 15.0, 80.0, 400.0])
+    def test_radius_matches_linear_scan(self, reports, radius_km):
+        """Test that radius queries equal a haversine filter over all reports."""
+        index = CrowdReportGridIndex(reports)
+        distances = haversine_km(
+            51.0, 10.0, [r.latitude for r in reports], [r.longitude for r in reports]
+        )
+
+        expected = [
+            r for r, d in zip(reports, distances, strict=True) if d <= radius_km
+        ]
+        assert index.query(center=(51.0, 10.0), radius_km=radius_km) == expected
+
+    def test_query_without_filters_returns_all(self, reports):
+        """Test that an unfiltered query returns every report in feed order."""
+        assert CrowdReportGridIndex(reports).query() == reports
+
+    def test_radius_bbox_near_pole(self):
+        """Test that radius boxes around a pole span all longitudes."""
+        assert radius_bbox(89.9, 0.0, 50.0)[1::2] == (-180.0, 180.0)
@@ -0,0 +1,61 @@
+"""Tests for the on-disk response store."""
+
+from dwd_mcp.cache import ResponseCache
+from dwd_mcp.persistence import DiskCache
+
+
+class TestDiskCache:
+    """Tests for DiskCache."""
+
+    def test_save_and_load(self, tmp_path):
+        """Test that stored responses survive reopening the store."""
+        key = ResponseCache.make_key("/warnings_nowcast.json")
+        store = DiskCache(tmp_path / "cache")
+        store.save(key, b'{"warnings": []}', etag='"v1"', fetched_at=100.0)
+        store.close()
+
+        stored = DiskCache(tmp_path / "cache").load(key)
+
+        assert stored.body == b'{"warnings": []}'
+        assert stored.etag == '"v1"'
+        assert stored.last_modified is None
+        assert stored.age(now=130.0) == 30.0
+
+    def test_save_replaces_and_touch_updates(self, tmp_path):
+        """Test that saving replaces a response and touching renews it."""
+        key = ResponseCache.make_key("/warnings_nowcast.json")
+        store = DiskCache(tmp_path)
+        store.save(key, b"[1]", fetched_at=1.0)
+        store.save(key, b"[2]", fetched_at=2.0)
+        store.touch(key, fetched_at=3.0)
+
+        stored = store.load(key)
+        assert stored.body == b"[2]"
+        assert stored.fetched_at == 3.0
+
+    def test_info(self, tmp_path):
+        """Test that validators are read without the body."""
+        key = ResponseCache.make_key("/warnings_nowcast.json")
+        store = DiskCache(tmp_path)
+        assert store.info(key) is None
+
+        store.save(key, b"[1]", etag='"v1"', fetched_at=5.0)
+        assert store.info(key) == ('"v1"', 5.0)
+
+    def test_missing_key_and_lazy_open(self, tmp_path):
+        """Test that the database is only created on first use."""
+        store = DiskCache(tmp_path / "cache")
+        assert not store.path.exists()
+
+        assert store.load(ResponseCache.make_key("/x")) is None
+        assert store.path.exists()
+
+    def test_unusable_database(self, tmp_path, caplog):
+        """Test that storage errors are logged instead of raised."""
+        (tmp_path / "responses.sqlite3").write_bytes(b"not a database" * 100)
+        store = DiskCache(tmp_path)
+        key = ResponseCache.make_key("/x")
+
+        store.save(key, b"[]")
+        assert store.load(key) is None
+        assert "Could not" in caplog.text
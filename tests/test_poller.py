@@ -0,0 +1,259 @@
+"""Tests for the background feed poller."""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from dwd_mcp.cache import ResponseCache
+from dwd_mcp.client import DWDClient
+from dwd_mcp.persistence import DiskCache
+from dwd_mcp.poller import (
+    CROWD_REPORTS_ENDPOINT,
+    WARNINGS_ENDPOINT,
+    FeedPoller,
+    LeaderLock,
+)
+
+
+def make_warning(warning_id: str) -> dict:
+    """Create a raw warning record."""
+    return {
+        "warningId": warning_id,
+        "level": 2,
+        "type": "THUNDER",
+        "headline": "Thunderstorm Warning",
+        "description": "Severe thunderstorms expected",
+        "startTime": "2024-01-15T14:00:00Z",
+        "regions": ["Berlin"],
+    }
+
+
+class TestFeedPoller:
+    """Tests for FeedPoller."""
+
+    @pytest.fixture
+    def upstream(self):
+        """Serve a warnings feed that changes on every request."""
+        state = {"requests": 0, "fail": False}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            state["requests"] += 1
+            if state["fail"]:
+                return httpx.Response(500)
+            if request.url.path == CROWD_REPORTS_ENDPOINT:
+                return httpx.Response(200, json={"reports": []})
+            warning = make_warning(f"W{state['requests']}")
+            return httpx.Response(200, json={"warnings": [warning]})
+
+        state["transport"] = httpx.MockTransport(handler)
+        return state
+
+    async def test_serves_polled_feed_after_expiry(self, upstream):
+        """Test that polled feeds are served from memory past their TTL."""
+        now = [0.0]
+        cache = ResponseCache(ttls={WARNINGS_ENDPOINT: 10.0}, clock=lambda: now[0])
+        async with DWDClient(transport=upstream["transport"], cache=cache) as client:
+            poller = FeedPoller(client, {WARNINGS_ENDPOINT: 3600.0})
+            poller.start()
+            try:
+                await asyncio.sleep(0.01)
+                assert upstream["requests"] == 1
+                assert "region_index" in vars(client.snapshot(WARNINGS_ENDPOINT))
+
+                now[0] = 100.0
+                warnings = await client.get_current_warnings(region="Berlin")
+                assert [w.warning_id for w in warnings] == ["W1"]
+                assert upstream["requests"] == 1
+            finally:
+                await poller.stop()
+
+            assert not poller.running
+            assert client.polled_endpoints == set()
+            await client.get_current_warnings()
+            assert upstream["requests"] == 2
+
+    async def test_swaps_in_new_snapshots(self, upstream):
+        """Test that each poll replaces the cached feed."""
+        async with DWDClient(transport=upstream["transport"]) as client:
+            poller = FeedPoller(
+                client, {WARNINGS_ENDPOINT: 0.01, CROWD_REPORTS_ENDPOINT: 0.01}
+            )
+            poller.start()
+            try:
+                await asyncio.sleep(0.1)
+            finally:
+                await poller.stop()
+
+            warnings = await client.get_current_warnings()
+            assert warnings[0].warning_id != "W1"
+            assert client.fetched_at(CROWD_REPORTS_ENDPOINT) is not None
+
+    async def test_failed_refresh_keeps_previous_snapshot(self, upstream, caplog):
+        """Test that polling continues and old data is served after failures."""
+        async with DWDClient(transport=upstream["transport"]) as client:
+            poller = FeedPoller(client, {WARNINGS_ENDPOINT: 0.01})
+            await poller.refresh(WARNINGS_ENDPOINT)
+
+            upstream["fail"] = True
+            poller.start()
+            try:
+                await asyncio.sleep(0.05)
+                assert poller.running
+                warnings = await client.get_current_warnings()
+                assert [w.warning_id for w in warnings] == ["W1"]
+            finally:
+                await poller.stop()
+
+        assert "Background refresh of /warnings_nowcast.json failed" in caplog.text
+
+    async def test_disabled_and_unknown_endpoints(self):
+        """Test that zero intervals are skipped and unknown feeds rejected."""
+        async with DWDClient() as client:
+            poller = FeedPoller(client, {WARNINGS_ENDPOINT: 0})
+            assert poller.intervals == {}
+
+            with pytest.raises(ValueError, match="/stationOverviewExtended"):
+                FeedPoller(client, {"/stationOverviewExtended": 60.0})
+
+
+class TestLeaderElection:
+    """Tests for polling by one elected process."""
+
+    async def test_follower_loads_leader_responses(self, tmp_path):
+        """Test that only the leader fetches and the follower takes over."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            warning = make_warning(f"W{len(requests)}")
+            return httpx.Response(200, json={"warnings": [warning]})
+
+        transport = httpx.MockTransport(handler)
+        leader_client = DWDClient(transport=transport, disk_cache=DiskCache(tmp_path))
+        follower_client = DWDClient(transport=transport, disk_cache=DiskCache(tmp_path))
+        leader = FeedPoller(
+            leader_client, {WARNINGS_ENDPOINT: 60}, LeaderLock(tmp_path / "lock")
+        )
+        follower = FeedPoller(
+            follower_client, {WARNINGS_ENDPOINT: 60}, LeaderLock(tmp_path / "lock")
+        )
+        try:
+            await leader.refresh(WARNINGS_ENDPOINT)
+            await asyncio.gather(*leader_client._disk_writes)
+            await follower.refresh(WARNINGS_ENDPOINT)
+
+            assert leader.leader_lock.held
+            assert not follower.leader_lock.held
+            assert len(requests) == 1
+            warnings = await follower_client.get_current_warnings()
+            assert [w.warning_id for w in warnings] == ["W1"]
+
+            await leader.stop()
+            await follower.refresh(WARNINGS_ENDPOINT)
+            assert follower.leader_lock.held
+            assert len(requests) == 2
+        finally:
+            await follower.stop()
+            await leader_client.close()
+            await follower_client.close()
+
+
+def lock_holder(path) -> int | None:
+    """Return the ID of the process holding a flock on a file, if any."""
+    inode = os.stat(path).st_ino
+    with open("/proc/locks") as locks:
+        for line in locks:
+            fields = line.split()
+            if fields[1] == "FLOCK" and int(fields[5].split(":")[2]) == inode:
+                return int(fields[4])
+    return None
+
+
+class TestLeaderElectionProcesses:
+    """Tests for leader election among server processes."""
+
+    @pytest.fixture
+    def standin(self):
+        """Serve a warnings feed over real HTTP, recording the client ports."""
+        ports = []
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections open so each process shows up as one port
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                ports.append(self.client_address[1])
+                body = json.dumps({"warnings": [make_warning("W1")]}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_port}", ports
+        server.shutdown()
+
+    async def test_one_process_polls_and_another_takes_over(self, tmp_path, standin):
+        """Test that co-located servers poll through one elected leader."""
+        base_url, ports = standin
+        env = {
+            **os.environ,
+            "DWD_MCP_BASE_URL": base_url,
+            "DWD_MCP_CACHE_DIR": str(tmp_path),
+            "DWD_MCP_POLL_WARNINGS_INTERVAL": "0.05",
+        }
+        processes = {}
+        for _ in range(3):
+            process = subprocess.Popen(
+                [sys.executable, "-c", "from dwd_mcp import main; main()"],
+                env=env,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            processes[process.pid] = process
+        lock_path = tmp_path / "poller.lock"
+
+        async def wait_for_leader(other_than: int | None = None) -> int:
+            while True:
+                holder = lock_holder(lock_path) if lock_path.exists() else None
+                if holder is not None and holder != other_than:
+                    return holder
+                await asyncio.sleep(0.05)
+
+        try:
+            async with asyncio.timeout(30):
+                leader = await wait_for_leader()
+                start = len(ports)
+                while len(ports) < start + 5:
+                    await asyncio.sleep(0.05)
+                # All polls arrive over the leader's single connection
+                assert len(set(ports[start:])) == 1
+
+                processes[leader].terminate()
+                processes[leader].wait()
+                successor = await wait_for_leader(other_than=leader)
+                start = len(ports)
+                while len(ports) < start + 5:
+                    await asyncio.sleep(0.05)
+        finally:
+            for process in processes.values():
+                process.terminate()
+                process.wait(timeout=10)
+
+        assert leader in processes
+        assert successor in processes
+        assert successor != leader
@@ -0,0 +1,52 @@
+"""Tests for the federal state lookup."""
+
+import pytest
+
+from dwd_mcp.models import StationData, StationInfo
+from dwd_mcp.regions import STATES, StationStateIndex, resolve_state
+
+
+class TestRegions:
+    """Tests for the federal state lookup."""
+
+    @pytest.mark.parametrize("name", ["Bayern", "BY", "bavaria", " BAYERN ", "by"])
+    def test_resolve_aliases(self, name):
+        """Test that names, codes and aliases resolve to the same state."""
+        assert resolve_state(name).name == "Bayern"
+
+    def test_resolve_unknown(self):
+        """Test that unknown names resolve to None."""
+        assert resolve_state("Atlantis") is None
+
+    def test_states_complete(self):
+        """Test that all sixteen states have distinct codes and valid boxes."""
+        assert len({state.code for state in STATES}) == 16
+        for state in STATES:
+            south, west, north, east = state.bbox
+            assert 47.0 < south < north < 55.1
+            assert 5.8 < west < east < 15.1
+
+
+class TestStationStateIndex:
+    """Tests for StationStateIndex."""
+
+    @pytest.fixture
+    def index(self):
+        """Create an index over stations with differently spelled states."""
+        states = {"A": "Bayern", "B": "Hessen", "C": "bavaria", "D": None, "E": "Tirol"}
+        return StationStateIndex(
+            [
+                StationData(station=StationInfo(stationId=station_id, state=state))
+                for station_id, state in states.items()
+            ]
+        )
+
+    @pytest.mark.parametrize("region", ["Bayern", "BY", "Bavaria", "bayern "])
+    def test_aliases_share_stations(self, index, region):
+        """Test that all names of a state find the same stations."""
+        assert index.station_ids(region) == ["A", "C"]
+
+    def test_unknown_states(self, index):
+        """Test that states outside the table are matched by normalized name."""
+        assert index.station_ids("TIROL") == ["E"]
+        assert index.station_ids("Atlantis") == []
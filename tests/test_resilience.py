@@ -0,0 +1,104 @@
+"""Tests for the retry and circuit breaker policies."""
+
+from datetime import UTC, datetime
+
+from dwd_mcp.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy and Retry-After parsing."""
+
+    def test_backoff_is_capped_and_jittered(self):
+        """Test that delays stay within the exponential, capped ceiling."""
+        policy = RetryPolicy(max_attempts=10, base_delay=1.0, max_delay=4.0)
+
+        for retry, ceiling in [(0, 1.0), (1, 2.0), (2, 4.0), (5, 4.0)]:
+            delays = {policy.delay(retry) for _ in range(50)}
+            assert all(0 <= d <= ceiling for d in delays)
+            assert len(delays) > 1
+
+    def test_attempts_exhausted(self):
+        """Test that no delay is returned after the last attempt."""
+        policy = RetryPolicy(max_attempts=3)
+
+        assert policy.delay(0) is not None
+        assert policy.delay(1) is not None
+        assert policy.delay(2) is None
+
+    def test_retry_after(self):
+        """Test that Retry-After is honored unless it exceeds the cap."""
+        policy = RetryPolicy(max_delay=10.0)
+
+        assert policy.delay(0, retry_after=3.0) == 3.0
+        assert policy.delay(0, retry_after=60.0) is None
+
+    def test_parse_retry_after(self):
+        """Test parsing of delay-seconds and HTTP-date Retry-After values."""
+        now = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
+
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("Mon, 15 Jan 2024 12:00:30 GMT", now) == 30.0
+        assert parse_retry_after("Mon, 15 Jan 2024 11:00:00 GMT", now) == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=lambda: 0.0)
+
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow()
+
+    def test_success_resets_failures(self):
+        """Test that a success resets the consecutive failure count."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=lambda: 0.0)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_record_status(self):
+        """Test that server errors and 429 count as failures."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=lambda: 0.0)
+
+        breaker.record_status(500)
+        breaker.record_status(404)
+        assert breaker.failures == 0
+        breaker.record_status(429)
+        breaker.record_status(501)
+        assert breaker.state is CircuitState.OPEN
+
+    def test_half_open_trial(self):
+        """Test that one trial is allowed after the reset timeout."""
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=1, reset_timeout=30.0, clock=lambda: now[0]
+        )
+        breaker.record_failure()
+
+        now[0] = 30.0
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        # A failed trial reopens the circuit for another reset timeout
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+
+        now[0] = 60.0
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
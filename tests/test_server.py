@@ -1,12 +1,27 @@
 """Tests for the MCP server."""
 
-from datetime import datetime
-from unittest.mock import AsyncMock, patch
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
+import uvicorn
+from mcp import ClientSession
+from mcp.client.streamable_http import streamable_http_client
 
+from dwd_mcp.cache import ResponseCache
+from dwd_mcp.client import DWDClient
 from dwd_mcp.models import CrowdReport, StationData, StationInfo, WarningInfo
-from dwd_mcp.server import handle_call_tool, handle_list_resources, handle_list_tools
+from dwd_mcp.regions import UnknownRegionError
+from dwd_mcp.server import (
+    create_http_app,
+    format_freshness,
+    handle_call_tool,
+    handle_list_resources,
+    handle_list_tools,
+    handle_read_resource,
+)
 
 
 class TestMCPServer:
@@ -60,12 +75,13 @@ class TestMCPServer:
         """Test that list_tools returns expected tools."""
         tools = await handle_list_tools()
 
-        assert len(tools) == 3
+        assert len(tools) == 4
 
         tool_names = [tool.name for tool in tools]
         assert "get_weather_stations" in tool_names
         assert "get_current_warnings" in tool_names
         assert "get_crowd_reports" in tool_names
+        assert "find_nearest_stations" in tool_names
 
         # Check specific tool properties
         station_tool = next(
@@ -80,6 +96,11 @@ class TestMCPServer:
         assert "region" in warning_tool.inputSchema["properties"]
         assert "severity" in warning_tool.inputSchema["properties"]
 
+        nearest_tool = next(
+            tool for tool in tools if tool.name == "find_nearest_stations"
+        )
+        assert nearest_tool.inputSchema["required"] == ["lat", "lon"]
+
     async def test_list_resources(self):
         """Test that list_resources returns expected resources."""
         resources = await handle_list_resources()
@@ -123,6 +144,82 @@ class TestMCPServer:
         assert len(result) == 1
         assert "No weather stations found" in result[0].text
 
+    @patch("dwd_mcp.server.dwd_client")
+    async def test_get_weather_stations_freshness(self, mock_client, sample_station):
+        """Test that the age of the oldest returned station is rendered."""
+        mock_client.get_weather_stations = AsyncMock(return_value=[sample_station])
+        mock_client.stations_fetched_at = Mock(
+            return_value=datetime(2024, 1, 15, 12, 30, tzinfo=UTC)
+        )
+
+        result = await handle_call_tool("get_weather_stations", {})
+
+        assert "*Data as of 2024-01-15T12:30:00+00:00 (" in result[0].text
+        mock_client.stations_fetched_at.assert_called_once_with(
+            [sample_station.station.station_id]
+        )
+
+    @patch("dwd_mcp.server.dwd_client")
+    async def test_get_weather_stations_unknown_region(self, mock_client):
+        """Test that unknown regions are reported as for crowd reports."""
+        mock_client.get_weather_stations = AsyncMock(
+            side_effect=UnknownRegionError("Unknown region: Atlantis")
+        )
+
+        result = await handle_call_tool("get_weather_stations", {"region": "Atlantis"})
+
+        assert "Invalid arguments: Unknown region: Atlantis" in result[0].text
+
+    @patch("dwd_mcp.server.dwd_client")
+    async def test_get_weather_stations_partial_results(
+        self, mock_client, sample_station
+    ):
+        """Test that partially fetched stations are rendered with a note."""
+        from dwd_mcp.client import PartialFetchError
+
+        mock_client.get_weather_stations = AsyncMock(
+            side_effect=PartialFetchError(
+                "partial", results=[sample_station], failed_ids=["10382"]
+            )
+        )
+
+        result = await handle_call_tool(
+            "get_weather_stations", {"station_ids": ["10637", "10382"]}
+        )
+
+        content = result[0].text
+        assert "Frankfurt am Main" in content
+        assert "Could not fetch stations 10382" in content
+
+    @patch("dwd_mcp.server.dwd_client")
+    async def test_find_nearest_stations_tool(self, mock_client, sample_station):
+        """Test the find_nearest_stations tool."""
+        mock_client.find_nearest_stations = AsyncMock(
+            return_value=[(sample_station, 12.345)]
+        )
+
+        result = await handle_call_tool(
+            "find_nearest_stations", {"lat": 50.0, "lon": 8.5, "max_km": 50}
+        )
+
+        content = result[0].text
+        assert "Frankfurt am Main" in content
+        assert "12.3 km" in content
+        mock_client.find_nearest_stations.assert_called_once_with(
+            50.0, 8.5, k=5, max_km=50
+        )
+
+    @patch("dwd_mcp.server.dwd_client")
+    async def test_find_nearest_stations_no_results(self, mock_client):
+        """Test find_nearest_stations tool with no stations in range."""
+        mock_client.find_nearest_stations = AsyncMock(return_value=[])
+
+        result = await handle_call_tool(
+            "find_nearest_stations", {"lat": 0.0, "lon": 0.0, "max_km": 1}
+        )
+
+        assert "No weather stations found" in result[0].text
+
     @patch("dwd_mcp.server.dwd_client")
     async def test_get_current_warnings_tool(self, mock_client, sample_warning):
         """Test the get_current_warnings tool."""
@@ -145,6 +242,32 @@ class TestMCPServer:
             region="Berlin", severity=2
         )
 
+    @patch("dwd_mcp.server.dwd_client")
+    async def test_get_current_warnings_freshness(self, mock_client, sample_warning):
+        """Test that the time the feed was fetched is rendered."""
+        mock_client.get_current_warnings = AsyncMock(return_value=[sample_warning])
+        mock_client.fetched_at = Mock(
+            return_value=datetime(2024, 1, 15, 12, 30, tzinfo=UTC)
+        )
+
+        result = await handle_call_tool("get_current_warnings", {})
+
+        assert "*Data as of 2024-01-15T12:30:00+00:00 (" in result[0].text
+        mock_client.fetched_at.assert_called_once_with("/warnings_nowcast.json")
+
+    def test_format_freshness(self):
+        """Test that the fetch time is rendered with the age of the data."""
+        fetched_at = datetime(2024, 1, 15, 12, 30, tzinfo=UTC)
+
+        def render(seconds):
+            now = fetched_at + timedelta(seconds=seconds)
+            return format_freshness(fetched_at, now)[0]
+
+        assert render(42) == "*Data as of 2024-01-15T12:30:00+00:00 (42s old)*\n"
+        assert "(2m 5s old)" in render(125)
+        assert "(3h 20m old)" in render(12000)
+        assert format_freshness(None) == []
+
     @patch("dwd_mcp.server.dwd_client")
     async def test_get_current_warnings_no_results(self, mock_client):
         """Test get_current_warnings tool with no results."""
@@ -172,7 +295,36 @@ class TestMCPServer:
         assert "sunny" in content
         assert "22.5°C" in content
 
-        mock_client.get_crowd_reports.assert_called_once_with(region="Berlin")
+        mock_client.get_crowd_reports.assert_called_once_with(
+            region="Berlin", bbox=None, lat=None, lon=None, radius_km=None
+        )
+
+    @patch("dwd_mcp.server.dwd_client")
+    async def test_get_crowd_reports_area_arguments(
+        self, mock_client, sample_crowd_report
+    ):
+        """Test that bounding box and radius filters are passed through."""
+        mock_client.get_crowd_reports = AsyncMock(return_value=[sample_crowd_report])
+
+        await handle_call_tool(
+            "get_crowd_reports",
+            {"bbox": [52, 13, 53, 14], "lat": 52.5, "lon": 13.4, "radius_km": 10},
+        )
+
+        mock_client.get_crowd_reports.assert_called_once_with(
+            region=None, bbox=(52, 13, 53, 14), lat=52.5, lon=13.4, radius_km=10
+        )
+
+    @patch("dwd_mcp.server.dwd_client")
+    async def test_get_crowd_reports_unknown_region(self, mock_client):
+        """Test that invalid filter arguments are reported."""
+        mock_client.get_crowd_reports = AsyncMock(
+            side_effect=ValueError("Unknown region: Atlantis")
+        )
+
+        result = await handle_call_tool("get_crowd_reports", {"region": "Atlantis"})
+
+        assert "Invalid arguments: Unknown region: Atlantis" in result[0].text
 
     @patch("dwd_mcp.server.dwd_client")
     async def test_get_crowd_reports_no_results(self, mock_client):
@@ -216,3 +368,69 @@ class TestMCPServer:
 
         assert len(result) == 1
         assert "Unexpected error: Unexpected error" in result[0].text
+
+    async def test_resource_rendered_once_per_snapshot(self, sample_warning):
+        """Test that resources are rendered again only for new feed data."""
+        now = [0.0]
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            warning = sample_warning.model_dump(mode="json", by_alias=True)
+            warning["warningId"] = f"W{len(requests)}"
+            return httpx.Response(200, json={"warnings": [warning]})
+
+        cache = ResponseCache(
+            ttls={"/warnings_nowcast.json": 10.0}, clock=lambda: now[0]
+        )
+        async with DWDClient(
+            transport=httpx.MockTransport(handler), cache=cache
+        ) as client:
+            with patch("dwd_mcp.server.dwd_client", client):
+                first = await handle_read_resource("weather://warnings/current")
+                again = await handle_read_resource("weather://warnings/current")
+                now[0] = 11.0
+                changed = await handle_read_resource("weather://warnings/current")
+
+        assert '"W1"' in first
+        assert again is first
+        assert '"W2"' in changed
+
+
+class TestHTTPTransport:
+    """Tests for serving MCP over streamable HTTP."""
+
+    @pytest.fixture
+    async def http_url(self):
+        """Run the HTTP app on a free local port."""
+        server = uvicorn.Server(
+            uvicorn.Config(
+                create_http_app(), host="127.0.0.1", port=0, log_level="error"
+            )
+        )
+        task = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        port = server.servers[0].sockets[0].getsockname()[1]
+        yield f"http://127.0.0.1:{port}/mcp/"
+        server.should_exit = True
+        await task
+
+    @patch("dwd_mcp.server.dwd_client")
+    async def test_concurrent_sessions_share_client(self, mock_client, http_url):
+        """Test that several HTTP sessions are served by one DWD client."""
+        mock_client.get_current_warnings = AsyncMock(return_value=[])
+
+        async def session() -> str:
+            async with streamable_http_client(http_url) as (read, write, _):
+                async with ClientSession(read, write) as client:
+                    await client.initialize()
+                    tools = await client.list_tools()
+                    assert len(tools.tools) == 4
+                    result = await client.call_tool("get_current_warnings", {})
+                    return result.content[0].text
+
+        results = await asyncio.gather(*(session() for _ in range(3)))
+
+        assert results == ["No weather warnings found."] * 3
+        assert mock_client.get_current_warnings.await_count == 3
@@ -0,0 +1,181 @@
+"""Tests for snapshots shared between processes."""
+
+import time
+from unittest.mock import patch
+
+import httpx
+
+from dwd_mcp.client import DWDClient
+from dwd_mcp.models import WarningInfo
+from dwd_mcp.shared import SharedEntry, SharedSnapshot, write_snapshot
+
+WARNING = {
+    "warningId": "W1",
+    "level": 3,
+    "type": "THUNDER",
+    "headline": "Thunderstorm Warning",
+    "description": "Severe thunderstorms expected",
+    "startTime": "2024-01-15T14:00:00Z",
+    "regions": ["Berlin"],
+}
+
+
+def make_entry(version: int, warning_id: str = "W1") -> SharedEntry:
+    """Create a published warnings feed."""
+    record = {**WARNING, "warningId": warning_id}
+    return SharedEntry(
+        version=version,
+        models=[WarningInfo.model_validate(record)],
+        etag='"v1"',
+        fetched_at=time.time() - 30,
+    )
+
+
+class TestSharedSnapshot:
+    """Tests for write_snapshot and SharedSnapshot."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that published feeds are read back with their metadata."""
+        path = tmp_path / "snapshot"
+        write_snapshot(path, {"/warnings_nowcast.json": make_entry(1)})
+
+        snapshot = SharedSnapshot(path)
+        try:
+            assert snapshot.version("/warnings_nowcast.json") == 1
+            assert snapshot.version("/stationOverviewExtended") is None
+
+            entry = snapshot.load("/warnings_nowcast.json")
+            assert entry.models[0].warning_id == "W1"
+            assert entry.etag == '"v1"'
+            assert 29 < entry.age() < 40
+        finally:
+            snapshot.close()
+
+    def test_replacement_is_picked_up(self, tmp_path):
+        """Test that a reader switches to a newly published file."""
+        path = tmp_path / "snapshot"
+        snapshot = SharedSnapshot(path)
+        try:
+            assert snapshot.load("/warnings_nowcast.json") is None
+
+            write_snapshot(path, {"/warnings_nowcast.json": make_entry(1)})
+            assert snapshot.version("/warnings_nowcast.json") == 1
+
+            write_snapshot(path, {"/warnings_nowcast.json": make_entry(2, "W2")})
+            entry = snapshot.load("/warnings_nowcast.json")
+            assert entry.version == 2
+            assert entry.models[0].warning_id == "W2"
+        finally:
+            snapshot.close()
+
+    def test_info_skips_models(self, tmp_path):
+        """Test that metadata is read without loading the models."""
+        path = tmp_path / "snapshot"
+        write_snapshot(path, {"/warnings_nowcast.json": make_entry(1)})
+
+        snapshot = SharedSnapshot(path)
+        try:
+            with patch("dwd_mcp.shared.pickle.loads", side_effect=AssertionError):
+                info = snapshot.info("/warnings_nowcast.json")
+            assert info.version == 1
+            assert info.models is None
+            assert 29 < info.age() < 40
+        finally:
+            snapshot.close()
+
+    def test_cached_blobs_are_reused(self, tmp_path):
+        """Test that a feed's models are pickled once per version."""
+        path = tmp_path / "snapshot"
+        blobs = {}
+        write_snapshot(path, {"/warnings_nowcast.json": make_entry(1)}, blobs)
+        assert list(blobs) == [("/warnings_nowcast.json", 1)]
+
+        with patch("dwd_mcp.shared.pickle.dumps", side_effect=AssertionError):
+            write_snapshot(path, {"/warnings_nowcast.json": make_entry(1)}, blobs)
+
+    def test_malformed_file(self, tmp_path, caplog):
+        """Test that an unreadable file is treated as an empty snapshot."""
+        path = tmp_path / "snapshot"
+        path.write_bytes(b"garbage that is not a snapshot")
+
+        snapshot = SharedSnapshot(path)
+        assert snapshot.version("/warnings_nowcast.json") is None
+        assert "Could not read snapshot" in caplog.text
+
+
+class TestClientSharedSnapshot:
+    """Tests for serving feeds published by a leader."""
+
+    @staticmethod
+    def failing_transport() -> httpx.MockTransport:
+        """Return a transport that fails every request."""
+        return httpx.MockTransport(lambda request: httpx.Response(500))
+
+    async def test_published_feed_is_served_without_validation(self, tmp_path):
+        """Test that published models are used as they are."""
+        path = tmp_path / "snapshot"
+        write_snapshot(path, {"/warnings_nowcast.json": make_entry(1)})
+
+        async with DWDClient(
+            transport=self.failing_transport(), shared_snapshot=SharedSnapshot(path)
+        ) as client:
+            with patch.object(DWDClient, "_parse_warnings", side_effect=AssertionError):
+                warnings = await client.get_current_warnings(region="Berlin")
+
+            assert [w.warning_id for w in warnings] == ["W1"]
+            assert "/warnings_nowcast.json" in client.polled_endpoints
+            age = time.time() - client.fetched_at("/warnings_nowcast.json").timestamp()
+            assert 29 < age < 40
+
+    async def test_new_version_replaces_cached_feed(self, tmp_path):
+        """Test that a newly published version is served on the next request."""
+        path = tmp_path / "snapshot"
+        write_snapshot(path, {"/warnings_nowcast.json": make_entry(1)})
+
+        async with DWDClient(
+            transport=self.failing_transport(), shared_snapshot=SharedSnapshot(path)
+        ) as client:
+            first = await client.get_current_warnings()
+            write_snapshot(path, {"/warnings_nowcast.json": make_entry(2, "W2")})
+            second = await client.get_current_warnings()
+
+        assert [w.warning_id for w in first] == ["W1"]
+        assert [w.warning_id for w in second] == ["W2"]
+
+    async def test_revalidated_feed_keeps_snapshot(self, tmp_path):
+        """Test that a new fetch time of the same version only renews the age."""
+        path = tmp_path / "snapshot"
+        write_snapshot(path, {"/warnings_nowcast.json": make_entry(1)})
+
+        async with DWDClient(
+            transport=self.failing_transport(), shared_snapshot=SharedSnapshot(path)
+        ) as client:
+            await client.get_current_warnings()
+            before = client.snapshot("/warnings_nowcast.json")
+
+            entry = make_entry(1)
+            entry.fetched_at = time.time()
+            write_snapshot(path, {"/warnings_nowcast.json": entry})
+            with patch.object(SharedSnapshot, "load", side_effect=AssertionError):
+                warnings = await client.get_current_warnings()
+
+            assert [w.warning_id for w in warnings] == ["W1"]
+            assert client.snapshot("/warnings_nowcast.json") is before
+            age = time.time() - client.fetched_at("/warnings_nowcast.json").timestamp()
+            assert age < 5
+
+    async def test_unpublished_feed_is_fetched(self, tmp_path):
+        """Test that feeds missing from the snapshot are fetched directly."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"reports": []})
+
+        async with DWDClient(
+            transport=httpx.MockTransport(handler),
+            shared_snapshot=SharedSnapshot(tmp_path / "snapshot"),
+        ) as client:
+            assert await client.get_crowd_reports() == []
+
+        assert len(requests) == 1
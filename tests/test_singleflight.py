@@ -0,0 +1,82 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from dwd_mcp.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    async def test_concurrent_calls_share_result(self):
+        """Test that concurrent callers for one key share a single call."""
+        group = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        waiters = [asyncio.create_task(group.do("key", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["result"] * 5
+        assert calls == 1
+        assert group.shared == 4
+        assert "key" not in group
+
+    async def test_error_propagates_to_all_waiters(self):
+        """Test that a failing call raises in every waiter."""
+        group = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            await release.wait()
+            raise ValueError("upstream down")
+
+        waiters = [asyncio.create_task(group.do("key", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+        assert len(group) == 0
+
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        """Test that cancelling one waiter leaves the shared call running."""
+        group = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(group.do("key", fetch))
+        second = asyncio.create_task(group.do("key", fetch))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        release.set()
+        assert await second == "result"
+
+    async def test_finished_call_is_not_reused(self):
+        """Test that a call is only shared while it is in flight."""
+        group = SingleFlight()
+        calls = 0
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await group.do("key", fetch) == 1
+        assert await group.do("key", fetch) == 2
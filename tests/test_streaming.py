@@ -0,0 +1,104 @@
+"""Tests for incremental JSON parsing."""
+
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+
+from dwd_mcp.streaming import iter_json_items
+
+
+async def chunked(data: bytes, size: int) -> AsyncIterator[bytes]:
+    """Yield ``data`` in chunks of ``size`` bytes."""
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+async def collect(data: bytes, size: int = 1, **kwargs) -> list:
+    """Parse ``data`` fed in chunks and return all items."""
+    return [item async for item in iter_json_items(chunked(data, size), **kwargs)]
+
+
+class TestIterJsonItems:
+    """Tests for iter_json_items."""
+
+    ITEMS = [
+        {"stationId": "10637", "lat": 50.1109, "nested": {"a": [1, 2, {"b": None}]}},
+        {"text": 'Brackets ] } [ { and "quotes" \\\\ inside', "n": -12.5e3},
+        {"umlaut": "Böen über München ☂", "flag": True},
+        12345,
+        "plain string",
+        [],
+    ]
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 64, 100_000])
+    async def test_top_level_array(self, size):
+        """Test that array items are yielded regardless of chunk boundaries."""
+        data = json.dumps(self.ITEMS, ensure_ascii=False).encode()
+
+        assert await collect(data, size) == self.ITEMS
+
+    @pytest.mark.parametrize("size", [1, 5, 100_000])
+    async def test_array_under_key(self, size):
+        """Test that the item array is found inside a wrapping object."""
+        document = {"meta": {"count": 2}, "warnings": self.ITEMS, "after": [1]}
+        data = json.dumps(document, indent=2).encode()
+
+        items = await collect(data, size, item_keys=("warnings",))
+
+        assert items == self.ITEMS
+
+    async def test_object_without_item_key(self):
+        """Test that objects without the item key are optionally one item."""
+        data = json.dumps({"stationId": "10637", "list": [1, 2]}).encode()
+
+        assert await collect(data, item_keys=("stations",)) == []
+        assert await collect(data, item_keys=("stations",), single_object=True) == [
+            {"stationId": "10637", "list": [1, 2]}
+        ]
+
+    async def test_empty_documents(self):
+        """Test that empty arrays and objects yield nothing."""
+        assert await collect(b" [ ] ") == []
+        assert await collect(b'{"warnings": []}', item_keys=("warnings",)) == []
+        assert await collect(b"{}", item_keys=("warnings",)) == []
+
+    @pytest.mark.parametrize(
+        "data", [b'[{"a": 1}, {"b": ', b'[{"a": 1} {"b": 2}]', b"", b"[1, 2"]
+    )
+    async def test_malformed_documents(self, data):
+        """Test that truncated or invalid documents raise."""
+        with pytest.raises(json.JSONDecodeError):
+            await collect(data, size=3)
+
+    @pytest.mark.parametrize(
+        ("chunks", "expected"),
+        [
+            ([b"[1e", b"3]"], [1000.0]),
+            ([b"[1.5E-", b"3, 2]"], [0.0015, 2]),
+            ([b"[-1", b".", b"25]"], [-1.25]),
+            ([b'{"time": 1.5e', b'3, "warnings": [1]}'], [1]),
+        ],
+    )
+    async def test_numbers_split_at_chunk_boundary(self, chunks, expected):
+        """Test that numbers are complete before they are accepted."""
+
+        async def feed() -> AsyncIterator[bytes]:
+            for chunk in chunks:
+                yield chunk
+
+        items = iter_json_items(feed(), item_keys=("warnings",))
+        assert [item async for item in items] == expected
+
+    async def test_items_are_yielded_incrementally(self):
+        """Test that an item is available before the rest is received."""
+        received = []
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for chunk in (b'[{"a": 1}, ', b'{"b": 2}', b"]"):
+                received.append(chunk)
+                yield chunk
+
+        items = iter_json_items(chunks())
+        assert await anext(items) == {"a": 1}
+        assert received == [b'[{"a": 1}, ']
@@ -0,0 +1,160 @@
+"""Tests for the multi-worker HTTP mode."""
+
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from mcp import ClientSession
+from mcp.client.streamable_http import streamable_http_client
+
+from dwd_mcp.client import DWDClient
+from dwd_mcp.shared import SharedSnapshot
+from dwd_mcp.workers import SnapshotPublisher
+
+WARNINGS = {
+    "warnings": [
+        {
+            "warningId": "W1",
+            "level": 3,
+            "type": "THUNDER",
+            "headline": "Thunderstorm Warning",
+            "description": "Severe thunderstorms expected",
+            "startTime": "2024-01-15T14:00:00Z",
+            "regions": ["Berlin"],
+        }
+    ]
+}
+STATIONS = [{"stationId": "10382", "lat": 52.47, "lon": 13.40, "state": "Berlin"}]
+
+FEEDS = {
+    "/warnings_nowcast.json": WARNINGS,
+    "/crowd_meldungen_overview_v2.json": {"reports": []},
+    "/stationOverviewExtended": STATIONS,
+}
+
+
+class TestSnapshotPublisher:
+    """Tests for SnapshotPublisher."""
+
+    async def test_publishes_only_changes(self, tmp_path):
+        """Test that only changed data publishes a new version of a feed."""
+        requests = []
+        feeds = dict(FEEDS)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            return httpx.Response(200, json=feeds[request.url.path])
+
+        path = tmp_path / "snapshot"
+        async with DWDClient(transport=httpx.MockTransport(handler)) as client:
+            publisher = SnapshotPublisher(client, path)
+            assert await publisher.publish() is True
+            assert await publisher.publish() is False
+
+            # The same body again only renews the fetch time
+            await client.refresh("/warnings_nowcast.json")
+            assert await publisher.publish() is True
+            assert publisher.entries["/warnings_nowcast.json"].version == 1
+
+            feeds["/warnings_nowcast.json"] = {"warnings": []}
+            await client.refresh("/warnings_nowcast.json")
+            assert await publisher.publish() is True
+
+        assert sorted(set(requests)) == sorted(FEEDS)
+        snapshot = SharedSnapshot(path)
+        try:
+            assert snapshot.version("/warnings_nowcast.json") == 2
+            assert snapshot.load("/warnings_nowcast.json").models == []
+            assert snapshot.version("/stationOverviewExtended") == 1
+            stations = snapshot.load("/stationOverviewExtended").models
+            assert stations[0].station.station_id == "10382"
+        finally:
+            snapshot.close()
+
+    async def test_unknown_endpoint(self, tmp_path):
+        """Test that only known feeds can be published."""
+        async with DWDClient() as client:
+            with pytest.raises(ValueError, match="/unknown"):
+                SnapshotPublisher(
+                    client, tmp_path / "snapshot", endpoints=("/unknown",)
+                )
+
+
+class TestServeWorkers:
+    """Tests for serving HTTP from forked worker processes."""
+
+    @pytest.fixture
+    def standin(self):
+        """Serve the feeds over real HTTP from a thread, counting requests."""
+        hits = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                hits.append(path)
+                body = json.dumps(FEEDS[path]).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_port}", hits
+        server.shutdown()
+
+    async def test_workers_serve_leader_snapshot(self, standin):
+        """Test that workers answer from the leader's fetch of a feed."""
+        base_url, hits = standin
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        process = subprocess.Popen(
+            [sys.executable, "-c", "from dwd_mcp import main; main()"],
+            env={
+                **os.environ,
+                "DWD_MCP_BASE_URL": base_url,
+                "DWD_MCP_TRANSPORT": "http",
+                "DWD_MCP_HTTP_PORT": str(port),
+                "DWD_MCP_HTTP_WORKERS": "2",
+                "DWD_MCP_SNAPSHOT_INTERVAL": "0.1",
+            },
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            async with asyncio.timeout(20):
+                while len(set(hits)) < len(FEEDS):
+                    await asyncio.sleep(0.05)
+                # Give the leader time to write the snapshot
+                await asyncio.sleep(0.5)
+
+                async def call() -> str:
+                    url = f"http://127.0.0.1:{port}/mcp/"
+                    async with streamable_http_client(url) as (read, write, _):
+                        async with ClientSession(read, write) as session:
+                            await session.initialize()
+                            result = await session.call_tool(
+                                "get_current_warnings", {"region": "Berlin"}
+                            )
+                            return result.content[0].text
+
+                results = await asyncio.gather(*(call() for _ in range(6)))
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+        assert all("Thunderstorm Warning" in text for text in results)
+        assert hits.count("/warnings_nowcast.json") == 1